@@ -0,0 +1,35 @@
+"""feeds refresh index
+
+Revision ID: 7b3e91c4d2a6
+Revises: 2c8c7fe8873e
+Create Date: 2026-10-17 09:12:04.518237+00:00
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "7b3e91c4d2a6"
+down_revision: str | Sequence[str] | None = "2c8c7fe8873e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index the feeds eligible for the scheduled refresh cycle."""
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_feeds_refresh
+            ON content.feeds(id)
+            WHERE is_active = true AND error_count < 3;
+        """)
+
+
+def downgrade() -> None:
+    """Drop the refresh index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS content.idx_content_feeds_refresh;"
+        )
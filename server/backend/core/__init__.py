@@ -12,7 +12,7 @@ from .lifecycle import (
     lifespan_shutdown,
     shutdown_event,
 )
-from .logging import setup_logging
+from .logging import setup_logging, shutdown_logging
 
 __all__ = [
     "AccessDeniedError",
@@ -26,4 +26,5 @@ __all__ = [
     "lifespan_shutdown",
     "setup_logging",
     "shutdown_event",
+    "shutdown_logging",
 ]
@@ -41,6 +41,15 @@ class Settings(BaseSettings):
         description="PostgreSQL connection URL",
     )
 
+    database_pool_size: int = Field(
+        default=10,
+        description="Persistent connections kept in the database pool",
+    )
+    database_max_overflow: int = Field(
+        default=20,
+        description="Extra database connections allowed under burst load",
+    )
+
     environment: str = Field(default="production")
 
     @property
@@ -1,6 +1,8 @@
 import urllib.parse
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -36,14 +38,22 @@ def get_database_url() -> str:
     )
 
 
+# orjson serializes JSON/JSONB columns such as articles.platform_metadata
+# several times faster than the stdlib json SQLAlchemy uses by default.
+def _json_serializer(obj: Any) -> str:
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_async_engine(
     get_database_url(),
     echo=settings.environment == "development",
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
     pool_timeout=30,
     pool_recycle=3600,
     pool_pre_ping=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     connect_args={
         "server_settings": {
             "application_name": "glanced_backend",
@@ -52,6 +52,28 @@ async def graceful_shutdown() -> None:
     except Exception as e:
         logger.exception("Error closing Redis connection", error=str(e))
 
+    try:
+        logger.info("Closing feed HTTP client...")
+        from ..infrastructure.feed.processing.feed_processor import (
+            FeedProcessor,
+        )
+
+        await FeedProcessor.close_http_client()
+        logger.info("Feed HTTP client closed")
+    except Exception as e:
+        logger.exception("Error closing feed HTTP client", error=str(e))
+
+    try:
+        logger.info("Stopping HTML sanitizer processes...")
+        from ..infrastructure.parsers import shutdown_html_process_pool
+
+        shutdown_html_process_pool()
+        logger.info("HTML sanitizer processes stopped")
+    except Exception as e:
+        logger.exception(
+            "Error stopping HTML sanitizer processes", error=str(e)
+        )
+
     try:
         logger.info("Closing database connections...")
         from .database import engine
@@ -157,3 +179,7 @@ async def lifespan_shutdown() -> None:
         logger = structlog.get_logger()
     logger.info("Initiating graceful shutdown via lifespan...")
     await graceful_shutdown()
+
+    from .logging import shutdown_logging
+
+    shutdown_logging()
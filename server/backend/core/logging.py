@@ -1,9 +1,31 @@
 import logging
 import logging.handlers
 import os
+import queue
+import sys
+from typing import Any
 
+import orjson
 import structlog
 
+_queue_handler: logging.handlers.QueueHandler | None = None
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+class _StructlogQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched so rendering happens on the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The base implementation formats the message on the calling thread
+        # and would flatten structlog's event dict into a string.
+        return record
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
 
 def setup_logging(
     log_level: str | None = None,
@@ -21,32 +43,92 @@ def setup_logging(
     renderer = (
         structlog.dev.ConsoleRenderer(colors=True)
         if log_format == "text"
-        else structlog.processors.JSONRenderer()
+        else structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     )
+    level = logging.getLevelNamesMapping().get(log_level, logging.INFO)
 
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            renderer,
+            # Rendering is deferred to the handlers on the listener thread.
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the configured level become no-ops before any
+        # processor runs; output still goes through stdlib for file logging.
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_build_formatter(renderer))
+    handlers: list[logging.Handler] = [stream_handler]
+
     if os.getenv("ENABLE_LOG_CLEANUP", "true").lower() == "true":
-        _setup_file_logging(log_level)
+        file_handler = _setup_file_logging(renderer)
+        if file_handler is not None:
+            handlers.append(file_handler)
+
+    _start_queue_listener(handlers, level)
+
+
+def _build_formatter(
+    renderer: structlog.types.Processor, fmt: str | None = None
+) -> structlog.stdlib.ProcessorFormatter:
+    return structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            renderer,
+        ],
+        foreign_pre_chain=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+        ],
+        fmt=fmt,
+    )
 
 
-def _setup_file_logging(log_level: str) -> None:
+def _start_queue_listener(handlers: list[logging.Handler], level: int) -> None:
+    global _queue_handler, _queue_listener
+
+    shutdown_logging()
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _StructlogQueueHandler(log_queue)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_queue_handler)
+    root_logger.setLevel(level)
+    _queue_listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the logging listener thread."""
+    global _queue_handler, _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+
+def _setup_file_logging(
+    renderer: structlog.types.Processor,
+) -> logging.Handler | None:
     max_log_size_mb = int(os.getenv("MAX_LOG_SIZE_MB", "10"))
     max_log_size_bytes = max_log_size_mb * 1024 * 1024
 
@@ -73,22 +155,13 @@ def _setup_file_logging(log_level: str) -> None:
         )
 
         file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            _build_formatter(
+                renderer,
+                fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             )
         )
-
-        root_logger = logging.getLogger()
-        root_logger.addHandler(file_handler)
-
-        log_levels = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL,
-        }
-        root_logger.setLevel(log_levels.get(log_level, logging.INFO))
+        return file_handler
 
     except Exception as e:
         print(f"Warning: Could not set up file logging: {e}")
+        return None
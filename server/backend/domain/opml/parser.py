@@ -1,5 +1,6 @@
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
@@ -42,6 +43,7 @@ class OpmlParser:
     MAX_DEPTH = 9
     ENCODINGS = ["utf-8", "windows-1252", "iso-8859-1", "utf-16"]
     VALID_SCHEMES = {"http", "https"}
+    PARSE_CHUNK_SIZE = 64 * 1024
 
     @classmethod
     def detect_encoding(cls, content: bytes) -> tuple[str, str]:
@@ -105,64 +107,72 @@ class OpmlParser:
     def parse_feeds_with_folders(
         cls, content: str, max_depth: int = MAX_DEPTH
     ) -> list[OpmlFeed]:
+        return list(cls.iter_feeds_with_folders(content, max_depth))
+
+    @classmethod
+    def iter_feeds_with_folders(
+        cls, content: str, max_depth: int = MAX_DEPTH
+    ) -> Iterator[OpmlFeed]:
         content = (
             content.split("?>", 1)[-1] if "?>" in content[:100] else content
         )
+        document = f"<root>{content}</root>"
+
+        parser = ET.XMLPullParser(events=("start", "end"))
+        open_elements: list[ET.Element] = []
 
         try:
-            root = ET.fromstring(f"<root>{content}</root>")
+            for offset in range(0, len(document), cls.PARSE_CHUNK_SIZE):
+                parser.feed(document[offset : offset + cls.PARSE_CHUNK_SIZE])
+                yield from cls._drain_events(parser, open_elements, max_depth)
+            parser.close()
+            yield from cls._drain_events(parser, open_elements, max_depth)
         except ET.ParseError as e:
             raise ValueError(f"Invalid XML structure: {e!s}") from e
 
-        feeds: list[OpmlFeed] = []
-
-        for outline in root.findall(".//outline[@xmlUrl]"):
-            url = outline.get("xmlUrl")
-            if not url:
-                continue
-
-            title = (
-                outline.get("title")
-                or outline.get("text")
-                or outline.get("title")
-            )
-            html_url = outline.get("htmlUrl")
-            description = outline.get("description")
-
-            folder_path: list[str] = []
-            current = outline
-            depth = 0
-
-            while (
-                parent := cls._find_parent_outline(root, current)
-            ) is not None:
-                parent_title = parent.get("title") or parent.get("text")
-                if parent_title:
-                    folder_path.insert(0, parent_title)
-                    depth += 1
-                    if depth >= max_depth:
-                        break
-                current = parent
-
-            feed = OpmlFeed(
-                title=title,
-                url=url,
-                html_url=html_url,
-                folder_path=folder_path,
-                description=description,
-            )
-            feeds.append(feed)
-
-        return feeds
+    @classmethod
+    def _drain_events(
+        cls,
+        parser: ET.XMLPullParser,
+        open_elements: list[ET.Element],
+        max_depth: int,
+    ) -> Iterator[OpmlFeed]:
+        for event, element in parser.read_events():
+            if event == "start":
+                if element.tag == "outline" and (url := element.get("xmlUrl")):
+                    yield OpmlFeed(
+                        title=element.get("title") or element.get("text"),
+                        url=url,
+                        html_url=element.get("htmlUrl"),
+                        folder_path=cls._folder_path(open_elements, max_depth),
+                        description=element.get("description"),
+                    )
+                open_elements.append(element)
+            else:
+                # Finished elements are dropped so the tree never grows
+                # beyond the currently open outlines.
+                open_elements.pop()
+                element.clear()
+                if open_elements:
+                    open_elements[-1].remove(element)
 
     @classmethod
-    def _find_parent_outline(
-        cls, root: ET.Element, element: ET.Element
-    ) -> ET.Element | None:
-        for outline in root.findall(".//outline"):
-            if element in list(outline):
-                return outline
-        return None
+    def _folder_path(
+        cls, open_elements: list[ET.Element], max_depth: int
+    ) -> list[str]:
+        folder_path: list[str] = []
+
+        for parent in reversed(open_elements):
+            if parent.tag != "outline":
+                break
+            parent_title = parent.get("title") or parent.get("text")
+            if parent_title:
+                folder_path.append(parent_title)
+                if len(folder_path) >= max_depth:
+                    break
+
+        folder_path.reverse()
+        return folder_path
 
     @classmethod
     def build_folder_structure(
@@ -215,7 +225,6 @@ class OpmlParser:
     ) -> OpmlValidationResult:
         errors: list[str] = []
         warnings: list[str] = []
-        feeds: list[OpmlFeed] = []
         duplicate_urls: set[str] = set()
         invalid_urls: list[dict[str, str]] = []
 
@@ -259,8 +268,33 @@ class OpmlParser:
                 invalid_urls=[],
             )
 
+        total_feeds = 0
+        seen_urls: set[str] = set()
+        valid_feeds: list[OpmlFeed] = []
+
         try:
-            feeds = cls.parse_feeds_with_folders(content)
+            for feed in cls.iter_feeds_with_folders(content):
+                total_feeds += 1
+
+                is_valid, error_msg = cls.validate_url(feed.url)
+                if not is_valid:
+                    title: str = feed.title if feed.title else "Unknown"
+                    error: str = error_msg if error_msg else "Unknown error"
+                    invalid_urls.append(
+                        {"url": feed.url, "title": title, "error": error}
+                    )
+                    continue
+
+                if feed.url in seen_urls:
+                    duplicate_urls.add(feed.url)
+                    continue
+
+                if existing_urls and feed.url in existing_urls:
+                    duplicate_urls.add(feed.url)
+                    continue
+
+                seen_urls.add(feed.url)
+                valid_feeds.append(feed)
         except ValueError as e:
             return OpmlValidationResult(
                 is_valid=False,
@@ -274,33 +308,9 @@ class OpmlParser:
                 invalid_urls=[],
             )
 
-        if not feeds:
+        if not total_feeds:
             warnings.append("No feeds found in OPML file")
 
-        seen_urls: set[str] = set()
-        valid_feeds: list[OpmlFeed] = []
-
-        for feed in feeds:
-            is_valid, error_msg = cls.validate_url(feed.url)
-            if not is_valid:
-                title: str = feed.title if feed.title else "Unknown"
-                error: str = error_msg if error_msg else "Unknown error"
-                invalid_urls.append(
-                    {"url": feed.url, "title": title, "error": error}
-                )
-                continue
-
-            if feed.url in seen_urls:
-                duplicate_urls.add(feed.url)
-                continue
-
-            if existing_urls and feed.url in existing_urls:
-                duplicate_urls.add(feed.url)
-                continue
-
-            seen_urls.add(feed.url)
-            valid_feeds.append(feed)
-
         folder_structure = cls.build_folder_structure(valid_feeds)
 
         if invalid_urls:
@@ -315,7 +325,7 @@ class OpmlParser:
 
         return OpmlValidationResult(
             is_valid=len(errors) == 0,
-            total_feeds=len(feeds),
+            total_feeds=total_feeds,
             folder_structure=folder_structure,
             errors=errors,
             warnings=warnings,
@@ -11,8 +11,9 @@ class MediaExtractor:
         self.image_extensions = IMAGE_EXTENSIONS
 
     def extract_image_from_entry(self, entry: Any) -> str | None:
-        if hasattr(entry, "media_group") and entry.media_group:
-            for group in entry.media_group:
+        media_group = getattr(entry, "media_group", None)
+        if media_group:
+            for group in media_group:
                 if isinstance(group, dict):
                     media_thumbnail = group.get("media_thumbnail")
                     if media_thumbnail and isinstance(media_thumbnail, list):
@@ -23,8 +24,9 @@ class MediaExtractor:
                         if url:
                             return str(url)
 
-        if hasattr(entry, "media_content") and entry.media_content:
-            for media in entry.media_content:
+        media_content = getattr(entry, "media_content", None)
+        if media_content:
+            for media in media_content:
                 if isinstance(media, dict):
                     media_type = media.get("type", "") or media.get(
                         "medium", ""
@@ -34,8 +36,9 @@ class MediaExtractor:
                             str(media.get("url")) if media.get("url") else None
                         )
 
-        if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-            for thumbnail in entry.media_thumbnail:
+        media_thumbnail = getattr(entry, "media_thumbnail", None)
+        if media_thumbnail:
+            for thumbnail in media_thumbnail:
                 if isinstance(thumbnail, dict):
                     thumbnail_url = thumbnail.get("url") or thumbnail.get(
                         "href"
@@ -43,31 +46,31 @@ class MediaExtractor:
                     if thumbnail_url:
                         return str(thumbnail_url)
 
-        if hasattr(entry, "thumbnail"):
-            thumbnail = getattr(entry, "thumbnail", "")
-            if thumbnail:
-                if isinstance(thumbnail, dict):
-                    url = thumbnail.get("url") or thumbnail.get("href")
-                    return str(url) if url else None
-                return str(thumbnail)
+        thumbnail = getattr(entry, "thumbnail", None)
+        if thumbnail:
+            if isinstance(thumbnail, dict):
+                url = thumbnail.get("url") or thumbnail.get("href")
+                return str(url) if url else None
+            return str(thumbnail)
 
-        if hasattr(entry, "enclosures") and entry.enclosures:
-            for enclosure in entry.enclosures:
+        enclosures = getattr(entry, "enclosures", None)
+        if enclosures:
+            for enclosure in enclosures:
                 if isinstance(enclosure, dict):
                     if enclosure.get("type", "").startswith("image/"):
                         url = enclosure.get("href") or enclosure.get("url")
                         return str(url) if url else None
 
-        if hasattr(entry, "image"):
-            image = getattr(entry, "image", "")
-            if image:
-                if isinstance(image, dict):
-                    url = image.get("href") or image.get("url")
-                    return str(url) if url else None
-                return str(image)
+        image = getattr(entry, "image", None)
+        if image:
+            if isinstance(image, dict):
+                url = image.get("href") or image.get("url")
+                return str(url) if url else None
+            return str(image)
 
-        if hasattr(entry, "links") and entry.links:
-            for link in entry.links:
+        links = getattr(entry, "links", None)
+        if links:
+            for link in links:
                 if isinstance(link, dict):
                     rel = link.get("rel", "")
                     link_type = link.get("type", "")
@@ -85,18 +88,21 @@ class MediaExtractor:
         return None
 
     def extract_image_from_summary_description(self, entry: Any) -> str | None:
-        if hasattr(entry, "summary") and entry.summary:
-            summary_content = entry.summary
-            if isinstance(summary_content, str) and summary_content.strip():
+        summary_content = getattr(entry, "summary", None)
+        if summary_content:
+            if (
+                isinstance(summary_content, str)
+                and not summary_content.isspace()
+            ):
                 img_url = self.extract_image_from_html(summary_content)
                 if img_url:
                     return img_url
 
-        if hasattr(entry, "description") and entry.description:
-            description_content = entry.description
+        description_content = getattr(entry, "description", None)
+        if description_content:
             if (
                 isinstance(description_content, str)
-                and description_content.strip()
+                and not description_content.isspace()
             ):
                 img_url = self.extract_image_from_html(description_content)
                 if img_url:
@@ -136,8 +142,9 @@ class MediaExtractor:
     def extract_metadata_from_entry(self, entry: Any) -> dict[str, Any]:
         metadata: dict[str, Any] = {}
 
-        if hasattr(entry, "enclosures") and entry.enclosures:
-            for enclosure in entry.enclosures:
+        enclosures = getattr(entry, "enclosures", None)
+        if enclosures:
+            for enclosure in enclosures:
                 if isinstance(enclosure, dict):
                     enc_type = enclosure.get("type", "")
                     if enc_type and "audio" in enc_type.lower():
@@ -155,10 +162,11 @@ class MediaExtractor:
             if hasattr(entry, "yt_channelid"):
                 metadata["youtube"]["channel_id"] = entry.yt_channelid
 
-        if not hasattr(entry, "media_group") or not entry.media_group:
+        media_group = getattr(entry, "media_group", None)
+        if not media_group:
             return metadata
 
-        for group in entry.media_group:
+        for group in media_group:
             if not isinstance(group, dict):
                 continue
 
@@ -1,139 +1,195 @@
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
-
-try:
-    from feedparser import (
-        _parse_date as feedparser_parse_date,
-    )
-except ImportError:
-    feedparser_parse_date = None
+from email.utils import parsedate_to_datetime
+from typing import Any, Literal
 
 import structlog
 
+logger = structlog.get_logger()
+
+_feedparser_parse_date: Callable[[str], Any] | Literal[False] | None = None
+
+
+def _get_feedparser_parse_date() -> Callable[[str], Any] | None:
+    global _feedparser_parse_date
+    if _feedparser_parse_date is None:
+        try:
+            from feedparser import _parse_date
+        except ImportError:
+            _feedparser_parse_date = False
+        else:
+            _feedparser_parse_date = _parse_date
+    return _feedparser_parse_date or None
+
+
+def _parse_standard_date(date_str: str) -> datetime | None:
+    try:
+        dt = datetime.fromisoformat(date_str)
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC)
+
+
+def _author_from_author_attr(entry: Any) -> str | None:
+    author = getattr(entry, "author", None)
+    if not author:
+        return None
+
+    if isinstance(author, dict):
+        author_name = author.get("name", "")
+        if author_name:
+            return str(author_name)
+        for field in ["email", "uri"]:
+            field_value = author.get(field, "")
+            if field_value and "@" not in field_value:
+                return str(field_value)
+    elif isinstance(author, str):
+        return author
+    elif isinstance(author, list):
+        first_author = author[0]
+        if isinstance(first_author, dict):
+            author_name = first_author.get("name", "")
+            if author_name:
+                return str(author_name)
+        elif isinstance(first_author, str):
+            return first_author
+
+    return str(author)
+
+
+def _author_from_value(value: Any) -> str | None:
+    if not value:
+        return None
+
+    if isinstance(value, list):
+        authors = [str(v) for v in value if v]
+        return ", ".join(authors) if authors else None
+
+    return str(value)
+
+
+def _author_from_dc_creator(entry: Any) -> str | None:
+    return _author_from_value(getattr(entry, "dc_creator", None))
+
+
+def _author_from_creator(entry: Any) -> str | None:
+    return _author_from_value(getattr(entry, "creator", None))
+
+
+def _author_from_name(entry: Any) -> str | None:
+    return _author_from_value(getattr(entry, "name", None))
+
+
+_AUTHOR_EXTRACTORS: tuple[Callable[[Any], str | None], ...] = (
+    _author_from_author_attr,
+    _author_from_dc_creator,
+    _author_from_creator,
+    _author_from_name,
+)
+
 
 class EntryExtractor:
     def extract_content_from_entry(
         self, entry: Any
     ) -> tuple[str | None, str | None]:
-        if hasattr(entry, "media_group") and entry.media_group:
-            for group in entry.media_group:
+        media_group = getattr(entry, "media_group", None)
+        if media_group:
+            for group in media_group:
                 if isinstance(group, dict):
                     media_description = group.get("media_description")
                     if (
                         media_description
                         and isinstance(media_description, str)
-                        and media_description.strip()
+                        and not media_description.isspace()
                     ):
                         return media_description, "media:description"
 
-        if hasattr(entry, "content") and entry.content:
-            if isinstance(entry.content, list):
-                for item in entry.content:
+        content = getattr(entry, "content", None)
+        if content:
+            if isinstance(content, list):
+                for item in content:
                     if isinstance(item, dict):
                         content_value = item.get("value", "")
-                        if content_value and content_value.strip():
+                        if content_value and not content_value.isspace():
                             return content_value, "atom:content"
-            elif isinstance(entry.content, str) and entry.content.strip():
-                return entry.content, "atom:content"
-
-        if hasattr(entry, "content_encoded") and entry.content_encoded:
-            if (
-                isinstance(entry.content_encoded, str)
-                and entry.content_encoded.strip()
-            ):
-                return entry.content_encoded, "content:encoded"
-
-        for attr_name in ["content_encoded", "content"]:
-            if hasattr(entry, attr_name):
-                content_value = getattr(entry, attr_name)
-                if isinstance(content_value, str) and content_value.strip():
-                    return content_value, "content:encoded"
+            elif isinstance(content, str) and not content.isspace():
+                return content, "atom:content"
+
+        content_encoded = getattr(entry, "content_encoded", None)
+        if (
+            content_encoded
+            and isinstance(content_encoded, str)
+            and not content_encoded.isspace()
+        ):
+            return content_encoded, "content:encoded"
 
         return None, None
 
     def extract_author_from_entry(self, entry: Any) -> str | None:
-        if hasattr(entry, "author"):
-            author = getattr(entry, "author", "")
-            if author:
-                if isinstance(author, dict):
-                    author_name = author.get("name", "")
-                    if author_name:
-                        return str(author_name)
-                    for field in ["email", "uri"]:
-                        field_value = author.get(field, "")
-                        if field_value and "@" not in field_value:
-                            return str(field_value)
-                elif isinstance(author, str):
-                    return str(author)
-                elif isinstance(author, list) and author:
-                    first_author = author[0]
-                    if isinstance(first_author, dict):
-                        author_name = first_author.get("name", "")
-                        if author_name:
-                            return str(author_name)
-                    elif isinstance(first_author, str):
-                        return str(first_author)
-
-        if hasattr(entry, "author"):
-            author = getattr(entry, "author", "")
+        for extract_author in _AUTHOR_EXTRACTORS:
+            author = extract_author(entry)
             if author:
-                return str(author)
-
-        for field in ["dc_creator", "creator", "name"]:
-            if hasattr(entry, field):
-                value = getattr(entry, field)
-                if value:
-                    if isinstance(value, list):
-                        authors = [str(v) for v in value if v]
-                        return ", ".join(authors) if authors else None
-                    return str(value)
+                return author
 
         return None
 
     def extract_categories_from_entry(self, entry: Any) -> list[str]:
-        categories = []
+        categories: list[str] = []
+        seen: set[str] = set()
+
+        def add_category(category: str) -> None:
+            if category not in seen:
+                seen.add(category)
+                categories.append(category)
 
-        if hasattr(entry, "tags") and entry.tags:
-            for tag in entry.tags:
+        tags = getattr(entry, "tags", None)
+        if tags:
+            for tag in tags:
                 if isinstance(tag, dict):
                     term = tag.get("term")
                     if term:
-                        categories.append(str(term))
+                        add_category(str(term))
                 elif isinstance(tag, str):
-                    categories.append(tag)
+                    add_category(tag)
 
-        if hasattr(entry, "category") and entry.category:
-            if isinstance(entry.category, list):
-                for cat in entry.category:
+        category = getattr(entry, "category", None)
+        if category:
+            if isinstance(category, list):
+                for cat in category:
                     if cat:
-                        categories.append(str(cat))
-            elif isinstance(entry.category, str):
-                categories.append(entry.category)
-
-        if hasattr(entry, "subject") and entry.subject:
-            if isinstance(entry.subject, list):
-                for subject in entry.subject:
-                    if subject:
-                        categories.append(str(subject))
-            elif isinstance(entry.subject, str):
-                categories.append(entry.subject)
+                        add_category(str(cat))
+            elif isinstance(category, str):
+                add_category(category)
+
+        subject = getattr(entry, "subject", None)
+        if subject:
+            if isinstance(subject, list):
+                for item in subject:
+                    if item:
+                        add_category(str(item))
+            elif isinstance(subject, str):
+                add_category(subject)
 
         for field in ["dc_subject", "subject"]:
-            if hasattr(entry, field):
-                value = getattr(entry, field)
-                if value:
-                    if isinstance(value, list):
-                        for item in value:
-                            if item:
-                                categories.append(str(item))
-                    else:
-                        categories.append(str(value))
-
-        return list(dict.fromkeys(categories))
+            value = getattr(entry, field, None)
+            if value:
+                if isinstance(value, list):
+                    for item in value:
+                        if item:
+                            add_category(str(item))
+                else:
+                    add_category(str(value))
 
-    def extract_publish_date(self, entry: Any) -> datetime | None:
-        import time
+        return categories
 
+    def extract_publish_date(self, entry: Any) -> datetime | None:
         def time_struct_to_dt(time_struct: Any) -> datetime | None:
             if time_struct and len(time_struct) >= 9:
                 try:
@@ -149,6 +205,10 @@ class EntryExtractor:
             if not date_str or not isinstance(date_str, str):
                 return None
             try:
+                dt = _parse_standard_date(date_str.strip())
+                if dt:
+                    return dt
+                feedparser_parse_date = _get_feedparser_parse_date()
                 if feedparser_parse_date:
                     parsed = feedparser_parse_date(date_str)
                     if parsed:
@@ -173,8 +233,6 @@ class EntryExtractor:
                 )
             return None
 
-        logger = structlog.get_logger()
-
         date_fields = [
             "published_parsed",
             "updated_parsed",
@@ -182,15 +240,14 @@ class EntryExtractor:
         ]
 
         for field in date_fields:
-            if hasattr(entry, field):
-                time_struct = getattr(entry, field, None)
-                if time_struct:
-                    dt = time_struct_to_dt(time_struct)
-                    if dt:
-                        logger.debug(
-                            "Extracted date from field", field=field, date=dt
-                        )
-                        return dt
+            time_struct = getattr(entry, field, None)
+            if time_struct:
+                dt = time_struct_to_dt(time_struct)
+                if dt:
+                    logger.debug(
+                        "Extracted date from field", field=field, date=dt
+                    )
+                    return dt
 
         string_date_fields = [
             "published",
@@ -199,26 +256,24 @@ class EntryExtractor:
         ]
 
         for field in string_date_fields:
-            if hasattr(entry, field):
-                date_str = getattr(entry, field, None)
-                if date_str:
-                    dt = parse_string_date(date_str)
-                    if dt:
-                        logger.debug(
-                            "Extracted date from field", field=field, date=dt
-                        )
-                        return dt
+            date_str = getattr(entry, field, None)
+            if date_str:
+                dt = parse_string_date(date_str)
+                if dt:
+                    logger.debug(
+                        "Extracted date from field", field=field, date=dt
+                    )
+                    return dt
 
         for field in ["date", "pubDate"]:
-            if hasattr(entry, field):
-                date_str = getattr(entry, field, None)
-                if date_str:
-                    dt = parse_string_date(date_str)
-                    if dt:
-                        logger.debug(
-                            "Extracted date from field", field=field, date=dt
-                        )
-                        return dt
+            date_str = getattr(entry, field, None)
+            if date_str:
+                dt = parse_string_date(date_str)
+                if dt:
+                    logger.debug(
+                        "Extracted date from field", field=field, date=dt
+                    )
+                    return dt
 
         logger.debug("No valid publish date found in entry")
         return None
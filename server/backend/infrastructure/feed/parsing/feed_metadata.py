@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 import structlog
@@ -5,19 +6,29 @@ import structlog
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=256)
+def _normalize_language_code(language: str) -> str:
+    if not language:
+        return language
+
+    parts = language.split("-")
+    if len(parts) == 1:
+        return parts[0].lower()[:2]
+
+    lang = parts[0].lower()[:2]
+    country = parts[1].upper()[:2]
+    return f"{lang}-{country}"
+
+
 class FeedExtractor:
     @staticmethod
     def detect_feed_type(feed: Any) -> str:
-        feed_type = "rss"
-        if hasattr(feed, "version") and feed.version:
-            if "atom" in feed.version.lower():
-                feed_type = "atom"
-            elif "rdf" in feed.version.lower():
-                feed_type = "rdf"
-            elif "rss" in feed.version.lower():
-                feed_type = "rss"
-
-        return feed_type
+        version = (getattr(feed, "version", None) or "").lower()
+        if "atom" in version:
+            return "atom"
+        if "rdf" in version:
+            return "rdf"
+        return "rss"
 
     @staticmethod
     def extract_title(feed: Any) -> str:
@@ -27,70 +38,46 @@ class FeedExtractor:
     @staticmethod
     def extract_description(feed: Any) -> str | None:
         raw_description = feed.feed.get("description", "")
+        if not raw_description:
+            return None
 
-        if raw_description and len(str(raw_description)) < 500:
-            return str(raw_description).strip()
+        description = str(raw_description)
+        if len(description) < 500:
+            return description.strip()
 
         return None
 
     @staticmethod
     def extract_language(feed: Any) -> str | None:
-        try:
-            if hasattr(feed, "feed") and feed.feed:
-                if hasattr(feed.feed, "language") and feed.feed.language:
-                    language = str(feed.feed.language).strip()
-                    if language:
-                        return FeedExtractor._normalize_language_code(language)
-
-                if hasattr(feed.feed, "dc_language") and feed.feed.dc_language:
-                    language = str(feed.feed.dc_language).strip()
-                    if language:
-                        return FeedExtractor._normalize_language_code(language)
-
-                for field in ["language", "dc_language"]:
-                    if hasattr(feed.feed, field):
-                        value = getattr(feed.feed, field)
-                        if value:
-                            language = str(value).strip()
-                            if language:
-                                return FeedExtractor._normalize_language_code(
-                                    language
-                                )
+        feed_data = getattr(feed, "feed", None)
+        if not feed_data:
+            return None
 
-        except Exception as e:
-            logger.debug("Error extracting feed language", error=str(e))
+        for field in ("language", "dc_language"):
+            value = getattr(feed_data, field, None)
+            if value and (language := str(value).strip()):
+                return FeedExtractor._normalize_language_code(language)
 
         return None
 
     @staticmethod
     def _normalize_language_code(language: str) -> str:
-        if not language:
-            return language
-
-        parts = language.split("-")
-        if len(parts) == 1:
-            return parts[0].lower()[:2]
-
-        lang = parts[0].lower()[:2]
-        country = parts[1].upper()[:2]
-        return f"{lang}-{country}"
+        return _normalize_language_code(language)
 
     @staticmethod
     def extract_website(feed: Any) -> str | None:
         try:
-            if hasattr(feed, "feed") and feed.feed:
-                if hasattr(feed.feed, "link") and feed.feed.link:
-                    link = feed.feed.link
-                    if isinstance(link, str):
-                        return link
-
-                if hasattr(feed.feed, "links") and feed.feed.links:
-                    for link_obj in feed.feed.links:
-                        if (
-                            hasattr(link_obj, "rel")
-                            and link_obj.rel == "alternate"
-                            and hasattr(link_obj, "href")
-                        ):
+            feed_data = getattr(feed, "feed", None)
+            if feed_data:
+                link = getattr(feed_data, "link", None)
+                if link and isinstance(link, str):
+                    return link
+
+                links = getattr(feed_data, "links", None)
+                if links:
+                    for link_obj in links:
+                        rel = getattr(link_obj, "rel", None)
+                        if rel == "alternate" and hasattr(link_obj, "href"):
                             return str(link_obj.href)
 
         except Exception as e:
@@ -1,4 +1,5 @@
 from importlib.metadata import version as get_version
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -7,47 +8,82 @@ from backend.core.app import settings
 
 _VERSION = get_version("glanced-reader-server")
 
+_TIMEOUT = httpx.Timeout(
+    connect=5.0,
+    read=15.0,
+    write=10.0,
+    pool=30.0,
+)
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=5,
+    max_connections=10,
+    keepalive_expiry=30.0,
+)
+_MAX_RESPONSE_SIZE = settings.max_feed_size_mb * 1024 * 1024
+_MAX_REDIRECTS = 3
+_STREAM_CHUNK_SIZE = 64 * 1024
+_DEFAULT_HEADERS = MappingProxyType(
+    {
+        "User-Agent": f"Glanced-Reader/{_VERSION} (+https://github.com/glancedrss/reader)",
+        "Accept": "application/rss+xml, application/atom+xml, application/rdf+xml, text/xml, application/xml;q=0.9, text/html;q=0.8, */*;q=0.1",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+)
+_SECURE_CLIENT_CONFIG = MappingProxyType(
+    {
+        "timeout_config": _TIMEOUT,
+        "max_response_size": _MAX_RESPONSE_SIZE,
+        "max_redirects": _MAX_REDIRECTS,
+        "default_headers": _DEFAULT_HEADERS,
+    }
+)
+
+
+class ResponseTooLargeError(ValueError):
+    def __init__(self, url: str, limit: int):
+        super().__init__(
+            f"Response from {url} exceeds maximum allowed size ({limit} bytes)"
+        )
+        self.url = url
+        self.limit = limit
+
+
+async def read_bounded(
+    response: httpx.Response, url: str, limit: int = _MAX_RESPONSE_SIZE
+) -> bytes:
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > limit:
+            raise ResponseTooLargeError(url, limit)
+
+    body = bytearray()
+    async for chunk in response.aiter_bytes(chunk_size=_STREAM_CHUNK_SIZE):
+        body.extend(chunk)
+        if len(body) > limit:
+            raise ResponseTooLargeError(url, limit)
+
+    return bytes(body)
+
 
 class HttpClient:
     @staticmethod
-    def get_secure_client_config() -> dict[str, Any]:
-        return {
-            "timeout_config": httpx.Timeout(
-                connect=5.0,
-                read=15.0,
-                write=10.0,
-                pool=30.0,
-            ),
-            "max_response_size": settings.max_feed_size_mb * 1024 * 1024,
-            "max_redirects": 3,
-            "default_headers": {
-                "User-Agent": f"Glanced-Reader/{_VERSION} (+https://github.com/glancedrss/reader)",
-                "Accept": "application/rss+xml, application/atom+xml, application/rdf+xml, text/xml, application/xml;q=0.9, text/html;q=0.8, */*;q=0.1",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
-            },
-        }
+    def get_secure_client_config() -> MappingProxyType[str, Any]:
+        return _SECURE_CLIENT_CONFIG
 
 
 class SecureHTTPClient:
     def __init__(self) -> None:
-        config = HttpClient.get_secure_client_config()
-        self.timeout_config = config["timeout_config"]
-        self.max_response_size = config["max_response_size"]
-        self.max_redirects = config["max_redirects"]
-        self.default_headers = config["default_headers"]
+        self.timeout_config = _TIMEOUT
+        self.max_response_size = _MAX_RESPONSE_SIZE
+        self.max_redirects = _MAX_REDIRECTS
+        self.default_headers = _DEFAULT_HEADERS
 
     def create_client(self) -> httpx.AsyncClient:
-        limits = httpx.Limits(
-            max_keepalive_connections=5,
-            max_connections=10,
-            keepalive_expiry=30.0,
-        )
-
         return httpx.AsyncClient(
             timeout=self.timeout_config,
-            limits=limits,
+            limits=_LIMITS,
             headers=self.default_headers,
             follow_redirects=True,
             max_redirects=self.max_redirects,
@@ -1,14 +1,16 @@
 import re
-from datetime import UTC, datetime, timedelta
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime
+from itertools import batched
 from typing import Any
 from uuid import UUID
 
 import structlog
 from sqlalchemy import and_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.infrastructure.feed.processing.partition import Partition
-from backend.infrastructure.repositories.tag import UserTagRepository
 from backend.models import (
     Article,
     ArticleSource,
@@ -19,12 +21,89 @@ from backend.utils.url_normalizer import normalize_url
 
 logger = structlog.get_logger()
 
+_ARTICLE_CHUNK_SIZE = 200
+
+# Comma-separated tag names with surrounding whitespace trimmed.
+_TAG_SPLIT_RE = re.compile(r"[^,\s][^,]*[^,\s]|[^,\s]")
+
+_USER_ARTICLES_STAGE_TABLE = "_stage_user_articles"
+_CREATE_USER_ARTICLES_STAGE = text(f"""
+    CREATE TEMP TABLE {_USER_ARTICLES_STAGE_TABLE} (user_id uuid, article_id uuid)
+    ON COMMIT DROP
+""")
+_MERGE_USER_ARTICLES_STAGE = text(f"""
+    INSERT INTO content.user_articles (user_id, article_id, is_read, read_later)
+    SELECT user_id, article_id, false, false
+    FROM {_USER_ARTICLES_STAGE_TABLE}
+    ON CONFLICT (user_id, article_id)
+    DO NOTHING
+""")
+_DROP_USER_ARTICLES_STAGE = text(f"DROP TABLE {_USER_ARTICLES_STAGE_TABLE}")
+_INSERT_USER_ARTICLES_UNNEST = text("""
+    INSERT INTO content.user_articles (user_id, article_id, is_read, read_later)
+    SELECT user_id, article_id, false, false
+    FROM unnest(CAST(:user_ids AS uuid[]), CAST(:article_ids AS uuid[]))
+        AS t(user_id, article_id)
+    ON CONFLICT (user_id, article_id)
+    DO NOTHING
+""")
+_INSERT_ARTICLE_TAGS_UNNEST = text("""
+    INSERT INTO personalization.tags (user_article_id, user_tag_id)
+    SELECT ua.id, t.user_tag_id
+    FROM unnest(
+        CAST(:user_ids AS uuid[]),
+        CAST(:article_ids AS uuid[]),
+        CAST(:user_tag_ids AS uuid[])
+    ) AS t(user_id, article_id, user_tag_id)
+    JOIN content.user_articles ua
+        ON ua.user_id = t.user_id AND ua.article_id = t.article_id
+    ON CONFLICT (user_article_id, user_tag_id)
+    DO NOTHING
+""")
+
+_UPSERT_USER_TAGS_UNNEST = text("""
+    INSERT INTO personalization.user_tags (user_id, name, article_count)
+    SELECT user_id, name, 0
+    FROM unnest(CAST(:user_ids AS uuid[]), CAST(:names AS text[]))
+        AS t(user_id, name)
+    ON CONFLICT (user_id, name)
+    DO NOTHING
+    RETURNING id, user_id, name
+""")
+_SELECT_USER_TAGS = text("""
+    SELECT id, user_id, name
+    FROM personalization.user_tags
+    WHERE user_id = ANY(CAST(:user_ids AS uuid[]))
+        AND name = ANY(CAST(:names AS text[]))
+""")
+
+
+@dataclass(slots=True)
+class RawArticle:
+    url: str = ""
+    title: str = ""
+    author: str = ""
+    summary: str = ""
+    content: str | None = None
+    media_url: str = ""
+    platform_metadata: dict[str, Any] = field(default_factory=dict)
+    categories: list[str] = field(default_factory=list)
+    published_at: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RawArticle":
+        return cls(
+            **{key: data[key] for key in _RAW_ARTICLE_FIELDS if key in data}
+        )
+
+
+_RAW_ARTICLE_FIELDS = tuple(f.name for f in fields(RawArticle))
+
 
 class ArticleProcessor:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.partition_service = Partition(db)
-        self.tag_repository = UserTagRepository(db)
 
     async def process_feed_articles(
         self,
@@ -34,9 +113,8 @@ class ArticleProcessor:
         created_count = 0
         relationship_count = 0
         new_article_ids: list[UUID] = []
-        existing_articles_for_assignment: list[UUID] = []
         all_fetched_article_ids: list[UUID] = []
-        articles_needing_tags: list[tuple[UUID, list[str]]] = []
+        subscriber_ids: list[UUID] | None = None
 
         try:
             logger.info(
@@ -53,297 +131,381 @@ class ArticleProcessor:
                     f"Successfully pre-created {len(created_partitions)} partitions for feed processing"
                 )
 
-            for article_data in articles_data:
-                article_url = article_data.get("url", "")
-                if not article_url:
+            for chunk in batched(
+                articles_data, _ARTICLE_CHUNK_SIZE, strict=False
+            ):
+                (
+                    chunk_new_ids,
+                    chunk_linked_ids,
+                    chunk_fetched_ids,
+                    articles_needing_tags,
+                ) = await self._store_article_chunk(feed_id, chunk)
+
+                created_count += len(chunk_new_ids)
+                relationship_count += len(chunk_linked_ids)
+                new_article_ids.extend(chunk_new_ids)
+                all_fetched_article_ids.extend(chunk_fetched_ids)
+
+                articles_for_assignment = chunk_new_ids + chunk_linked_ids
+                if not (articles_for_assignment or articles_needing_tags):
                     continue
 
-                canonical_url = normalize_url(article_url)
+                if subscriber_ids is None:
+                    subscriber_ids = await self._get_active_subscriber_ids(
+                        feed_id
+                    )
 
-                existing_stmt = (
-                    select(Article)
-                    .where(Article.canonical_url == canonical_url)
-                    .with_for_update()
+                if articles_for_assignment:
+                    await self._create_user_states_for_subscribers(
+                        feed_id, subscriber_ids, articles_for_assignment
+                    )
+
+                if articles_needing_tags:
+                    await self._create_tags_for_subscribers(
+                        feed_id, subscriber_ids, articles_needing_tags
+                    )
+
+            if created_count > 0 or relationship_count > 0:
+                logger.info(
+                    f"Processed feed articles - Created: {created_count}, "
+                    f"Added relationships: {relationship_count}, "
+                    f"feed_id: {feed_id}"
                 )
-                existing_result = await self.db.execute(existing_stmt)
-                existing_article = existing_result.scalar_one_or_none()
 
-                if existing_article:
-                    all_fetched_article_ids.append(existing_article.id)
+            return created_count, new_article_ids, all_fetched_article_ids
 
-                    relationship_stmt = select(ArticleSource).where(
-                        and_(
-                            ArticleSource.article_id == existing_article.id,
-                            ArticleSource.feed_id == feed_id,
-                        )
-                    )
-                    relationship_result = await self.db.execute(
-                        relationship_stmt
-                    )
-                    existing_relationship = (
-                        relationship_result.scalar_one_or_none()
-                    )
+        except Exception as e:
+            logger.exception(
+                "Error processing articles", error=str(e), feed_id=feed_id
+            )
+            raise
 
-                    if not existing_relationship:
-                        relationship = ArticleSource(
-                            article_id=existing_article.id, feed_id=feed_id
-                        )
-                        self.db.add(relationship)
-                        relationship_count += 1
-                        existing_articles_for_assignment.append(
-                            existing_article.id
-                        )
-                        logger.info(
-                            f"Added existing article to feed: {existing_article.title or canonical_url}"
-                        )
-                    else:
-                        logger.debug(
-                            f"Article already in feed: {existing_article.title or canonical_url}"
-                        )
+    async def _store_article_chunk(
+        self, feed_id: UUID, chunk: tuple[dict[str, Any], ...]
+    ) -> tuple[
+        list[UUID], list[UUID], list[UUID], list[tuple[UUID, list[str]]]
+    ]:
+        articles = [
+            RawArticle.from_dict(article_data) for article_data in chunk
+        ]
+        canonical_urls = {
+            article.url: normalize_url(article.url)
+            for article in articles
+            if article.url
+        }
+        existing_by_url = await self._get_existing_article_ids(
+            set(canonical_urls.values())
+        )
+        newly_linked_ids = await self._link_articles_to_feed(
+            feed_id, list(existing_by_url.values())
+        )
 
-                else:
-                    published_date = parse_iso_datetime(
-                        article_data.get("published_at")
-                    )
+        new_article_ids: list[UUID] = []
+        linked_existing_ids: list[UUID] = []
+        articles_needing_tags: list[tuple[UUID, list[str]]] = []
+        new_rows: dict[str, dict[str, Any]] = {}
+        fetched_urls: list[str] = []
+        now = datetime.now(UTC)
 
-                    if published_date and published_date > datetime.now(UTC):
-                        logger.warning(
-                            f"Skipping article with future publication date: {article_data.get('title', canonical_url)} - {published_date}"
-                        )
-                        continue
-
-                    categories = article_data.get("categories", [])
-                    source_tags = []
-                    if categories:
-                        for category in categories:
-                            if category and category.strip():
-                                tag_names = [
-                                    name.strip()
-                                    for name in category.split(",")
-                                    if name.strip()
-                                ]
-                                source_tags.extend(tag_names)
-
-                    article = Article(
-                        canonical_url=canonical_url,
-                        title=article_data.get("title", ""),
-                        author=article_data.get("author", ""),
-                        summary=article_data.get("summary", "")[:2000],
-                        content=article_data.get("content", "") or None,
-                        source_tags=source_tags,
-                        media_url=article_data.get("media_url", ""),
-                        platform_metadata=article_data.get(
-                            "platform_metadata", {}
-                        ),
-                        published_at=published_date,
-                    )
+        for article in articles:
+            if not article.url:
+                continue
 
-                    logger.info(
-                        f"Created article with media_url: {article.media_url}",
-                        canonical_url=canonical_url,
-                        media_url=article.media_url,
-                        raw_media_url_key=article_data.get(
-                            "media_url", "MISSING"
-                        ),
-                    )
+            canonical_url = canonical_urls[article.url]
+            existing_article_id = existing_by_url.get(canonical_url)
+
+            if existing_article_id:
+                fetched_urls.append(canonical_url)
 
-                    try:
-                        self.db.add(article)
-                        await self.db.flush()
-                    except Exception as e:
-                        error_str = str(e).lower()
-                        if "duplicate" in error_str or "unique" in error_str:
-                            logger.info(
-                                f"Article already exists (created by concurrent process): {canonical_url}"
-                            )
-                            existing_stmt = select(Article).where(
-                                Article.canonical_url == canonical_url
-                            )
-                            existing_result = await self.db.execute(
-                                existing_stmt
-                            )
-                            existing_article = (
-                                existing_result.scalar_one_or_none()
-                            )
-                            if existing_article:
-                                article = existing_article
-                            else:
-                                continue
-                        elif (
-                            "partition" in error_str
-                            and "articles" in error_str
-                            and published_date
-                        ):
-                            try:
-                                partition_month = published_date.strftime(
-                                    "%Y_%m"
-                                )
-                                start_date = published_date.replace(
-                                    day=1,
-                                    hour=0,
-                                    minute=0,
-                                    second=0,
-                                    microsecond=0,
-                                )
-                                end_date = (
-                                    start_date + timedelta(days=32)
-                                ).replace(day=1)
-
-                                if not re.match(
-                                    r"^\d{4}_\d{2}$", partition_month
-                                ):
-                                    raise ValueError(
-                                        f"Invalid partition_month format: {partition_month}"
-                                    )
-
-                                table_name = f"articles_{partition_month}"
-                                full_partition_name = f"content.{table_name}"
-
-                                partition_sql = text(
-                                    f"""
-                                    CREATE TABLE IF NOT EXISTS {full_partition_name}
-                                    PARTITION OF content.articles
-                                    FOR VALUES FROM (:start_date)
-                                    TO (:end_date)
-                                """
-                                )
-                                await self.db.execute(
-                                    partition_sql,
-                                    {
-                                        "start_date": start_date.isoformat(),
-                                        "end_date": end_date.isoformat(),
-                                    },
-                                )
-
-                                logger.info(
-                                    f"Auto-created partition articles_{partition_month} for date {published_date}"
-                                )
-
-                                self.db.add(article)
-                                await self.db.flush()
-
-                            except Exception as partition_error:
-                                logger.exception(
-                                    f"Failed to create partition for {published_date}: {partition_error}"
-                                )
-                                raise e from None
-                        else:
-                            raise e
-
-                    relationship = ArticleSource(
-                        article_id=article.id, feed_id=feed_id
+                if existing_article_id in newly_linked_ids:
+                    newly_linked_ids.discard(existing_article_id)
+                    linked_existing_ids.append(existing_article_id)
+                    logger.debug(
+                        f"Added existing article to feed: {canonical_url}"
                     )
-                    self.db.add(relationship)
+                else:
+                    logger.debug(f"Article already in feed: {canonical_url}")
 
-                    if source_tags:
-                        articles_needing_tags.append((article.id, source_tags))
+            elif canonical_url in new_rows:
+                fetched_urls.append(canonical_url)
 
-                    all_fetched_article_ids.append(article.id)
-                    created_count += 1
-                    new_article_ids.append(article.id)
+            else:
+                published_date = parse_iso_datetime(article.published_at)
 
-                    logger.info(
-                        f"Created new article: {article.title or canonical_url}"
+                if published_date and published_date > now:
+                    logger.warning(
+                        f"Skipping article with future publication date: {article.title or canonical_url} - {published_date}"
                     )
+                    continue
 
-            if new_article_ids:
-                await self._create_user_states_for_subscribers(
-                    feed_id, new_article_ids
+                source_tags = (
+                    _TAG_SPLIT_RE.findall(
+                        ",".join(c for c in article.categories if c)
+                    )
+                    if article.categories
+                    else []
                 )
 
-            if existing_articles_for_assignment:
-                await self._create_user_states_for_subscribers(
-                    feed_id, existing_articles_for_assignment
+                new_rows[canonical_url] = {
+                    "canonical_url": canonical_url,
+                    "title": article.title,
+                    "author": article.author,
+                    "summary": article.summary[:2000],
+                    "content": article.content or None,
+                    "source_tags": source_tags,
+                    "media_url": article.media_url,
+                    "platform_metadata": article.platform_metadata,
+                    "published_at": published_date,
+                }
+                fetched_urls.append(canonical_url)
+
+                logger.debug(
+                    f"Created article with media_url: {new_rows[canonical_url]['media_url']}",
+                    canonical_url=canonical_url,
+                    media_url=new_rows[canonical_url]["media_url"],
                 )
 
-            for article_id, source_tags in articles_needing_tags:
-                await self._create_tags_for_subscribers(
-                    feed_id, article_id, source_tags
-                )
+        created_by_url = await self._insert_articles(list(new_rows.values()))
 
-            if created_count > 0 or relationship_count > 0:
-                logger.info(
-                    f"Processed feed articles - Created: {created_count}, "
-                    f"Added relationships: {relationship_count}, "
-                    f"Assigned existing articles: {len(existing_articles_for_assignment)}, "
-                    f"feed_id: {feed_id}"
-                )
+        for canonical_url, row in new_rows.items():
+            article_id = created_by_url.get(canonical_url)
+            if not article_id:
+                continue
 
-            return created_count, new_article_ids, all_fetched_article_ids
+            existing_by_url[canonical_url] = article_id
 
-        except Exception as e:
-            logger.exception(
-                "Error processing articles", error=str(e), feed_id=feed_id
+            if row["source_tags"]:
+                articles_needing_tags.append((article_id, row["source_tags"]))
+
+            new_article_ids.append(article_id)
+
+            logger.debug(
+                f"Created new article: {row['title'] or canonical_url}"
             )
-            raise
 
-    async def _create_user_states_for_subscribers(
+        await self._link_articles_to_feed(feed_id, new_article_ids)
+
+        fetched_article_ids = [
+            existing_by_url[canonical_url]
+            for canonical_url in fetched_urls
+            if canonical_url in existing_by_url
+        ]
+
+        logger.info(
+            "Article chunk processed",
+            feed_id=feed_id,
+            created=len(new_article_ids),
+            existing_relations=len(linked_existing_ids),
+            media_url_missing=sum(
+                1 for row in new_rows.values() if not row["media_url"]
+            ),
+        )
+
+        return (
+            new_article_ids,
+            linked_existing_ids,
+            fetched_article_ids,
+            articles_needing_tags,
+        )
+
+    async def _get_existing_article_ids(
+        self, canonical_urls: set[str]
+    ) -> dict[str, UUID]:
+        if not canonical_urls:
+            return {}
+
+        stmt = select(Article.id, Article.canonical_url).where(
+            Article.canonical_url.in_(canonical_urls)
+        )
+        result = await self.db.execute(stmt)
+        return {row.canonical_url: row.id for row in result.all()}
+
+    async def _insert_articles(
+        self, rows: list[dict[str, Any]]
+    ) -> dict[str, UUID]:
+        if not rows:
+            return {}
+
+        stmt = (
+            pg_insert(Article)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["canonical_url"])
+            .returning(Article.id, Article.canonical_url)
+        )
+
+        result = await self.db.execute(stmt)
+        created_by_url = {row.canonical_url: row.id for row in result.all()}
+
+        conflicting_urls = {
+            row["canonical_url"]
+            for row in rows
+            if row["canonical_url"] not in created_by_url
+        }
+        if conflicting_urls:
+            logger.info(
+                "Articles already exist (created by concurrent process)",
+                count=len(conflicting_urls),
+            )
+            created_by_url.update(
+                await self._get_existing_article_ids(conflicting_urls)
+            )
+
+        return created_by_url
+
+    async def _link_articles_to_feed(
         self, feed_id: UUID, article_ids: list[UUID]
-    ) -> None:
-        subscribers_stmt = select(UserFeed.user_id).where(
+    ) -> set[UUID]:
+        if not article_ids:
+            return set()
+
+        stmt = (
+            pg_insert(ArticleSource)
+            .values(
+                [
+                    {"article_id": article_id, "feed_id": feed_id}
+                    for article_id in article_ids
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["article_id", "feed_id"])
+            .returning(ArticleSource.article_id)
+        )
+        result = await self.db.execute(stmt)
+        return {row[0] for row in result.all()}
+
+    async def _get_active_subscriber_ids(self, feed_id: UUID) -> list[UUID]:
+        stmt = select(UserFeed.user_id).where(
             and_(
                 UserFeed.feed_id == feed_id,
                 UserFeed.is_active,
             )
         )
-        subscribers_result = await self.db.execute(subscribers_stmt)
-        subscriber_ids = [row[0] for row in subscribers_result.all()]
+        result = await self.db.execute(stmt)
+        return [row[0] for row in result.all()]
 
+    async def _create_user_states_for_subscribers(
+        self,
+        feed_id: UUID,
+        subscriber_ids: list[UUID],
+        article_ids: list[UUID],
+    ) -> None:
         if not subscriber_ids:
             logger.debug("No active subscribers for feed", feed_id=feed_id)
             return
 
-        values_list = []
-        for user_id in subscriber_ids:
-            for article_id in article_ids:
-                values_list.append(
-                    {"user_id": user_id, "article_id": article_id}
-                )
-
-        query = text("""
-            INSERT INTO content.user_articles (user_id, article_id, is_read, read_later)
-            VALUES (:user_id, :article_id, false, false)
-            ON CONFLICT (user_id, article_id)
-            DO NOTHING
-        """)
-        for values in values_list:
-            await self.db.execute(query, values)
+        await self._copy_user_states(subscriber_ids, article_ids)
 
         logger.info(
             f"Created user_article_states for feed {feed_id}: "
             f"{len(subscriber_ids)} subscribers, {len(article_ids)} articles"
         )
 
-    async def _create_tags_for_subscribers(
-        self, feed_id: UUID, article_id: UUID, source_tags: list[str]
+    async def _copy_user_states(
+        self, user_ids: list[UUID], article_ids: list[UUID]
     ) -> None:
-        if not source_tags:
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        copy_records_to_table = getattr(
+            raw_connection.driver_connection, "copy_records_to_table", None
+        )
+        if copy_records_to_table is None:
+            await self._insert_user_states(user_ids, article_ids)
             return
 
-        subscribers_stmt = select(UserFeed.user_id).where(
-            and_(
-                UserFeed.feed_id == feed_id,
-                UserFeed.is_active,
-            )
+        # COPY cannot express ON CONFLICT, so rows are staged in a temp table
+        # and merged into user_articles with a single INSERT ... SELECT.
+        await self.db.execute(_CREATE_USER_ARTICLES_STAGE)
+        await copy_records_to_table(
+            _USER_ARTICLES_STAGE_TABLE,
+            records=(
+                (user_id, article_id)
+                for user_id in user_ids
+                for article_id in article_ids
+            ),
+            columns=["user_id", "article_id"],
+        )
+
+        await self.db.execute(_MERGE_USER_ARTICLES_STAGE)
+        await self.db.execute(_DROP_USER_ARTICLES_STAGE)
+
+    async def _insert_user_states(
+        self, user_ids: list[UUID], article_ids: list[UUID]
+    ) -> None:
+        await self.db.execute(
+            _INSERT_USER_ARTICLES_UNNEST,
+            {
+                "user_ids": [
+                    user_id for user_id in user_ids for _ in article_ids
+                ],
+                "article_ids": [
+                    article_id for _ in user_ids for article_id in article_ids
+                ],
+            },
         )
-        subscribers_result = await self.db.execute(subscribers_stmt)
-        subscriber_ids = [row[0] for row in subscribers_result.all()]
 
+    async def _create_tags_for_subscribers(
+        self,
+        feed_id: UUID,
+        subscriber_ids: list[UUID],
+        articles_needing_tags: list[tuple[UUID, list[str]]],
+    ) -> None:
         if not subscriber_ids:
             logger.debug("No active subscribers for feed", feed_id=feed_id)
             return
 
-        for user_id in subscriber_ids:
-            for tag_name in source_tags:
-                tag = await self.tag_repository.get_or_create_tag(
-                    user_id=user_id,
-                    name=tag_name,
-                )
-                await self.tag_repository.add_tags_to_article(
-                    article_id=article_id, tag_ids=[tag.id], user_id=user_id
-                )
+        tag_names = sorted(
+            {
+                name
+                for _, source_tags in articles_needing_tags
+                for name in source_tags
+            }
+        )
+        tag_ids = await self._upsert_user_tags(subscriber_ids, tag_names)
+
+        user_ids: list[UUID] = []
+        article_ids: list[UUID] = []
+        user_tag_ids: list[UUID] = []
+        for article_id, source_tags in articles_needing_tags:
+            for user_id in subscriber_ids:
+                for name in dict.fromkeys(source_tags):
+                    user_ids.append(user_id)
+                    article_ids.append(article_id)
+                    user_tag_ids.append(tag_ids[(user_id, name)])
+
+        await self.db.execute(
+            _INSERT_ARTICLE_TAGS_UNNEST,
+            {
+                "user_ids": user_ids,
+                "article_ids": article_ids,
+                "user_tag_ids": user_tag_ids,
+            },
+        )
 
         logger.info(
-            f"Created tags for article {article_id}: "
-            f"{len(subscriber_ids)} subscribers, {len(source_tags)} tags"
+            f"Created tags for feed {feed_id}: "
+            f"{len(subscriber_ids)} subscribers, "
+            f"{len(articles_needing_tags)} articles, {len(tag_names)} tags"
+        )
+
+    async def _upsert_user_tags(
+        self, user_ids: list[UUID], names: list[str]
+    ) -> dict[tuple[UUID, str], UUID]:
+        # Array parameters keep the bind count at two however many
+        # subscriber x tag pairs there are; a multi-row VALUES would hit
+        # asyncpg's 32767-parameter limit on large feeds.
+        result = await self.db.execute(
+            _UPSERT_USER_TAGS_UNNEST,
+            {
+                "user_ids": [user_id for user_id in user_ids for _ in names],
+                "names": [name for _ in user_ids for name in names],
+            },
         )
+        tag_ids = {(row.user_id, row.name): row.id for row in result.all()}
+
+        if len(tag_ids) < len(user_ids) * len(names):
+            existing_result = await self.db.execute(
+                _SELECT_USER_TAGS, {"user_ids": user_ids, "names": names}
+            )
+            for row in existing_result.all():
+                tag_ids.setdefault((row.user_id, row.name), row.id)
+
+        return tag_ids
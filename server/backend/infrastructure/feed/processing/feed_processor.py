@@ -1,8 +1,11 @@
+import asyncio
 import html
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 from uuid import UUID
 
+import feedparser
 import httpx
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +14,7 @@ from backend.core.app import settings
 from backend.infrastructure.feed.parsing.content.media import MediaExtractor
 from backend.infrastructure.feed.parsing.entry_content import EntryExtractor
 from backend.infrastructure.feed.parsing.feed_metadata import FeedExtractor
+from backend.infrastructure.feed.parsing.http import read_bounded
 from backend.infrastructure.feed.processing.article_processor import (
     ArticleProcessor,
 )
@@ -21,13 +25,44 @@ from backend.utils.date_utils import parse_iso_datetime
 
 logger = structlog.get_logger()
 
+# The extractors and HTMLCleaner are stateless, so one instance of each is
+# shared by every FeedProcessor. Entry content is sanitized in worker
+# processes; _build_article already runs on an executor thread, which just
+# waits on the result.
+_HTML_CLEANER = HTMLCleaner(use_process_pool=True)
+_MEDIA_EXTRACTOR = MediaExtractor()
+_ENTRY_EXTRACTOR = EntryExtractor()
+
+_FEED_HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=50,
+)
+_FEED_HTTP_HEADERS = {
+    "User-Agent": settings.user_agent,
+    "Accept": "application/rss+xml, application/atom+xml, application/rdf+xml, text/xml, application/xml;q=0.9, text/html;q=0.8, */*;q=0.1",
+}
+
+
+def _latest_published_at(
+    articles_data: list[dict[str, Any]],
+) -> datetime | None:
+    # published_at is always a UTC isoformat() string (see _build_article),
+    # so the lexicographic max is the latest date and only it is parsed.
+    latest = max(
+        (a["published_at"] for a in articles_data if a.get("published_at")),
+        default=None,
+    )
+    return parse_iso_datetime(latest)
+
 
 class FeedProcessor:
+    _http_client: httpx.AsyncClient | None = None
+
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
-        self.html_cleaner = HTMLCleaner()
-        self.media_extractor = MediaExtractor()
-        self.entry_extractor = EntryExtractor()
+        self.html_cleaner = _HTML_CLEANER
+        self.media_extractor = _MEDIA_EXTRACTOR
+        self.entry_extractor = _ENTRY_EXTRACTOR
         self.repository = FeedRepository(db)
         self.article_processor = ArticleProcessor(db)
 
@@ -79,8 +114,9 @@ class FeedProcessor:
             )
 
         if content:
-            clean_content = self.html_cleaner.clean_html(content)
-            search_content = self.html_cleaner.html_to_text(content)
+            clean_content, search_content = self.html_cleaner.clean_and_textify(
+                content
+            )
         else:
             clean_content = ""
             search_content = ""
@@ -109,40 +145,28 @@ class FeedProcessor:
 
             feed_info = await self._parse_feed_content(feed_data.url)
 
-            try:
-                feed_record = await self.repository.create_feed(
+            feed_record, inserted = await self.repository.upsert_feed(
+                url=feed_data.url,
+                title=str(feed_info["title"] or feed_data.title or ""),
+                description=feed_info.get("description"),
+                feed_type=feed_info["feed_type"],
+                language=feed_info.get("language"),
+                website=feed_info["website"],
+                has_articles=bool(feed_info.get("articles")),
+            )
+            if not inserted:
+                logger.info(
+                    "Feed created by another worker, using existing feed",
                     url=feed_data.url,
-                    title=str(feed_info["title"] or feed_data.title or ""),
-                    description=feed_info.get("description"),
-                    feed_type=feed_info["feed_type"],
-                    language=feed_info.get("language"),
-                    website=feed_info["website"],
-                    has_articles=bool(feed_info.get("articles")),
+                    feed_id=feed_record.id,
                 )
-            except Exception:
-                existing = await self.repository.get_feed_by_url(feed_data.url)
-                if existing:
-                    logger.info(
-                        "Feed created by another worker, using existing feed",
-                        url=feed_data.url,
-                        feed_id=existing.id,
-                    )
-                    return existing
-                raise
+                return feed_record
 
             articles_data = feed_info.get("articles", [])
             last_update: datetime | None = None
 
             if articles_data:
-                published_dates = [
-                    parse_iso_datetime(a.get("published_at"))
-                    for a in articles_data
-                    if a.get("published_at")
-                ]
-                if published_dates:
-                    last_update = max(
-                        d for d in published_dates if d is not None
-                    )
+                last_update = _latest_published_at(articles_data)
 
                 (
                     created_count,
@@ -263,15 +287,7 @@ class FeedProcessor:
             last_update: datetime | None = None
 
             if articles_data:
-                published_dates = [
-                    parse_iso_datetime(a.get("published_at"))
-                    for a in articles_data
-                    if a.get("published_at")
-                ]
-                if published_dates:
-                    last_update = max(
-                        d for d in published_dates if d is not None
-                    )
+                last_update = _latest_published_at(articles_data)
 
                 (
                     created_count,
@@ -324,93 +340,132 @@ class FeedProcessor:
             )
             return {"error": str(e)}
 
+    # Shared across refreshes so connections and TLS sessions are pooled,
+    # and HTTP/2 lets concurrent fetches to one host share a connection.
+    # Closed by close_http_client() on shutdown.
+    @classmethod
+    def _get_http_client(cls) -> httpx.AsyncClient:
+        if cls._http_client is None or cls._http_client.is_closed:
+            cls._http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=settings.request_timeout,
+                limits=_FEED_HTTP_LIMITS,
+                headers=_FEED_HTTP_HEADERS,
+                follow_redirects=True,
+            )
+        return cls._http_client
+
+    @classmethod
+    async def close_http_client(cls) -> None:
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
     async def _parse_feed_content(
         self, url: str, timeout: float | None = None
     ) -> dict[str, Any]:
         logger.info("Parsing feed content", url=url)
 
-        async with httpx.AsyncClient(
-            timeout=timeout or settings.request_timeout
-        ) as client:
-            headers = {
-                "User-Agent": settings.user_agent,
-                "Accept": "application/rss+xml, application/atom+xml, application/rdf+xml, text/xml, application/xml;q=0.9, text/html;q=0.8, */*;q=0.1",
-            }
-            response = await client.get(
-                url, headers=headers, follow_redirects=True
-            )
+        client = self._get_http_client()
+        # Stream the body so an oversized feed is rejected as soon as it
+        # crosses max_feed_size_mb instead of being buffered in full.
+        async with client.stream(
+            "GET",
+            url,
+            timeout=timeout or settings.request_timeout,
+        ) as response:
             response.raise_for_status()
+            content = await read_bounded(response, url)
 
-            import feedparser
-
-            feed = feedparser.parse(response.content)
+        # Entry HTML is sanitized by HTMLCleaner before it is stored, so
+        # skip feedparser's slower pure-Python sanitizer pass.
+        feed = await asyncio.get_running_loop().run_in_executor(
+            None, partial(feedparser.parse, content, sanitize_html=False)
+        )
 
-            feed_metadata = FeedExtractor.extract_feed_metadata(feed)
+        feed_metadata = FeedExtractor.extract_feed_metadata(feed)
 
-            feed_language = FeedExtractor.extract_language(feed)
+        feed_language = FeedExtractor.extract_language(feed)
 
-            website = FeedExtractor.extract_website(feed)
+        website = FeedExtractor.extract_website(feed)
 
-            articles_data = []
-            if feed.entries:
-                articles_data = self._parse_feed_entries(feed)
+        articles_data = []
+        if feed.entries:
+            articles_data = await self._parse_feed_entries(feed)
 
-            if not feed_metadata.get("title"):
-                raise ValueError(
-                    f"URL does not appear to be a valid RSS/Atom feed: {url}. "
-                    f"Please provide a direct feed URL (e.g., {url.rstrip('/')}/rss/index.xml or {url.rstrip('/')}/feed)"
-                )
+        if not feed_metadata.get("title"):
+            raise ValueError(
+                f"URL does not appear to be a valid RSS/Atom feed: {url}. "
+                f"Please provide a direct feed URL (e.g., {url.rstrip('/')}/rss/index.xml or {url.rstrip('/')}/feed)"
+            )
 
-            return {
-                "title": feed_metadata["title"],
-                "description": feed_metadata["description"],
-                "feed_type": feed_metadata["feed_type"],
-                "language": feed_language,
-                "website": website,
-                "articles": articles_data,
-            }
+        return {
+            "title": feed_metadata["title"],
+            "description": feed_metadata["description"],
+            "feed_type": feed_metadata["feed_type"],
+            "language": feed_language,
+            "website": website,
+            "articles": articles_data,
+        }
 
-    def _parse_feed_entries(self, feed: Any) -> list[dict[str, Any]]:
-        articles_data = []
+    async def _parse_feed_entries(self, feed: Any) -> list[dict[str, Any]]:
         max_articles = 50
 
+        # ArticleProcessor drops entries without a link and keeps only the
+        # first entry per URL, so skip those before the costly extraction.
+        entries = []
+        seen_links: set[str] = set()
         for entry in feed.entries[:max_articles]:
-            published_date = self.entry_extractor.extract_publish_date(entry)
-
-            (
-                clean_content,
-                search_content,
-                media_url,
-                author,
-                categories,
-                _,
-                platform_metadata,
-            ) = self.extract_feed_content(entry)
-
-            raw_summary = entry.get("summary", "") or entry.get(
-                "description", ""
-            )
-            summary = (
-                self.html_cleaner.html_to_text(raw_summary)
-                if raw_summary
-                else ""
+            link = (entry.get("link") or "").strip()
+            if not link or link in seen_links:
+                continue
+            seen_links.add(link)
+            entries.append(entry)
+
+        if not entries:
+            return []
+
+        # Entry extraction is CPU-bound HTML work; keep it off the event loop
+        # so concurrent refreshes are not blocked behind a large feed.
+        loop = asyncio.get_running_loop()
+        return list(
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(None, self._build_article, entry)
+                    for entry in entries
+                )
             )
+        )
 
-            article_data: dict[str, Any] = {
-                "title": html.unescape(entry.get("title", "")),
-                "url": entry.get("link", ""),
-                "summary": summary,
-                "content": clean_content,
-                "search_content": search_content or summary,
-                "author": author,
-                "media_url": media_url,
-                "published_at": published_date.isoformat()
-                if published_date
-                else None,
-                "categories": categories,
-                "platform_metadata": platform_metadata,
-            }
+    def _build_article(self, entry: Any) -> dict[str, Any]:
+        published_date = self.entry_extractor.extract_publish_date(entry)
 
-            articles_data.append(article_data)
+        (
+            clean_content,
+            search_content,
+            media_url,
+            author,
+            categories,
+            _,
+            platform_metadata,
+        ) = self.extract_feed_content(entry)
+
+        raw_summary = entry.get("summary", "") or entry.get("description", "")
+        summary = (
+            self.html_cleaner.html_to_text(raw_summary) if raw_summary else ""
+        )
 
-        return articles_data
+        return {
+            "title": html.unescape(entry.get("title", "")),
+            "url": entry.get("link", ""),
+            "summary": summary,
+            "content": clean_content,
+            "search_content": search_content or summary,
+            "author": author,
+            "media_url": media_url,
+            "published_at": published_date.astimezone(UTC).isoformat()
+            if published_date
+            else None,
+            "categories": categories,
+            "platform_metadata": platform_metadata,
+        }
@@ -1,6 +1,8 @@
+import asyncio
 import re
-from datetime import UTC, datetime, timedelta
-from typing import Any
+import weakref
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, ClassVar
 
 import sqlalchemy.exc
 import structlog
@@ -14,139 +16,199 @@ SCHEMA_NAME = "content"
 TABLE_NAME = "articles"
 TABLE_PREFIX = "articles_"
 PARTITION_FORMAT = "%Y_%m"
+PARTITION_MONTH_RE = re.compile(r"^\d{4}_\d{2}$")
+# duplicate_table, or unique_violation on pg_type when two sessions race on
+# CREATE TABLE IF NOT EXISTS for the same partition.
+CONCURRENT_CREATE_SQLSTATES = frozenset({"42P07", "23505"})
+
+PARTITIONS_EXISTING_SQL = text("""
+    SELECT tablename FROM pg_tables
+    WHERE schemaname = :schema_name
+      AND tablename = ANY(:table_names)
+""")
 
 
 class Partition:
+    # Partitions are never dropped while the app runs, so once a partition
+    # is seen it is remembered for the life of the process.
+    _is_partitioned: ClassVar[bool | None] = None
+    _known_partitions: ClassVar[set[str]] = set()
+    # asyncio.Lock binds to the loop it is first contended on, so each
+    # running loop gets its own; a loop's lock goes away with the loop.
+    _create_locks: ClassVar[
+        weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]
+    ] = weakref.WeakKeyDictionary()
+
     def __init__(self, db: Any) -> None:
         self.db = db
 
+    @classmethod
+    def _create_lock(cls) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = cls._create_locks.get(loop)
+        if lock is None:
+            lock = cls._create_locks[loop] = asyncio.Lock()
+        return lock
+
     async def analyze_and_create_partitions(
         self, articles_data: list[dict[str, Any]]
     ) -> set[str]:
-        try:
-            partition_check_sql = text(
-                """
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.tables
-                WHERE table_schema = :schema
-                  AND table_name = :table_name
-                  AND table_type = 'PARTITIONED TABLE'
-            )
-            """
-            )
-            result = await self.db.execute(
-                partition_check_sql,
-                {"schema": SCHEMA_NAME, "table_name": TABLE_NAME},
-            )
-            is_partitioned = result.scalar()
-
-            if not is_partitioned:
-                logger.info(
-                    "Articles table is not partitioned - skipping partition creation"
+        if Partition._is_partitioned is None:
+            try:
+                Partition._is_partitioned = await self._check_partitioned()
+            except (sqlalchemy.exc.SQLAlchemyError, ValueError) as e:
+                logger.warning(
+                    f"Could not check if articles table is partitioned: {e}"
                 )
                 return set()
 
-        except (sqlalchemy.exc.SQLAlchemyError, ValueError) as e:
-            logger.warning(
-                f"Could not check if articles table is partitioned: {e}"
+        if not Partition._is_partitioned:
+            logger.info(
+                "Articles table is not partitioned - skipping partition creation"
             )
             return set()
 
-        partitions_to_create = set()
-        created_partitions = set()
+        now = datetime.now(UTC)
+        current_month = now.strftime(PARTITION_FORMAT)
+        next_month = (
+            (now + timedelta(days=32)).replace(day=1).strftime(PARTITION_FORMAT)
+        )
 
+        # Undated articles land in the current month, which is always added.
+        partitions_to_create = {current_month, next_month}
         for article_data in articles_data:
             published_date = parse_iso_datetime(
                 article_data.get("published_at")
             )
             if published_date:
-                partition_month = published_date.strftime(PARTITION_FORMAT)
-                partitions_to_create.add(partition_month)
-            else:
-                current_month = datetime.now(UTC).strftime(PARTITION_FORMAT)
-                partitions_to_create.add(current_month)
+                partitions_to_create.add(
+                    published_date.strftime(PARTITION_FORMAT)
+                )
 
-        current_month = datetime.now(UTC).strftime(PARTITION_FORMAT)
-        next_month = (
-            (datetime.now(UTC) + timedelta(days=32))
-            .replace(day=1)
-            .strftime(PARTITION_FORMAT)
+        created_partitions = await self.ensure_partitions(partitions_to_create)
+
+        if created_partitions:
+            logger.info(
+                "Pre-created partitions",
+                count=len(created_partitions),
+                partitions=sorted(created_partitions),
+            )
+
+        return created_partitions
+
+    async def _check_partitioned(self) -> bool:
+        partition_check_sql = text(
+            """
+        SELECT EXISTS (
+            SELECT 1 FROM information_schema.tables
+            WHERE table_schema = :schema
+              AND table_name = :table_name
+              AND table_type = 'PARTITIONED TABLE'
         )
-        partitions_to_create.add(current_month)
-        partitions_to_create.add(next_month)
+        """
+        )
+        result = await self.db.execute(
+            partition_check_sql,
+            {"schema": SCHEMA_NAME, "table_name": TABLE_NAME},
+        )
+        return bool(result.scalar())
 
-        for partition_month in partitions_to_create:
-            if not re.match(r"^\d{4}_\d{2}$", partition_month):
+    async def ensure_partitions(self, partition_months: set[str]) -> set[str]:
+        valid_months = set()
+        for partition_month in partition_months - Partition._known_partitions:
+            if PARTITION_MONTH_RE.match(partition_month):
+                valid_months.add(partition_month)
+            else:
                 logger.warning(
                     f"Skipping invalid partition format: {partition_month}"
                 )
-                continue
 
-            try:
-                table_name = f"{TABLE_PREFIX}{partition_month}"
-
-                partition_exists_sql = text(
-                    """
-                    SELECT EXISTS (
-                        SELECT 1 FROM pg_tables
-                        WHERE schemaname = :schema_name
-                          AND tablename = :table_name
-                    )
-                """
+        if not valid_months:
+            return set()
+
+        # Serialize creation so coroutines in this process do not race on
+        # the same DDL; the known set is re-checked once the lock is held.
+        async with Partition._create_lock():
+            valid_months -= Partition._known_partitions
+            if not valid_months:
+                return set()
+            return await self._create_missing_partitions(valid_months)
+
+    async def _create_missing_partitions(
+        self, valid_months: set[str]
+    ) -> set[str]:
+        try:
+            result = await self.db.execute(
+                PARTITIONS_EXISTING_SQL,
+                {
+                    "schema_name": SCHEMA_NAME,
+                    "table_names": [
+                        f"{TABLE_PREFIX}{month}" for month in valid_months
+                    ],
+                },
+            )
+            existing_tables = {row[0] for row in result.all()}
+            missing_months = sorted(
+                month
+                for month in valid_months
+                if f"{TABLE_PREFIX}{month}" not in existing_tables
+            )
+            Partition._known_partitions.update(
+                valid_months.difference(missing_months)
+            )
+            if not missing_months:
+                return set()
+
+            statements = []
+            for partition_month in missing_months:
+                # The month was validated by PARTITION_MONTH_RE as YYYY_MM.
+                year, month = int(partition_month[:4]), int(partition_month[5:])
+                start_date = date(year, month, 1)
+                end_date = (
+                    date(year + 1, 1, 1)
+                    if month == 12
+                    else date(year, month + 1, 1)
+                )
+                statements.append(
+                    f"CREATE TABLE IF NOT EXISTS "
+                    f"{SCHEMA_NAME}.{TABLE_PREFIX}{partition_month} "
+                    f"PARTITION OF {SCHEMA_NAME}.{TABLE_NAME} "
+                    f"FOR VALUES FROM ('{start_date.isoformat()}') "
+                    f"TO ('{end_date.isoformat()}');"
+                )
+
+            async with self.db.begin_nested():
+                await self.db.execute(
+                    text(f"DO $$ BEGIN {' '.join(statements)} END $$")
                 )
 
-                result = await self.db.execute(
-                    partition_exists_sql,
-                    {"schema_name": SCHEMA_NAME, "table_name": table_name},
+        except sqlalchemy.exc.DBAPIError as e:
+            if getattr(e.orig, "sqlstate", None) in CONCURRENT_CREATE_SQLSTATES:
+                logger.info(
+                    "Partitions created by concurrent process",
+                    partition_months=sorted(valid_months),
                 )
-                exists = result.scalar()
-
-                if not exists:
-                    async with self.db.begin():
-                        start_date = datetime.strptime(
-                            partition_month + "-01", "%Y_%m-%d"
-                        )
-                        end_date = (start_date + timedelta(days=32)).replace(
-                            day=1
-                        )
-
-                        full_partition_name = f"{SCHEMA_NAME}.{table_name}"
-                        full_table_name = f"{SCHEMA_NAME}.{TABLE_NAME}"
-
-                        partition_sql = text(
-                            f"""
-                            CREATE TABLE {full_partition_name}
-                            PARTITION OF {full_table_name}
-                            FOR VALUES FROM (:start_date)
-                            TO (:end_date)
-                        """
-                        )
-
-                        await self.db.execute(
-                            partition_sql,
-                            {
-                                "start_date": start_date.isoformat(),
-                                "end_date": end_date.isoformat(),
-                            },
-                        )
-
-                        created_partitions.add(partition_month)
-                        logger.info(
-                            "Pre-created partition", table_name=table_name
-                        )
-
-            except (sqlalchemy.exc.SQLAlchemyError, ValueError, TypeError) as e:
+            else:
                 logger.exception(
-                    "Failed to pre-create partition",
-                    partition_month=partition_month,
+                    "Failed to pre-create partitions",
+                    partition_months=sorted(valid_months),
                     error=str(e),
                 )
+            return set()
 
-        if created_partitions:
+        except (sqlalchemy.exc.SQLAlchemyError, ValueError, TypeError) as e:
+            logger.exception(
+                "Failed to pre-create partitions",
+                partition_months=sorted(valid_months),
+                error=str(e),
+            )
+            return set()
+
+        Partition._known_partitions.update(missing_months)
+        for partition_month in missing_months:
             logger.info(
-                "Pre-created partitions",
-                count=len(created_partitions),
-                partitions=sorted(created_partitions),
+                "Pre-created partition",
+                table_name=f"{TABLE_PREFIX}{partition_month}",
             )
 
-        return created_partitions
+        return set(missing_months)
@@ -12,31 +12,40 @@ IMAGE_EXTENSIONS = {
 }
 
 
+_ENTITY_MARKERS = ("&amp;", "&lt;", "&gt;", "&quot;")
+_MAX_EXTRA_DECODES = 3
+
+
+def _replace_surrogates(text: str) -> str:
+    if text.isascii():
+        return text
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return text.encode("utf-8", errors="replace").decode("utf-8")
+    return text
+
+
 def decode_html_entities(text: str) -> str:
     if not text:
         return text
 
+    if "&" not in text:
+        return _replace_surrogates(text)
+
     try:
         text = html.unescape(text)
 
-        previous_text = ""
-        max_decodes = 3
-
-        while (
-            (
-                "&amp;" in text
-                or "&lt;" in text
-                or "&gt;" in text
-                or "&quot;" in text
-            )
-            and previous_text != text
-            and max_decodes > 0
-        ):
-            previous_text = text
-            text = html.unescape(text)
-            max_decodes -= 1
+        # Feeds sometimes double- or triple-encode entities.
+        for _ in range(_MAX_EXTRA_DECODES):
+            if not any(marker in text for marker in _ENTITY_MARKERS):
+                break
+            decoded = html.unescape(text)
+            if decoded == text:
+                break
+            text = decoded
 
-        return text.encode("utf-8", errors="replace").decode("utf-8")
+        return _replace_surrogates(text)
 
     except Exception:
-        return text.encode("utf-8", errors="replace").decode("utf-8")
+        return _replace_surrogates(text)
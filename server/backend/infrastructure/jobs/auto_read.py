@@ -1,5 +1,6 @@
 from datetime import UTC, datetime, timedelta
 from typing import Any
+from uuid import UUID
 
 from structlog import get_logger
 
@@ -69,8 +70,10 @@ class AutoMarkReadJobHandler(
                 users_skipped=users_skipped,
             )
 
-        user = await self._user_repo.get_user_by_id(request.user_id)
-        if not user:
+        user_setting = await self._user_repo.find_auto_mark_as_read_setting(
+            UUID(request.user_id)
+        )
+        if not user_setting:
             return AutoMarkReadJobResponse(
                 job_id=request.job_id,
                 status="success",
@@ -80,9 +83,9 @@ class AutoMarkReadJobHandler(
                 users_skipped=0,
             )
 
-        prefs = await self._user_repo.get_user_preferences(user.id)
+        user_id, auto_mark_as_read = user_setting
 
-        if not prefs or prefs.auto_mark_as_read == "disabled":
+        if not auto_mark_as_read or auto_mark_as_read == "disabled":
             return AutoMarkReadJobResponse(
                 job_id=request.job_id,
                 status="success",
@@ -97,16 +100,16 @@ class AutoMarkReadJobHandler(
             "14_days": 14,
             "30_days": 30,
         }
-        cutoff_days = cutoff_days_map.get(prefs.auto_mark_as_read, 7)
+        cutoff_days = cutoff_days_map.get(auto_mark_as_read, 7)
         cutoff_date = now - timedelta(days=cutoff_days)
 
-        unread_articles = (
-            await self._subscription_repo.get_unread_articles_for_user(
-                user.id, cutoff_date
+        marked_count = (
+            await self._subscription_repo.mark_old_articles_as_read_for_user(
+                user_id, cutoff_date
             )
         )
 
-        if not unread_articles:
+        if not marked_count:
             return AutoMarkReadJobResponse(
                 job_id=request.job_id,
                 status="success",
@@ -116,15 +119,10 @@ class AutoMarkReadJobHandler(
                 users_skipped=1,
             )
 
-        article_ids = [ua.article_id for ua in unread_articles]
-        marked_count = await self._subscription_repo.mark_articles_as_read(
-            user.id, article_ids
-        )
-
         logger.info(
             "Single-user auto-mark as read completed",
             job_id=request.job_id,
-            user_id=str(user.id),
+            user_id=str(user_id),
             articles_marked=marked_count,
         )
 
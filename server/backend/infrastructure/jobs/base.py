@@ -16,15 +16,8 @@ class BaseJobHandler[T: BaseModel, R: BaseModel](ABC):
         pass
 
     async def handle(self, request: T, job_id: str) -> R:
-        logger.info(
-            "Job handler executing",
-            job_id=job_id,
-            handler=self.__class__.__name__,
-        )
+        log = logger.bind(job_id=job_id, handler=type(self).__name__)
+        log.info("Job handler executing")
         result = await self.execute(request)
-        logger.info(
-            "Job handler completed",
-            job_id=job_id,
-            handler=self.__class__.__name__,
-        )
+        log.info("Job handler completed")
         return result
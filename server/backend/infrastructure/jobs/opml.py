@@ -1,8 +1,13 @@
+import asyncio
+import time
+from collections import Counter, defaultdict
 from datetime import UTC, datetime
-from uuid import UUID
-from xml.etree import ElementTree as ET
+from typing import cast
+from uuid import UUID, uuid4
+from xml.sax.saxutils import escape
 
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from structlog import get_logger
 
 from backend.core.database import AsyncSessionLocal
@@ -20,6 +25,7 @@ from backend.infrastructure.repositories import (
     UserFeedRepository,
 )
 from backend.infrastructure.storage.local import LocalOpmlStorage
+from backend.models import Feed, UserFeed
 from backend.schemas.feeds import DiscoveryFeedCreateRequest
 from backend.schemas.workers import (
     OpmlExportJobRequest,
@@ -27,42 +33,73 @@ from backend.schemas.workers import (
     OpmlImportJobRequest,
     OpmlImportJobResponse,
 )
+from backend.utils.url_normalizer import normalize_url
 
 logger = get_logger(__name__)
 
+# Matches the attribute escaping ElementTree applied to the export before it
+# was built as a string.
+_XML_ATTR_ENTITIES = {
+    '"': "&quot;",
+    "\n": "&#10;",
+    "\r": "&#13;",
+    "\t": "&#09;",
+}
+
+
+def _xml_attr(value: str) -> str:
+    return escape(value, _XML_ATTR_ENTITIES)
+
+
+def _feed_outline(sub: UserFeed, feed: Feed, indent: str) -> str:
+    title = _xml_attr(sub.title or feed.title or "Untitled")
+    xml_url = _xml_attr(feed.canonical_url or "")
+    return (
+        f'{indent}<outline text="{title}" title="{title}" type="rss" '
+        f'xmlUrl="{xml_url}" />\n'
+    )
+
 
 class OpmlImportJobHandler(
     BaseJobHandler[OpmlImportJobRequest, OpmlImportJobResponse]
 ):
     MAX_FOLDER_DEPTH = 9
+    PROGRESS_INTERVAL_SECONDS = 1.0
+    IMPORT_CONCURRENCY = 8
+
+    def __init__(self) -> None:
+        self._folder_cache: dict[tuple[UUID | None, str], UUID] = {}
+        self._progress_tasks: set[asyncio.Task[bool]] = set()
 
     async def execute(
         self, request: OpmlImportJobRequest
     ) -> OpmlImportJobResponse:
-        logger.info(
+        async with AsyncSessionLocal() as db:
+            return await self._import(db, request)
+
+    async def _import(
+        self, db: AsyncSession, request: OpmlImportJobRequest
+    ) -> OpmlImportJobResponse:
+        log = logger.bind(job_id=request.job_id, user_id=request.user_id)
+        log.info(
             "Starting OPML import",
-            job_id=request.job_id,
-            user_id=request.user_id,
             filename=request.filename,
             storage_key=request.storage_key,
         )
 
-        async with AsyncSessionLocal() as db:
-            from backend.models import Feed, UserFeed
+        user_id = UUID(request.user_id)
+        import_id = UUID(request.import_id)
+        default_folder_id = (
+            UUID(request.folder_id) if request.folder_id else None
+        )
 
-            stmt = (
-                select(Feed.canonical_url)
-                .join(UserFeed, UserFeed.feed_id == Feed.id)
-                .where(UserFeed.user_id == UUID(request.user_id))
-            )
-            result = await db.execute(stmt)
-            existing_urls = set(row[0] for row in result.all())
+        await self._load_folder_cache(db, user_id)
 
         storage = LocalOpmlStorage()
         try:
             content_bytes = await storage.download_file(request.storage_key)
         except FileNotFoundError as err:
-            logger.exception(
+            log.exception(
                 "OPML file not found in local storage",
                 storage_key=request.storage_key,
             )
@@ -73,12 +110,11 @@ class OpmlImportJobHandler(
         parse_result = OpmlParser.validate_and_parse(
             file_content=content_bytes,
             filename=request.filename,
-            existing_urls=existing_urls,
         )
 
         if not parse_result.is_valid:
             error_msg = "; ".join(parse_result.errors)
-            logger.error(
+            log.error(
                 "OPML validation failed",
                 errors=parse_result.errors,
             )
@@ -89,7 +125,19 @@ class OpmlImportJobHandler(
         invalid_urls = parse_result.invalid_urls
         duplicate_urls = parse_result.duplicate_urls
 
-        logger.info(
+        # Already-subscribed feeds are found with one indexed lookup over
+        # the parsed URLs instead of loading every subscription up front.
+        user_feed_repo = UserFeedRepository(db)
+        subscribed_urls = await user_feed_repo.get_subscribed_feed_urls(
+            user_id, [feed.url for feed in valid_feeds]
+        )
+        if subscribed_urls:
+            valid_feeds = [
+                feed for feed in valid_feeds if feed.url not in subscribed_urls
+            ]
+            duplicate_urls = duplicate_urls | subscribed_urls
+
+        log.info(
             "OPML parsed",
             total_feeds=total_feeds,
             valid_feeds=len(valid_feeds),
@@ -111,73 +159,151 @@ class OpmlImportJobHandler(
                 }
             )
 
-        for i, feed in enumerate(valid_feeds):
-            feed_url = feed.url
-            feed_title = feed.title
+        known_feeds = await FeedRepository(db).get_feeds_by_urls(
+            [feed.url for feed in valid_feeds]
+        )
+
+        folder_ids: list[UUID | None] = []
+        canonical_urls: list[str] = []
+        missing_urls: dict[str, str] = {}
 
+        for feed in valid_feeds:
             folder_id = await self._resolve_or_create_folder(
-                UUID(request.user_id),
+                db,
+                user_id,
                 feed.folder_path,
-                UUID(request.folder_id) if request.folder_id else None,
+                default_folder_id,
             )
 
-            logger.debug(
+            log.debug(
                 "Importing feed",
-                feed_url=feed_url,
-                feed_title=feed_title,
+                feed_url=feed.url,
+                feed_title=feed.title,
                 folder_path=feed.folder_path,
                 folder_id=str(folder_id) if folder_id else None,
             )
 
-            try:
-                status = await self._import_feed(
-                    feed_url=feed_url,
-                    feed_title=feed_title,
-                    user_id=UUID(request.user_id),
-                    import_id=UUID(request.import_id),
-                    folder_id=folder_id,
+            canonical_url = normalize_url(feed.url)
+            folder_ids.append(folder_id)
+            canonical_urls.append(canonical_url)
+            if canonical_url not in known_feeds:
+                missing_urls.setdefault(canonical_url, feed.url)
+
+        # New folders are committed before the network-bound phase so the
+        # transaction is not held open while feeds are fetched.
+        await db.commit()
+
+        # Feeds that must be fetched before they exist are created
+        # concurrently; everything else is already known.
+        waiting = Counter(url for url in canonical_urls if url in missing_urls)
+        completed = len(valid_feeds) - sum(waiting.values())
+        create_errors: dict[str, str] = {}
+        semaphore = asyncio.Semaphore(self.IMPORT_CONCURRENCY)
+        last_progress_at = time.monotonic()
+
+        # The task group cancels creations still running if the import is
+        # cancelled or times out, so none of them outlives the job.
+        async with asyncio.TaskGroup() as tg:
+            create_tasks = [
+                tg.create_task(
+                    self._bounded_create_feed(
+                        semaphore, canonical_url, feed_url
+                    )
                 )
-
-                if status == "success":
-                    imported_feeds.append(
-                        {
-                            "title": feed_title or "Unknown",
-                            "url": feed_url,
-                        }
+                for canonical_url, feed_url in missing_urls.items()
+            ]
+            for next_created in asyncio.as_completed(create_tasks):
+                canonical_url, created = await next_created
+                if isinstance(created, Exception):
+                    create_errors[canonical_url] = str(created)
+                else:
+                    known_feeds[canonical_url] = created
+                completed += waiting[canonical_url]
+
+                now = time.monotonic()
+                if (
+                    now - last_progress_at >= self.PROGRESS_INTERVAL_SECONDS
+                    and completed < len(valid_feeds)
+                ):
+                    last_progress_at = now
+                    self._send_progress_update(
+                        user_id,
+                        import_id,
+                        completed,
+                        len(valid_feeds),
+                    )
+                    log.info(
+                        "OPML import progress",
+                        progress=f"{completed}/{len(valid_feeds)}",
                     )
 
-            except Exception as e:
-                logger.error(
-                    "Failed to import feed",
-                    feed_url=feed_url,
-                    feed_title=feed_title,
-                    error=str(e),
-                    exc_info=True,
-                )
+        if valid_feeds:
+            self._send_progress_update(
+                user_id,
+                import_id,
+                len(valid_feeds),
+                len(valid_feeds),
+            )
+
+        pending: dict[UUID, tuple[Feed, str, str | None, UUID | None]] = {}
+
+        for feed, canonical_url, folder_id in zip(
+            valid_feeds, canonical_urls, folder_ids, strict=True
+        ):
+            feed_record = known_feeds.get(canonical_url)
+            if feed_record is None:
                 failed_feeds.append(
                     {
-                        "title": feed_title or "Unknown",
-                        "url": feed_url,
-                        "error": str(e),
+                        "title": feed.title or "Unknown",
+                        "url": feed.url,
+                        "error": create_errors.get(
+                            canonical_url, "Unknown error"
+                        ),
                     }
                 )
+                continue
 
-            if (i + 1) % 10 == 0 or i == len(valid_feeds) - 1:
-                await self._send_progress_update(
-                    UUID(request.user_id),
-                    UUID(request.import_id),
-                    i + 1,
-                    len(valid_feeds),
-                )
-                logger.info(
-                    "OPML import progress",
-                    job_id=request.job_id,
-                    progress=f"{i + 1}/{len(valid_feeds)}",
+            pending.setdefault(
+                feed_record.id,
+                (feed_record, feed.url, feed.title, folder_id),
+            )
+
+        subscriptions = [
+            (feed_record, feed_url, folder_id)
+            for feed_record, feed_url, _, folder_id in pending.values()
+        ]
+        try:
+            # A savepoint keeps the session usable for the final status
+            # update if the batch write fails.
+            async with db.begin_nested():
+                subscribed_ids = await self._subscribe_feeds(
+                    db, user_id, import_id, subscriptions
                 )
+        except Exception as e:
+            log.error(
+                "Failed to save imported subscriptions",
+                feed_count=len(pending),
+                error=str(e),
+                exc_info=True,
+            )
+            subscribed_ids = set()
+            failed_feeds.extend(
+                {
+                    "title": feed_title or "Unknown",
+                    "url": feed_url,
+                    "error": str(e),
+                }
+                for _, feed_url, feed_title, _ in pending.values()
+            )
 
-        logger.info(
+        imported_feeds.extend(
+            {"title": feed_title or "Unknown", "url": feed_url}
+            for feed_record, feed_url, feed_title, _ in pending.values()
+            if feed_record.id in subscribed_ids
+        )
+
+        log.info(
             "OPML import completed",
-            job_id=request.job_id,
             total_feeds=total_feeds,
             imported_feeds=len(imported_feeds),
             failed_feeds=len(failed_feeds),
@@ -188,26 +314,28 @@ class OpmlImportJobHandler(
             "completed" if len(failed_feeds) == 0 else "completed_with_errors"
         )
 
-        async with AsyncSessionLocal() as db:
-            from backend.infrastructure.repositories.opml import OpmlRepository
+        from backend.infrastructure.repositories.opml import OpmlRepository
 
-            repo = OpmlRepository(db)
-            await repo.update_import_status(
-                import_id=UUID(request.import_id),
-                status=status,
-                total_feeds=total_feeds,
-                imported_feeds=len(imported_feeds),
-                failed_feeds=len(failed_feeds),
-                duplicate_feeds=duplicate_count,
-                failed_feeds_log=failed_feeds,
-            )
-            opml_import = await repo.get_import_by_id(UUID(request.import_id))
-            if opml_import:
-                opml_import.completed_at = datetime.now(UTC)
-            await db.commit()
+        repo = OpmlRepository(db)
+        await repo.update_import_status(
+            import_id=import_id,
+            status=status,
+            total_feeds=total_feeds,
+            imported_feeds=len(imported_feeds),
+            failed_feeds=len(failed_feeds),
+            duplicate_feeds=duplicate_count,
+            failed_feeds_log=failed_feeds,
+        )
+        opml_import = await repo.get_import_by_id(import_id)
+        if opml_import:
+            opml_import.completed_at = datetime.now(UTC)
+        await db.commit()
+
+        if self._progress_tasks:
+            await asyncio.gather(*self._progress_tasks)
 
         await publish_notification(
-            user_id=UUID(request.user_id),
+            user_id=user_id,
             event_type="opml_import_complete",
             data={
                 "import_id": str(request.import_id),
@@ -230,76 +358,87 @@ class OpmlImportJobHandler(
             duplicate_feeds=duplicate_count,
         )
 
-    async def _import_feed(
-        self,
-        feed_url: str,
-        feed_title: str | None,
-        user_id: UUID,
-        import_id: UUID,
-        folder_id: UUID | None,
-    ) -> str:
-        logger.info(
-            "Importing feed",
-            feed_url=feed_url,
-            folder_id=str(folder_id) if folder_id else None,
-        )
+    async def _create_feed(self, feed_url: str) -> Feed:
+        logger.info("Creating feed for import", feed_url=feed_url)
 
         async with AsyncSessionLocal() as db:
-            feed_repo = FeedRepository(db)
-            user_feed_repo = UserFeedRepository(db)
             feed_processor = FeedProcessor(db)
+            feed = await feed_processor.create_feed(
+                DiscoveryFeedCreateRequest(url=feed_url, title=None)
+            )
+            await db.commit()
+            return cast(Feed, feed)
 
-            feed = await feed_repo.get_feed_by_url(feed_url)
-
-            if not feed:
-                feed_request = DiscoveryFeedCreateRequest(
-                    url=feed_url, title=None
+    async def _bounded_create_feed(
+        self,
+        semaphore: asyncio.Semaphore,
+        canonical_url: str,
+        feed_url: str,
+    ) -> tuple[str, Feed | Exception]:
+        async with semaphore:
+            try:
+                return canonical_url, await self._create_feed(feed_url)
+            except Exception as e:
+                logger.error(
+                    "Failed to import feed",
+                    feed_url=feed_url,
+                    error=str(e),
+                    exc_info=True,
                 )
-                feed = await feed_processor.create_feed(feed_request)
-
-            from backend.models.user_feed import UserFeed
+                return canonical_url, e
 
-            existing_sub = await db.execute(
-                select(UserFeed).where(
-                    UserFeed.user_id == user_id,
-                    UserFeed.feed_id == feed.id,
-                )
-            )
-            existing = existing_sub.scalar_one_or_none()
+    async def _subscribe_feeds(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        import_id: UUID,
+        feeds: list[tuple[Feed, str, UUID | None]],
+    ) -> set[UUID]:
+        if not feeds:
+            return set()
+
+        user_feed_repo = UserFeedRepository(db)
+        subscribed_ids = await user_feed_repo.upsert_import_subscriptions(
+            user_id,
+            import_id,
+            [
+                (feed.id, feed.title or feed_url, folder_id)
+                for feed, feed_url, folder_id in feeds
+            ],
+        )
 
-            if existing:
-                existing.import_id = import_id
-                existing.folder_id = folder_id
-                await db.commit()
-                return "exists"
+        from backend.application.feed.feed import FeedApplication
 
-            subscription = await user_feed_repo.create_user_feed(
-                user_id=user_id,
-                feed_id=feed.id,
-                title=feed.title or feed_url,
-                folder_id=folder_id,
+        feed_app = FeedApplication(db)
+        for feed, _, _ in feeds:
+            if feed.id not in subscribed_ids or not feed.latest_articles:
+                continue
+            await user_feed_repo.bulk_upsert_user_article_states(
+                user_id,
+                feed.latest_articles,
+            )
+            await feed_app._backfill_tags_for_articles(
+                user_id, feed.latest_articles
             )
 
-            if feed.latest_articles:
-                await user_feed_repo.bulk_upsert_user_article_states(
-                    user_id,
-                    feed.latest_articles,
-                )
-
-                from backend.application.feed.feed import FeedApplication
-
-                feed_app = FeedApplication(db)
-                await feed_app._backfill_tags_for_articles(
-                    user_id, feed.latest_articles
-                )
+        return subscribed_ids
 
-            subscription.import_id = import_id
-            await db.commit()
+    async def _load_folder_cache(self, db: AsyncSession, user_id: UUID) -> None:
+        from backend.models.user_folder import UserFolder
 
-            return "success"
+        result = await db.execute(
+            select(UserFolder.id, UserFolder.parent_id, UserFolder.name).where(
+                UserFolder.user_id == user_id
+            )
+        )
+        self._folder_cache = {
+            (parent_id, name): folder_id
+            for folder_id, parent_id, name in result.all()
+        }
 
     async def _resolve_or_create_folder(
         self,
+        db: AsyncSession,
         user_id: UUID,
         folder_path: list[str],
         default_parent_id: UUID | None,
@@ -307,56 +446,64 @@ class OpmlImportJobHandler(
         if not folder_path:
             return default_parent_id
 
-        async with AsyncSessionLocal() as db:
-            from backend.models.user_folder import UserFolder
+        from backend.models.user_folder import UserFolder
 
-            current_parent_id = default_parent_id
+        current_parent_id = default_parent_id
+        new_folders: list[UserFolder] = []
+        pending: dict[tuple[UUID | None, str], UUID] = {}
 
-            for folder_name in folder_path:
-                stmt = select(UserFolder).where(
-                    UserFolder.user_id == user_id,
-                    UserFolder.parent_id == current_parent_id,
-                    UserFolder.name == folder_name[:16],
-                )
-                result = await db.execute(stmt)
-                folder = result.scalar_one_or_none()
+        for folder_name in folder_path:
+            key = (current_parent_id, folder_name[:16])
+            folder_id = self._folder_cache.get(key) or pending.get(key)
 
-                if not folder:
-                    folder = UserFolder(
+            if folder_id is None:
+                # Ids are assigned up front so deeper segments can reference
+                # their parent before anything is flushed.
+                folder_id = uuid4()
+                new_folders.append(
+                    UserFolder(
+                        id=folder_id,
                         user_id=user_id,
-                        name=folder_name[:16],
+                        name=key[1],
                         parent_id=current_parent_id,
                     )
-                    db.add(folder)
-                    await db.flush()
-                    await db.refresh(folder)
+                )
+                pending[key] = folder_id
 
-                current_parent_id = folder.id
+            current_parent_id = folder_id
 
-            await db.commit()
-            return current_parent_id
+        if new_folders:
+            db.add_all(new_folders)
+            await db.flush()
+            self._folder_cache.update(pending)
 
-    async def _send_progress_update(
+        return current_parent_id
+
+    def _send_progress_update(
         self,
         user_id: UUID,
         import_id: UUID,
         current: int,
         total: int,
     ) -> None:
-        from backend.infrastructure.notifications.notifications import (
-            publish_notification,
-        )
-
-        await publish_notification(
-            user_id=user_id,
-            event_type="opml_import_progress",
-            data={
-                "import_id": str(import_id),
-                "current": current,
-                "total": total,
-                "percentage": int((current / total) * 100) if total > 0 else 0,
-            },
+        # Progress is advisory, so it is published in the background rather
+        # than holding up the import; _import drains these before finishing.
+        task = asyncio.create_task(
+            publish_notification(
+                user_id=user_id,
+                event_type="opml_import_progress",
+                data={
+                    "import_id": str(import_id),
+                    "current": current,
+                    "total": total,
+                    "percentage": int((current / total) * 100)
+                    if total > 0
+                    else 0,
+                },
+            )
         )
+        self._progress_tasks.add(task)
+        task.add_done_callback(self._progress_tasks.discard)
 
 
 class OpmlExportJobHandler(
@@ -382,21 +529,25 @@ class OpmlExportJobHandler(
 
         try:
             async with AsyncSessionLocal() as db:
-                from backend.models import Feed, User, UserFeed
+                from backend.models import User
                 from backend.models.user_folder import UserFolder
 
+                user_id = UUID(request.user_id)
                 user_result = await db.execute(
-                    select(User).where(User.id == UUID(request.user_id))
+                    select(User.first_name, User.username).where(
+                        User.id == user_id
+                    )
                 )
-                user = user_result.scalar_one_or_none()
+                user = user_result.one_or_none()
 
                 if not user:
                     raise ValueError("User not found")
 
                 stmt = (
-                    select(UserFeed, Feed)
+                    select(UserFeed, Feed, UserFolder.name)
                     .join(Feed, UserFeed.feed_id == Feed.id)
-                    .where(UserFeed.user_id == user.id)
+                    .outerjoin(UserFolder, UserFeed.folder_id == UserFolder.id)
+                    .where(UserFeed.user_id == user_id)
                 )
 
                 if request.folder_id:
@@ -409,81 +560,55 @@ class OpmlExportJobHandler(
 
                 total_feeds = len(subscriptions)
 
-                opml = ET.Element("opml", version="2.0")
-
-                head = ET.SubElement(opml, "head")
-                title = ET.SubElement(head, "title")
-                title.text = (
+                opml_title = (
                     f"{user.first_name or user.username}'s Glanced Reader Feeds"
                 )
-
-                date_created = ET.SubElement(head, "dateCreated")
-                date_created.text = datetime.now(UTC).isoformat()
-
-                body = ET.SubElement(opml, "body")
-
-                folders: dict[UUID | None, list[tuple[UserFeed, Feed]]] = {}
+                parts = [
+                    '<opml version="2.0">\n',
+                    "    <head>\n",
+                    f"        <title>{escape(opml_title)}</title>\n",
+                    "        <dateCreated>"
+                    f"{datetime.now(UTC).isoformat()}</dateCreated>\n",
+                    "    </head>\n",
+                ]
+
+                folders: defaultdict[UUID, list[tuple[UserFeed, Feed]]] = (
+                    defaultdict(list)
+                )
+                folder_names: dict[UUID, str] = {}
                 root_feeds: list[tuple[UserFeed, Feed]] = []
 
-                for sub, feed in subscriptions:
+                for sub, feed, folder_name in subscriptions:
                     if sub.folder_id:
-                        if sub.folder_id not in folders:
-                            folders[sub.folder_id] = []
                         folders[sub.folder_id].append((sub, feed))
+                        folder_names[sub.folder_id] = (
+                            folder_name or f"Folder {sub.folder_id}"
+                        )
                     else:
                         root_feeds.append((sub, feed))
 
+                if not subscriptions:
+                    parts.append("    <body />\n")
+                else:
+                    parts.append("    <body>\n")
+
                 for sub, feed in root_feeds:
-                    ET.SubElement(
-                        body,
-                        "outline",
-                        attrib={
-                            "text": sub.title or feed.title or "Untitled",
-                            "title": sub.title or feed.title or "Untitled",
-                            "type": "rss",
-                            "xmlUrl": feed.canonical_url or "",
-                        },
-                    )
+                    parts.append(_feed_outline(sub, feed, "        "))
 
-                if folders:
-                    folder_ids = list(folders.keys())
-                    folder_result = await db.execute(
-                        select(UserFolder).where(UserFolder.id.in_(folder_ids))
+                for folder_id, subs_feeds in folders.items():
+                    folder_name = _xml_attr(folder_names[folder_id])
+                    parts.append(
+                        f'        <outline text="{folder_name}" '
+                        f'title="{folder_name}">\n'
                     )
-                    folder_names = {
-                        f.id: f.name for f in folder_result.scalars()
-                    }
+                    for sub, feed in subs_feeds:
+                        parts.append(_feed_outline(sub, feed, "            "))
+                    parts.append("        </outline>\n")
 
-                    for folder_id, subs_feeds in folders.items():
-                        folder_name = (
-                            folder_names.get(folder_id, f"Folder {folder_id}")
-                            if folder_id
-                            else "Root"
-                        )
-                        folder_outline = ET.SubElement(
-                            body,
-                            "outline",
-                            attrib={"text": folder_name, "title": folder_name},
-                        )
-
-                        for sub, feed in subs_feeds:
-                            ET.SubElement(
-                                folder_outline,
-                                "outline",
-                                attrib={
-                                    "text": sub.title
-                                    or feed.title
-                                    or "Untitled",
-                                    "title": sub.title
-                                    or feed.title
-                                    or "Untitled",
-                                    "type": "rss",
-                                    "xmlUrl": feed.canonical_url or "",
-                                },
-                            )
-
-                ET.indent(opml, space="    ")
-                opml_content = ET.tostring(opml, encoding="unicode")
+                if subscriptions:
+                    parts.append("    </body>\n")
+                parts.append("</opml>")
+                opml_content = "".join(parts)
 
             storage = LocalOpmlStorage()
             date_str = datetime.now(UTC).strftime("%Y%m%d")
@@ -523,7 +648,7 @@ class OpmlExportJobHandler(
             )
 
             await publish_notification(
-                user_id=UUID(request.user_id),
+                user_id=user_id,
                 event_type="opml_export_complete",
                 data={
                     "export_id": str(request.export_id),
@@ -1,5 +1,8 @@
 import asyncio
 import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from functools import partial
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -10,9 +13,16 @@ if TYPE_CHECKING:
     from backend.application.feed.feed import FeedApplication
 
 from backend.core.database import AsyncSessionLocal
+from backend.infrastructure.feed.processing.feed_processor import (
+    FeedProcessor,
+)
 from backend.infrastructure.jobs.base import BaseJobHandler
+from backend.infrastructure.notifications.notifications import (
+    queue_new_articles_notifications,
+)
 from backend.infrastructure.repositories import (
     FeedRepository,
+    UserFeedRepository,
 )
 from backend.schemas.workers import (
     FeedCleanupJobRequest,
@@ -57,89 +67,139 @@ class ScheduledFeedRefreshCycleHandler(
         ScheduledFeedRefreshCycleJobResponse,
     ]
 ):
+    # New-article counts are collected per user across feeds and written to
+    # Redis at most this often, plus once when the cycle ends.
+    NOTIFICATION_FLUSH_SECONDS = 10.0
+
     def __init__(self, _feed_application: "FeedApplication") -> None:
         from backend.core.app import settings
 
         self._settings = settings
+        # Caps concurrent refresh sessions at what the pool can hand out, so
+        # large batches wait here instead of inside the pool checkout.
+        self._session_slots = asyncio.Semaphore(
+            settings.database_pool_size + settings.database_max_overflow
+        )
 
     async def execute(
         self, request: ScheduledFeedRefreshCycleJobRequest
     ) -> ScheduledFeedRefreshCycleJobResponse:
         from backend.core.app import settings
-        from backend.models import Feed
 
         start_time = time.time()
         logger.info("Starting feed refresh cycle", job_id=request.job_id)
 
-        async with AsyncSessionLocal() as db:
-            query_result = await db.execute(
-                select(Feed.id)
-                .where(Feed.is_active)
-                .where(Feed.error_count < 3)
-                .order_by(Feed.id.asc())
-            )
-            feed_ids = [row[0] for row in query_result.all()]
-
-        feeds_total = len(feed_ids)
-        if feeds_total == 0:
-            return ScheduledFeedRefreshCycleJobResponse(
-                job_id=request.job_id,
-                status="success",
-                message="No feeds to refresh",
-                feeds_total=0,
-                feeds_processed=0,
-                feeds_successful=0,
-                feeds_failed=0,
-                new_articles_total=0,
-                duration_seconds=0,
-            )
-
         batch_size = settings.feed_refresh_batch_size
 
         logger.info(
             "Feed refresh cycle configured",
             job_id=request.job_id,
-            feeds_total=feeds_total,
             batch_size=batch_size,
         )
 
+        feeds_total = 0
         feeds_successful = 0
         feeds_failed = 0
         new_articles_total = 0
+        pending_notifications: defaultdict[UUID, dict[UUID, int]] = defaultdict(
+            dict
+        )
 
-        for i in range(0, feeds_total, batch_size):
-            batch = feed_ids[i : i + batch_size]
+        def record(feed_id: UUID, task: asyncio.Task[dict[str, Any]]) -> None:
+            nonlocal feeds_successful, feeds_failed, new_articles_total
 
-            tasks = [
-                self._process_feed_with_session(feed_id) for feed_id in batch
-            ]
-            batch_results: list[
-                BaseException | dict[str, Any]
-            ] = await asyncio.gather(*tasks, return_exceptions=True)
+            if task.cancelled():
+                return
 
-            for result in batch_results:
-                if isinstance(result, Exception):
-                    feeds_failed += 1
-                    logger.error("Feed refresh error", error=str(result))
-                elif isinstance(result, dict):
-                    if result.get("status") == "success":
-                        feeds_successful += 1
-                        new_articles_total += result.get("new_articles", 0)
-                    elif result.get("status") == "error":
-                        feeds_failed += 1
-                    elif result.get("status") == "skipped":
-                        feeds_successful += 1
-                    else:
-                        feeds_failed += 1
-                        logger.warning(
-                            "Unknown feed refresh result status", result=result
+            result: BaseException | dict[str, Any]
+            try:
+                result = task.result()
+            except Exception as e:
+                result = e
+
+            if isinstance(result, Exception):
+                feeds_failed += 1
+                logger.error("Feed refresh error", error=str(result))
+            elif isinstance(result, dict):
+                if result.get("status") == "success":
+                    feeds_successful += 1
+                    new_articles_total += result.get("new_articles", 0)
+                    for user_id in result.get("subscriber_ids", ()):
+                        feed_counts = pending_notifications[user_id]
+                        feed_counts[feed_id] = (
+                            feed_counts.get(feed_id, 0)
+                            + result["articles_created"]
                         )
+                elif result.get("status") == "error":
+                    feeds_failed += 1
+                elif result.get("status") == "skipped":
+                    feeds_successful += 1
                 else:
                     feeds_failed += 1
-                    logger.error(
-                        "Unexpected feed refresh result type",
-                        result=type(result).__name__,
+                    logger.warning(
+                        "Unknown feed refresh result status", result=result
                     )
+            else:
+                feeds_failed += 1
+                logger.error(
+                    "Unexpected feed refresh result type",
+                    result=type(result).__name__,
+                )
+
+        # A sliding window keeps batch_size refreshes in flight; a slow feed
+        # only holds its own slot instead of stalling a whole batch. Feed ids
+        # are pulled a page at a time as slots free up, so only the window
+        # and the current page are ever held in memory.
+        window = asyncio.Semaphore(batch_size)
+        in_flight: set[asyncio.Task[dict[str, Any]]] = set()
+        last_flush = time.monotonic()
+
+        try:
+            async for feed_id in self._iter_refreshable_feed_ids(batch_size):
+                await window.acquire()
+                feeds_total += 1
+
+                if (
+                    pending_notifications
+                    and time.monotonic() - last_flush
+                    >= self.NOTIFICATION_FLUSH_SECONDS
+                ):
+                    await self._flush_notifications(pending_notifications)
+                    last_flush = time.monotonic()
+
+                task = asyncio.create_task(
+                    self._process_feed_with_session(feed_id)
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                task.add_done_callback(lambda _: window.release())
+                task.add_done_callback(partial(record, feed_id))
+
+            if in_flight:
+                await asyncio.wait(in_flight)
+        finally:
+            # If the job is cancelled or paging fails, stop the refreshes
+            # still in flight rather than leaving them to outlive the cycle.
+            pending = list(in_flight)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        await self._flush_notifications(pending_notifications)
+
+        if feeds_total == 0:
+            return ScheduledFeedRefreshCycleJobResponse(
+                job_id=request.job_id,
+                status="success",
+                message="No feeds to refresh",
+                feeds_total=0,
+                feeds_processed=0,
+                feeds_successful=0,
+                feeds_failed=0,
+                new_articles_total=0,
+                duration_seconds=0,
+            )
 
         duration_seconds = time.time() - start_time
 
@@ -165,16 +225,57 @@ class ScheduledFeedRefreshCycleHandler(
             duration_seconds=duration_seconds,
         )
 
-    async def _process_feed_with_session(self, feed_id: UUID) -> dict[str, Any]:
-        async with AsyncSessionLocal() as db:
-            try:
-                from backend.infrastructure.feed.processing.feed_processor import (
-                    FeedProcessor,
-                )
-                from backend.infrastructure.repositories import (
-                    UserFeedRepository,
+    async def _flush_notifications(
+        self, pending_notifications: dict[UUID, dict[UUID, int]]
+    ) -> None:
+        if not pending_notifications:
+            return
+
+        feed_counts_by_user = dict(pending_notifications)
+        pending_notifications.clear()
+        try:
+            await queue_new_articles_notifications(feed_counts_by_user)
+        except Exception as e:
+            logger.exception(
+                "Failed to queue new article notifications",
+                user_count=len(feed_counts_by_user),
+                error=str(e),
+            )
+
+    async def _iter_refreshable_feed_ids(
+        self, page_size: int
+    ) -> AsyncIterator[UUID]:
+        from backend.models import Feed
+
+        # Keyset pages on short-lived sessions instead of one cursor held
+        # for the whole cycle, which would pin a pooled connection and keep
+        # a snapshot open for as long as the refreshes take.
+        last_id: UUID | None = None
+        while True:
+            query = (
+                select(Feed.id)
+                .where(Feed.is_active)
+                .where(Feed.error_count < 3)
+            )
+            if last_id is not None:
+                query = query.where(Feed.id > last_id)
+
+            async with AsyncSessionLocal() as db:
+                query_result = await db.execute(
+                    query.order_by(Feed.id.asc()).limit(page_size)
                 )
+                page = list(query_result.scalars().all())
 
+            for feed_id in page:
+                yield feed_id
+
+            if len(page) < page_size:
+                return
+            last_id = page[-1]
+
+    async def _process_feed_with_session(self, feed_id: UUID) -> dict[str, Any]:
+        async with self._session_slots, AsyncSessionLocal() as db:
+            try:
                 feed_processor = FeedProcessor(db)
                 user_feed_repo = UserFeedRepository(db)
 
@@ -186,29 +287,14 @@ class ScheduledFeedRefreshCycleHandler(
                     result.get("status") == "success"
                     and result.get("articles_created", 0) > 0
                 ):
-                    from backend.infrastructure.notifications.notifications import (
-                        queue_new_articles_notification,
-                    )
-
                     user_ids = (
                         await user_feed_repo.get_subscribed_user_ids_for_feed(
                             feed_id
                         )
                     )
 
-                    for user_id in user_ids:
-                        await queue_new_articles_notification(
-                            user_id=user_id,
-                            feed_id=feed_id,
-                            article_count=result["articles_created"],
-                        )
-
-                    logger.debug(
-                        "Queued notifications for feed subscribers",
-                        feed_id=str(feed_id),
-                        subscriber_count=len(user_ids),
-                        new_articles=result["articles_created"],
-                    )
+                    # Queued by the cycle together with other feeds' counts.
+                    result["subscriber_ids"] = user_ids
 
                 return result
 
@@ -6,6 +6,7 @@ from backend.infrastructure.notifications.notifications import (
     listen_for_timer_expirations_with_restart,
     publish_notification,
     queue_new_articles_notification,
+    queue_new_articles_notifications,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "listen_for_timer_expirations_with_restart",
     "publish_notification",
     "queue_new_articles_notification",
+    "queue_new_articles_notifications",
 ]
@@ -1,9 +1,10 @@
 import asyncio
-import json
+import functools
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, cast
 from uuid import UUID
 
+import orjson
 import structlog
 
 from backend.infrastructure.external.redis import get_redis_client
@@ -14,6 +15,27 @@ CHANNEL_PREFIX = "notifications:user:"
 PENDING_PREFIX = "notifications:pending:user:"
 TIMER_PREFIX = "notifications:timer:user:"
 DEBOUNCE_SECONDS = 60
+# How long an idle SSE stream blocks on its pubsub socket before checking
+# is_disconnect again. sse-starlette already cancels the stream when the
+# client goes away, so this only bounds how long a missed disconnect lingers.
+SSE_POLL_TIMEOUT_SECONDS = 30
+
+
+# Refresh cycles build these keys for the same subscribers over and over;
+# caching them skips UUID.__str__, which dominates the f-string cost.
+@functools.lru_cache(maxsize=4096)
+def _channel_key(user_id: UUID) -> str:
+    return f"{CHANNEL_PREFIX}{user_id}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _pending_key(user_id: UUID) -> str:
+    return f"{PENDING_PREFIX}{user_id}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _timer_key(user_id: UUID) -> str:
+    return f"{TIMER_PREFIX}{user_id}"
 
 
 async def publish_notification(
@@ -21,9 +43,9 @@ async def publish_notification(
 ) -> bool:
     try:
         redis_client = await get_redis_client()
-        channel = f"{CHANNEL_PREFIX}{user_id}"
+        channel = _channel_key(user_id)
 
-        message = json.dumps(
+        message = orjson.dumps(
             {
                 "type": event_type,
                 "data": data,
@@ -56,8 +78,8 @@ async def queue_new_articles_notification(
 ) -> None:
     redis_client = await get_redis_client()
 
-    pending_key = f"{PENDING_PREFIX}{user_id}"
-    timer_key = f"{TIMER_PREFIX}{user_id}"
+    pending_key = _pending_key(user_id)
+    timer_key = _timer_key(user_id)
 
     await cast(
         "Awaitable[int]",
@@ -74,11 +96,37 @@ async def queue_new_articles_notification(
     )
 
 
+async def queue_new_articles_notifications(
+    feed_counts_by_user: dict[UUID, dict[UUID, int]],
+    debounce_seconds: int = DEBOUNCE_SECONDS,
+) -> None:
+    if not feed_counts_by_user:
+        return
+
+    redis_client = await get_redis_client()
+
+    # One pipeline for every user, and one timer reset per user no matter
+    # how many of their feeds had new articles.
+    pipe = redis_client.pipeline(transaction=False)
+    for user_id, feed_counts in feed_counts_by_user.items():
+        pending_key = _pending_key(user_id)
+        for feed_id, article_count in feed_counts.items():
+            pipe.hincrby(pending_key, str(feed_id), article_count)
+        pipe.setex(_timer_key(user_id), debounce_seconds, "1")
+    await pipe.execute()
+
+    logger.debug(
+        "Queued debounced notifications",
+        user_count=len(feed_counts_by_user),
+        feed_user_pairs=sum(map(len, feed_counts_by_user.values())),
+    )
+
+
 async def event_stream(
     user_id: UUID, is_disconnect: Callable[[], Awaitable[bool]] | None = None
 ) -> AsyncIterator[dict[str, str]]:
     redis_client = await get_redis_client()
-    channel = f"{CHANNEL_PREFIX}{user_id}"
+    channel = _channel_key(user_id)
 
     async with redis_client.pubsub() as pubsub:
         await pubsub.subscribe(channel)
@@ -96,19 +144,21 @@ async def event_stream(
                     )
                     break
 
-                message = await pubsub.get_message(timeout=1)
+                message = await pubsub.get_message(
+                    timeout=SSE_POLL_TIMEOUT_SECONDS
+                )
 
                 if message is None:
                     continue
 
                 if message["type"] == "message":
                     try:
-                        payload = json.loads(message["data"])
+                        payload = orjson.loads(message["data"])
                         yield {
                             "event": payload["type"],
-                            "data": json.dumps(payload["data"]),
+                            "data": orjson.dumps(payload["data"]).decode(),
                         }
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         logger.warning(
                             "Invalid JSON in notification message",
                             user_id=user_id,
@@ -143,8 +193,8 @@ async def event_stream(
 async def flush_pending_notifications(user_id: UUID) -> None:
     redis_client = await get_redis_client()
 
-    pending_key = f"{PENDING_PREFIX}{user_id}"
-    timer_key = f"{TIMER_PREFIX}{user_id}"
+    pending_key = _pending_key(user_id)
+    timer_key = _timer_key(user_id)
 
     pending_data = await cast(
         "Awaitable[dict[str, str]]",
@@ -1,3 +1,3 @@
-from .html_cleaner import HTMLCleaner
+from .html_cleaner import HTMLCleaner, shutdown_html_process_pool
 
-__all__ = ["HTMLCleaner"]
+__all__ = ["HTMLCleaner", "shutdown_html_process_pool"]
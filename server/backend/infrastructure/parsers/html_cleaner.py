@@ -1,28 +1,165 @@
+import multiprocessing
+import os
 import re
-from html import unescape
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from html import escape, unescape
+from html.parser import HTMLParser
 
-import bleach
+import nh3
 from bs4 import BeautifulSoup
 
+_PRE_PLACEHOLDER_RE = re.compile(r"__PRE_PLACEHOLDER_(\d+)__")
+_UNSAFE_STYLE_RE = re.compile(
+    r'style\s*=\s*["\'][^"\']*(javascript|expression|behavior|@import)[^"\']*["\']',
+    re.IGNORECASE,
+)
+_UNSAFE_URL_RE = re.compile(
+    r'(href|src)\s*=\s*["\']\s*(javascript|data|vbscript):[^"\']*["\']',
+    re.IGNORECASE,
+)
+_INLINE_TAGS = (
+    "a",
+    "strong",
+    "b",
+    "em",
+    "i",
+    "u",
+    "s",
+    "sub",
+    "sup",
+    "code",
+    "mark",
+    "cite",
+    "q",
+    "abbr",
+    "time",
+    "small",
+)
+_INLINE_TAG_RE = re.compile(rf"(</?(?:{'|'.join(_INLINE_TAGS)})\b[^>]*>)")
+# The authority of an absolute or protocol-relative URL. Backslashes end it
+# too, since browsers read them as path separators.
+_URL_AUTHORITY_RE = re.compile(
+    r"[\x00-\x20]*(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#\\]*)"
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+_ALLOWED_URL_SCHEMES = {"http", "https", "mailto"}
+_DANGEROUS_OR_IFRAME_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "object",
+    "embed",
+    "form",
+    "input",
+    "button",
+    "iframe",
+]
+
 
 def decode_html_entities(text: str) -> str:
     return unescape(text)
 
 
-class HTMLCleaner:
-    TRUSTED_IFRAME_DOMAINS = {
-        "youtube.com",
-        "www.youtube.com",
-        "youtu.be",
-        "vimeo.com",
-        "player.vimeo.com",
-        "open.spotify.com",
-        "embed.music.apple.com",
-        "soundcloud.com",
-        "w.soundcloud.com",
-    }
+class _TextExtractor(HTMLParser):
+    _SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template"})
 
     def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(
+        self, tag: str, attrs: list[tuple[str, str | None]]
+    ) -> None:
+        if tag in self._SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def _fallback_text(html_content: str) -> str:
+    # Used when BeautifulSoup or nh3 fail; the stdlib tokenizer recovers
+    # from malformed markup and, unlike a tag-stripping regex, drops script
+    # bodies and comments instead of leaking them into the text.
+    try:
+        extractor = _TextExtractor()
+        extractor.feed(html_content)
+        extractor.close()
+    except Exception:
+        return ""
+    return _WHITESPACE_RE.sub(" ", " ".join(extractor.parts)).strip()
+
+
+_process_pool: ProcessPoolExecutor | None = None
+_process_pool_lock = threading.Lock()
+_worker_cleaner: "HTMLCleaner | None" = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # forkserver children start from a clean interpreter instead of
+            # forking a parent that has event loop and executor threads.
+            _process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_html_process_pool() -> None:
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _clean_and_textify_worker(html_content: str) -> tuple[str, str]:
+    global _worker_cleaner
+    if _worker_cleaner is None:
+        _worker_cleaner = HTMLCleaner()
+    return _worker_cleaner.clean_and_textify(html_content)
+
+
+class HTMLCleaner:
+    TRUSTED_IFRAME_DOMAINS = frozenset(
+        {
+            "youtube.com",
+            "www.youtube.com",
+            "youtu.be",
+            "vimeo.com",
+            "player.vimeo.com",
+            "open.spotify.com",
+            "embed.music.apple.com",
+            "soundcloud.com",
+            "w.soundcloud.com",
+        }
+    )
+    _TRUSTED_IFRAME_SUFFIXES = tuple(f".{d}" for d in TRUSTED_IFRAME_DOMAINS)
+
+    def __init__(self, use_process_pool: bool = False) -> None:
+        # The BeautifulSoup passes are pure-Python CPU work, so threads calling
+        # this contend for the GIL; a process pool spreads it across cores.
+        self.use_process_pool = use_process_pool
+
         self.allowed_tags = {
             "p",
             "br",
@@ -132,152 +269,144 @@ class HTMLCleaner:
             ],
         }
 
-        self.cleaner = bleach.Cleaner(
-            tags=self.allowed_tags,
-            attributes=self.allowed_attributes,
-            strip=True,
-            strip_comments=True,
-            css_sanitizer=None,
-        )
+        # nh3 wants sets, with "*" naming the attributes allowed on any tag.
+        self._nh3_attributes = {
+            tag: set(attributes)
+            for tag, attributes in self.allowed_attributes.items()
+        }
 
     def _is_trusted_iframe_domain(self, src: str) -> bool:
         if not src or not isinstance(src, str):
             return False
 
-        try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(src)
-            domain = parsed.netloc.lower()
-
-            for trusted in self.TRUSTED_IFRAME_DOMAINS:
-                if domain == trusted or domain.endswith(f".{trusted}"):
-                    return True
-
-            return False
-        except Exception:
+        match = _URL_AUTHORITY_RE.match(src)
+        if match is None:
             return False
 
+        domain = match.group(1).lower()
+        return domain in self.TRUSTED_IFRAME_DOMAINS or domain.endswith(
+            self._TRUSTED_IFRAME_SUFFIXES
+        )
+
     def clean_html(self, html_content: str) -> str:
         if not html_content:
             return ""
 
-        pre_blocks: list[str] = []
-
-        def extract_pre(match: re.Match[str]) -> str:
-            pre_blocks.append(match.group(0))
-            return f"__PRE_PLACEHOLDER_{len(pre_blocks) - 1}__"
-
-        protected_html = re.sub(
-            r"<pre[^>]*>.*?</pre>", extract_pre, html_content, flags=re.DOTALL
-        )
+        return self._sanitize(html_content)[0]
 
+    def clean_and_textify(self, html_content: str) -> tuple[str, str]:
+        if not html_content:
+            return "", ""
+
+        if self.use_process_pool:
+            pool = _get_process_pool()
+            try:
+                return pool.submit(
+                    _clean_and_textify_worker, html_content
+                ).result()
+            except BrokenProcessPool:
+                # A crashed worker takes the pool down with it; start a fresh
+                # one next time and clean this document in-process.
+                _discard_process_pool(pool)
+
+        # The search text comes from the same soup used for sanitizing, so
+        # the HTML is only parsed once.
+        cleaned, text, _ = self._sanitize(html_content, with_text=True)
+        return cleaned, text or ""
+
+    def _sanitize(
+        self,
+        html_content: str,
+        with_text: bool = False,
+        with_image: bool = False,
+    ) -> tuple[str, str | None, str | None]:
         try:
-            soup = BeautifulSoup(protected_html, "html.parser")
-
-            dangerous_tags = [
-                "script",
-                "style",
-                "noscript",
-                "object",
-                "embed",
-                "form",
-                "input",
-                "button",
-            ]
-            for tag in soup(dangerous_tags):
-                tag.decompose()
-
-            for iframe in soup.find_all("iframe"):
-                src = iframe.get("src", "")
-                if isinstance(src, str) and not self._is_trusted_iframe_domain(
-                    src
-                ):
-                    iframe.decompose()
-
-            pre_cleaned_html = str(soup)
-            sanitized_html = self.cleaner.clean(pre_cleaned_html)
-
-            sanitized_html = re.sub(
-                r'style\s*=\s*["\'][^"\']*(javascript|expression|behavior|@import)[^"\']*["\']',
-                "",
-                sanitized_html,
-                flags=re.IGNORECASE,
-            )
-
-            sanitized_html = re.sub(
-                r'(href|src)\s*=\s*["\']\s*(javascript|data|vbscript):[^"\']*["\']',
-                r'\1=""',
-                sanitized_html,
-                flags=re.IGNORECASE,
-            )
-
-            for i, block in enumerate(pre_blocks):
-                sanitized_html = sanitized_html.replace(
-                    f"__PRE_PLACEHOLDER_{i}__", block
-                )
-
-            # Now extract pre blocks again to protect them from whitespace normalization
-            pre_blocks_final: list[str] = []
-
-            def extract_pre_final(match: re.Match[str]) -> str:
-                pre_blocks_final.append(match.group(0))
-                return f"__PRE_FINAL_{len(pre_blocks_final) - 1}__"
-
-            sanitized_html = re.sub(
-                r"<pre[^>]*>.*?</pre>",
-                extract_pre_final,
-                sanitized_html,
-                flags=re.DOTALL,
-            )
-
-            sanitized_html = decode_html_entities(sanitized_html)
-
-            inline_tags = [
-                "a",
-                "strong",
-                "b",
-                "em",
-                "i",
-                "u",
-                "s",
-                "sub",
-                "sup",
-                "code",
-                "mark",
-                "cite",
-                "q",
-                "abbr",
-                "time",
-                "small",
-            ]
-            for tag_name in inline_tags:
-                sanitized_html = re.sub(
-                    rf"(<{tag_name}\b[^>]*>)", r" \1 ", sanitized_html
-                )
-                sanitized_html = re.sub(
-                    rf"(</{tag_name}>)", r" \1 ", sanitized_html
-                )
+            soup = BeautifulSoup(html_content, "html.parser")
 
-            # Normalize whitespace, but preserve pre tag placeholders
-            sanitized_html = re.sub(r"\s+", " ", sanitized_html)
+            # The lead image is taken before any tags are decomposed so it
+            # matches what a separate parse of the raw HTML would find.
+            image_url = None
+            if with_image:
+                img_tag = soup.find("img")
+                if img_tag is not None:
+                    src = img_tag.get("src")
+                    if src and isinstance(src, str):
+                        image_url = src
+
+            # One walk finds both the dangerous tags and the iframes; anything
+            # nested in an element that was already removed is skipped.
+            for tag in soup.find_all(_DANGEROUS_OR_IFRAME_TAGS):
+                if tag.decomposed:
+                    continue
+                if tag.name == "iframe":
+                    src = tag.get("src", "")
+                    if not isinstance(src, str):
+                        continue
+                    if self._is_trusted_iframe_domain(src):
+                        continue
+                tag.decompose()
 
-            # Restore pre tag content with original formatting
-            for i, block in enumerate(pre_blocks_final):
-                sanitized_html = sanitized_html.replace(
-                    f"__PRE_FINAL_{i}__", block
+            text = None
+            if with_text:
+                text = soup.get_text(separator=" ", strip=True)
+                text = decode_html_entities(text)
+                text = _WHITESPACE_RE.sub(" ", text).strip()
+
+            # Outermost <pre> blocks are lifted out of the tree and sanitized
+            # on their own, so the whitespace normalization below never sees
+            # them; they are put back in a single pass at the end.
+            pre_blocks: list[str] = []
+            for pre in soup.find_all("pre"):
+                if pre.find_parent("pre") is not None:
+                    continue
+                pre_blocks.append(self._sanitize_fragment(str(pre)))
+                pre.replace_with(f"__PRE_PLACEHOLDER_{len(pre_blocks) - 1}__")
+
+            # The sanitized markup is never entity-decoded: nh3 escapes quotes
+            # inside attribute values and "<" in text, and decoding would turn
+            # those back into live markup.
+            sanitized_html = self._sanitize_fragment(str(soup))
+
+            sanitized_html = _INLINE_TAG_RE.sub(r" \1 ", sanitized_html)
+
+            sanitized_html = _WHITESPACE_RE.sub(" ", sanitized_html)
+
+            def restore_pre(match: re.Match[str]) -> str:
+                index = int(match.group(1))
+                if index < len(pre_blocks):
+                    return pre_blocks[index]
+                return match.group(0)
+
+            if pre_blocks:
+                sanitized_html = _PRE_PLACEHOLDER_RE.sub(
+                    restore_pre, sanitized_html
                 )
 
-            return sanitized_html.strip()
+            return sanitized_html.strip(), text, image_url
 
         except Exception as e:
             import structlog
 
             logger = structlog.get_logger()
             logger.warning("Error sanitizing HTML", error=str(e))
-            text = re.sub(r"<[^>]+>", " ", html_content)
-            text = decode_html_entities(text)
-            return re.sub(r"\s+", " ", text).strip()
+            text = _fallback_text(html_content)
+            # The caller treats the first value as HTML, so the decoded text
+            # is escaped rather than handed back as markup.
+            return escape(text, quote=False), text if with_text else None, None
+
+    def _sanitize_fragment(self, html_fragment: str) -> str:
+        # nh3 is stateless and safe to share across threads. Only web and
+        # mailto URLs are kept and links are left without an injected rel.
+        sanitized_html = nh3.clean(
+            html_fragment,
+            tags=self.allowed_tags,
+            attributes=self._nh3_attributes,
+            url_schemes=_ALLOWED_URL_SCHEMES,
+            link_rel=None,
+            strip_comments=True,
+        )
+        sanitized_html = _UNSAFE_STYLE_RE.sub("", sanitized_html)
+        return _UNSAFE_URL_RE.sub(r'\1=""', sanitized_html)
 
     def html_to_text(self, html_content: str) -> str:
         if not html_content:
@@ -293,7 +422,7 @@ class HTMLCleaner:
 
             text = soup.get_text(separator=" ", strip=True)
             text = decode_html_entities(text)
-            text = re.sub(r"\s+", " ", text)
+            text = _WHITESPACE_RE.sub(" ", text)
             return text.strip()
 
         except Exception as e:
@@ -301,25 +430,11 @@ class HTMLCleaner:
 
             logger = structlog.get_logger()
             logger.warning("Error cleaning HTML to text", error=str(e))
-            text = re.sub(r"<[^>]+>", " ", html_content)
-            text = decode_html_entities(text)
-            return re.sub(r"\s+", " ", text).strip()
+            return _fallback_text(html_content)
 
     def clean_html_content(self, html_content: str) -> tuple[str, str | None]:
         if not html_content or not html_content.strip():
             return "", None
 
-        clean_text = self.clean_html(html_content)
-
-        try:
-            soup = BeautifulSoup(html_content, "html.parser")
-            img_tag = soup.find("img")
-            image_url = None
-            if img_tag:
-                src = img_tag.get("src")
-                if src and isinstance(src, str):
-                    image_url = src
-        except Exception:
-            image_url = None
-
+        clean_text, _, image_url = self._sanitize(html_content, with_image=True)
         return clean_text, image_url
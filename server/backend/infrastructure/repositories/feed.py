@@ -3,7 +3,8 @@ from typing import Any
 from uuid import UUID
 
 import structlog
-from sqlalchemy import delete, select, text
+from sqlalchemy import Boolean, delete, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.models import Feed
@@ -25,6 +26,19 @@ class FeedRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_feeds_by_urls(self, urls: list[str]) -> dict[str, Feed]:
+        normalized_urls = {normalize_url(url) for url in urls}
+        if not normalized_urls:
+            return {}
+
+        stmt = select(Feed).where(Feed.canonical_url.in_(normalized_urls))
+        result = await self.db.execute(stmt)
+        return {
+            feed.canonical_url: feed
+            for feed in result.scalars().all()
+            if feed.canonical_url
+        }
+
     async def create_feed(
         self,
         url: str,
@@ -52,6 +66,42 @@ class FeedRepository:
 
         return feed_record
 
+    async def upsert_feed(
+        self,
+        url: str,
+        title: str,
+        description: str | None,
+        feed_type: str,
+        language: str | None,
+        website: str | None,
+        has_articles: bool,
+    ) -> tuple[Feed, bool]:
+        stmt = pg_insert(Feed).values(
+            canonical_url=normalize_url(url) if url else None,
+            title=title,
+            description=description,
+            feed_type=feed_type,
+            language=language,
+            website=website,
+            last_fetched_at=datetime.now(UTC) if has_articles else None,
+        )
+        # The no-op update makes RETURNING yield the existing row when another
+        # worker created the feed first; xmax is 0 only for a fresh insert.
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[Feed.canonical_url],
+                index_where=Feed.canonical_url.isnot(None),
+                set_={"canonical_url": stmt.excluded.canonical_url},
+            )
+            .returning(
+                Feed, literal_column("xmax = 0", Boolean).label("inserted")
+            )
+            .execution_options(populate_existing=True)
+        )
+
+        row = (await self.db.execute(stmt)).one()
+        return row[0], bool(row[1])
+
     async def delete_feed(self, feed: Feed) -> None:
         await self.db.delete(feed)
 
@@ -2,7 +2,7 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select, text
+from sqlalchemy import select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.infrastructure.repositories.tag import UserTagRepository
@@ -157,6 +157,32 @@ class SubscriptionRepository:
 
         return count
 
+    async def mark_old_articles_as_read_for_user(
+        self,
+        user_id: UUID,
+        older_than: datetime,
+        read_at: datetime | None = None,
+    ) -> int:
+        if read_at is None:
+            read_at = datetime.now(UTC)
+
+        stmt = (
+            update(UserArticle)
+            .where(
+                UserArticle.user_id == user_id,
+                UserArticle.is_read.is_(False),
+                UserArticle.article_id.in_(
+                    select(Article.id).where(Article.published_at < older_than)
+                ),
+            )
+            .values(is_read=True, read_at=read_at)
+            .execution_options(synchronize_session=False)
+        )
+
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount or 0
+
     async def bulk_mark_old_articles_as_read(
         self,
         cutoff_date_7days: datetime,
@@ -77,6 +77,21 @@ class UserRepository:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def find_auto_mark_as_read_setting(
+        self, user_id: UUID
+    ) -> tuple[UUID, str | None] | None:
+        # One round-trip for both the user and their preference; the
+        # setting is None when the user has no preferences row yet.
+        query = (
+            select(User.id, UserPreferencesModel.auto_mark_as_read)
+            .outerjoin(
+                UserPreferencesModel, UserPreferencesModel.user_id == User.id
+            )
+            .where(User.id == user_id)
+        )
+        row = (await self.db.execute(query)).one_or_none()
+        return (row[0], row[1]) if row else None
+
     async def create_preferences(
         self, user: User, **fields: Any
     ) -> UserPreferencesModel:
@@ -5,7 +5,17 @@ from typing import Any, cast
 from uuid import UUID
 
 import structlog
-from sqlalchemy import and_, case, func, or_, select, text
+from sqlalchemy import (
+    Boolean,
+    and_,
+    case,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -289,6 +299,45 @@ class UserFeedRepository:
 
         return user_feed
 
+    async def upsert_import_subscriptions(
+        self,
+        user_id: UUID,
+        import_id: UUID,
+        subscriptions: list[tuple[UUID, str, UUID | None]],
+    ) -> set[UUID]:
+        """Subscribe to (feed_id, title, folder_id) rows in one statement.
+
+        Existing subscriptions are moved to the given folder and tagged with
+        the import. Returns the feed ids that were newly subscribed.
+        """
+        if not subscriptions:
+            return set()
+
+        stmt = pg_insert(UserFeed).values(
+            [
+                {
+                    "user_id": user_id,
+                    "feed_id": feed_id,
+                    "title": title,
+                    "folder_id": folder_id,
+                    "import_id": import_id,
+                }
+                for feed_id, title, folder_id in subscriptions
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserFeed.user_id, UserFeed.feed_id],
+            set_={
+                "folder_id": stmt.excluded.folder_id,
+                "import_id": stmt.excluded.import_id,
+            },
+        ).returning(
+            UserFeed.feed_id,
+            literal_column("xmax = 0", Boolean).label("inserted"),
+        )
+        result = await self.db.execute(stmt)
+        return {feed_id for feed_id, inserted in result.all() if inserted}
+
     async def update_user_feed(
         self, user_feed: UserFeed, update_data: dict[str, Any]
     ) -> UserFeed:
@@ -420,6 +469,25 @@ class UserFeedRepository:
         result = await self.db.execute(stmt)
         return [row[0] for row in result.all()]
 
+    async def get_subscribed_feed_urls(
+        self, user_id: UUID, urls: list[str]
+    ) -> set[str]:
+        if not urls:
+            return set()
+
+        stmt = (
+            select(Feed.canonical_url)
+            .join(UserFeed, UserFeed.feed_id == Feed.id)
+            .where(
+                and_(
+                    UserFeed.user_id == user_id,
+                    Feed.canonical_url.in_(urls),
+                )
+            )
+        )
+        result = await self.db.execute(stmt)
+        return {row[0] for row in result.all()}
+
     async def get_article_ids_accessible_via_other_feeds(
         self,
         user_id: UUID,
@@ -84,6 +84,11 @@ class Feed(Base):
             "feed_type",
             postgresql_where=sa_text("is_active = true"),
         ),
+        Index(
+            "idx_content_feeds_refresh",
+            "id",
+            postgresql_where=sa_text("is_active = true AND error_count < 3"),
+        ),
         {"schema": "content"},
     )
 
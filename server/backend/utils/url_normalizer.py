@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 TRACKING_PARAMS = {
@@ -23,11 +25,21 @@ TRACKING_PARAMS = {
 
 GA_PATTERNS = ("_ga", "_gid")
 
+# URLs already in normalized form: https, lowercase host without www. or a
+# port, and a path without a trailing slash, params, query or fragment.
+_CANONICAL_URL_RE = re.compile(
+    r"https://(?!www\.)[a-z0-9.\-]+(?:/|(?:/[A-Za-z0-9\-._~!$&'()*+,=:@%]+)+)"
+)
 
+
+@lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
     if not url:
         return ""
 
+    if _CANONICAL_URL_RE.fullmatch(url):
+        return url
+
     try:
         parsed = urlparse(url.strip())
         original_scheme = parsed.scheme
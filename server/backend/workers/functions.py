@@ -55,6 +55,28 @@ async def shutdown(ctx: dict[str, Any]) -> None:
     except Exception as e:
         logger.exception("Error closing Redis connection", error=str(e))
 
+    try:
+        from backend.infrastructure.feed.processing.feed_processor import (
+            FeedProcessor,
+        )
+
+        logger.info("Closing feed HTTP client...")
+        await FeedProcessor.close_http_client()
+        logger.info("Feed HTTP client closed")
+    except Exception as e:
+        logger.exception("Error closing feed HTTP client", error=str(e))
+
+    try:
+        from backend.infrastructure.parsers import shutdown_html_process_pool
+
+        logger.info("Stopping HTML sanitizer processes...")
+        shutdown_html_process_pool()
+        logger.info("HTML sanitizer processes stopped")
+    except Exception as e:
+        logger.exception(
+            "Error stopping HTML sanitizer processes", error=str(e)
+        )
+
     logger.info("Arq worker shutdown completed")
 
 
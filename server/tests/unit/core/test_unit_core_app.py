@@ -37,6 +37,12 @@ class TestSettings:
         assert "postgresql://" in s.database_url
         assert "localhost:5432" in s.database_url
 
+    def test_database_pool_defaults(self):
+        """Should size the database pool for concurrent feed processing."""
+        s = Settings()
+        assert s.database_pool_size == 10
+        assert s.database_max_overflow == 20
+
     def test_is_development_property(self):
         """Should correctly identify development mode."""
         s = Settings(environment="development")
@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from backend.core import database
@@ -155,3 +156,20 @@ class TestCheckDatabaseHealth:
         assert is_healthy is False
         assert "Database connection failed" in message
         assert "Connection lost" in message
+
+
+class TestJsonSerializer:
+    """Test the orjson-backed JSON column serializer."""
+
+    def test_serializes_to_str(self):
+        """Should return a str that round-trips through the deserializer."""
+        value = {"views": 12, "tags": ["a", "b"], "nested": {"ok": True}}
+
+        serialized = database._json_serializer(value)
+
+        assert isinstance(serialized, str)
+        assert orjson.loads(serialized) == value
+
+    def test_serializes_non_string_keys(self):
+        """Should accept non-string keys like the stdlib json module."""
+        assert database._json_serializer({1: "a"}) == '{"1":"a"}'
@@ -0,0 +1,75 @@
+"""Unit tests for logging configuration."""
+
+from datetime import UTC, datetime
+
+import orjson
+import structlog
+import structlog.testing
+
+from backend.core import logging as core_logging
+
+
+class TestOrjsonDumps:
+    """Test the orjson serializer used by the JSON log renderer."""
+
+    def test_returns_str(self):
+        """Should return text so stdlib handlers can format it."""
+        assert core_logging._orjson_dumps({"event": "x", "n": 1}) == (
+            '{"event":"x","n":1}'
+        )
+
+    def test_uses_renderer_fallback_for_unknown_types(self):
+        """Should fall back to the renderer's default for unknown objects."""
+        renderer = structlog.processors.JSONRenderer(
+            serializer=core_logging._orjson_dumps
+        )
+
+        output = renderer(
+            None,
+            "info",
+            {"event": "x", "obj": object(), "at": datetime.now(UTC)},
+        )
+
+        assert isinstance(output, str)
+        assert '"event":"x"' in output
+
+
+class TestSetupLogging:
+    """Test structlog configuration."""
+
+    def test_drops_events_below_configured_level(self, monkeypatch):
+        """Should filter events in the wrapper before any processor runs."""
+        monkeypatch.setenv("ENABLE_LOG_CLEANUP", "false")
+        previous = structlog.get_config()
+
+        try:
+            core_logging.setup_logging(log_level="WARNING", log_format="json")
+            with structlog.testing.capture_logs() as logs:
+                logger = structlog.get_logger("test")
+                logger.info("dropped")
+                logger.warning("kept")
+        finally:
+            core_logging.shutdown_logging()
+            structlog.configure(**previous)
+
+        assert [entry["event"] for entry in logs] == ["kept"]
+
+    def test_renders_on_listener_and_flushes_on_shutdown(
+        self, monkeypatch, capsys
+    ):
+        """Should render queued events as JSON once the listener drains."""
+        monkeypatch.setenv("ENABLE_LOG_CLEANUP", "false")
+        previous = structlog.get_config()
+
+        try:
+            core_logging.setup_logging(log_level="INFO", log_format="json")
+            structlog.get_logger("test").info("queued", feed_id=1)
+        finally:
+            core_logging.shutdown_logging()
+            structlog.configure(**previous)
+
+        line = capsys.readouterr().out.strip().splitlines()[-1]
+        event = orjson.loads(line)
+        assert event["event"] == "queued"
+        assert event["feed_id"] == 1
+        assert "_record" not in event
@@ -1,5 +1,6 @@
 """Unit tests for UserFeedRepository."""
 
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 from backend.infrastructure.repositories.user_feed import UserFeedRepository
@@ -247,6 +248,78 @@ class TestUserFeedRepositoryFind:
         assert subscription is None
 
 
+class TestUserFeedRepositoryImportSubscriptions:
+    """Test bulk subscription writes used by OPML import."""
+
+    async def test_returns_only_newly_subscribed_feed_ids(self):
+        """Should upsert all rows at once and report fresh inserts."""
+        new_feed_id = uuid4()
+        existing_feed_id = uuid4()
+        mock_db = MagicMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [
+            (new_feed_id, True),
+            (existing_feed_id, False),
+        ]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = UserFeedRepository(mock_db)
+        result = await repo.upsert_import_subscriptions(
+            uuid4(),
+            uuid4(),
+            [
+                (new_feed_id, "New", None),
+                (existing_feed_id, "Existing", uuid4()),
+            ],
+        )
+
+        assert result == {new_feed_id}
+        mock_db.execute.assert_called_once()
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "ON CONFLICT (user_id, feed_id) DO UPDATE" in sql
+        assert "xmax = 0" in sql
+
+    async def test_skips_query_for_empty_input(self):
+        """Should not touch the database when there is nothing to write."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+
+        repo = UserFeedRepository(mock_db)
+        result = await repo.upsert_import_subscriptions(uuid4(), uuid4(), [])
+
+        assert result == set()
+        mock_db.execute.assert_not_called()
+
+
+class TestUserFeedRepositorySubscribedUrls:
+    """Test checking which URLs a user already subscribes to."""
+
+    async def test_returns_matching_urls(self):
+        """Should return the subscribed URLs among those given."""
+        mock_db = MagicMock()
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("https://a.com/feed",)]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = UserFeedRepository(mock_db)
+        result = await repo.get_subscribed_feed_urls(
+            uuid4(), ["https://a.com/feed", "https://b.com/feed"]
+        )
+
+        assert result == {"https://a.com/feed"}
+        mock_db.execute.assert_called_once()
+
+    async def test_skips_query_for_empty_input(self):
+        """Should not query when there are no URLs to check."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+
+        repo = UserFeedRepository(mock_db)
+
+        assert await repo.get_subscribed_feed_urls(uuid4(), []) == set()
+        mock_db.execute.assert_not_called()
+
+
 class TestUserFeedRepositoryUpdate:
     """Test user feed update operations."""
 
@@ -1,6 +1,6 @@
 """Unit tests for entry content extraction."""
 
-from datetime import UTC
+from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
 from backend.infrastructure.feed.parsing.entry_content import EntryExtractor
@@ -147,6 +147,17 @@ class TestExtractAuthorFromEntry:
 
         assert result == "Author One, Author Two, Author Three"
 
+    def test_falls_through_to_creator_when_dc_creator_empty(self):
+        """Should try the next author field when dc_creator has no names."""
+        extractor = EntryExtractor()
+        entry = type(
+            "Entry", (), {"dc_creator": ["", None], "creator": "Creator"}
+        )()
+
+        result = extractor.extract_author_from_entry(entry)
+
+        assert result == "Creator"
+
     def test_returns_none_when_no_author(self):
         """Should return None when no author found."""
         extractor = EntryExtractor()
@@ -364,6 +375,26 @@ class TestExtractPublishDate:
         assert result is not None
         assert result.month == 4
 
+    def test_parses_rfc822_pub_date_to_utc(self):
+        """Should parse RFC 822 dates and convert offsets to UTC."""
+        extractor = EntryExtractor()
+        entry = type(
+            "Entry", (), {"published": "Mon, 15 Jan 2024 10:30:00 +0200"}
+        )()
+
+        result = extractor.extract_publish_date(entry)
+
+        assert result == datetime(2024, 1, 15, 8, 30, tzinfo=UTC)
+
+    def test_parses_iso_date_with_offset_to_utc(self):
+        """Should convert ISO 8601 offsets to UTC."""
+        extractor = EntryExtractor()
+        entry = type("Entry", (), {"updated": "2024-01-15T10:30:00-05:00"})()
+
+        result = extractor.extract_publish_date(entry)
+
+        assert result == datetime(2024, 1, 15, 15, 30, tzinfo=UTC)
+
     def test_returns_none_when_no_date_found(self):
         """Should return None when no date fields found."""
         extractor = EntryExtractor()
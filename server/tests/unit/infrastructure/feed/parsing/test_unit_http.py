@@ -0,0 +1,45 @@
+"""Unit tests for bounded HTTP body reads."""
+
+import httpx
+import pytest
+
+from backend.infrastructure.feed.parsing.http import (
+    ResponseTooLargeError,
+    read_bounded,
+)
+
+
+class TestReadBounded:
+    """Test reading a streamed response body with a size cap."""
+
+    @pytest.mark.asyncio
+    async def test_returns_body_within_limit(self):
+        """Should return the full body when it fits under the limit."""
+        response = httpx.Response(200, content=b"<rss></rss>")
+
+        assert await read_bounded(response, "https://example.com") == (
+            b"<rss></rss>"
+        )
+
+    @pytest.mark.asyncio
+    async def test_rejects_declared_oversized_body(self):
+        """Should fail fast when Content-Length exceeds the limit."""
+        response = httpx.Response(
+            200, headers={"Content-Length": "100"}, content=b"x" * 100
+        )
+
+        with pytest.raises(ResponseTooLargeError):
+            await read_bounded(response, "https://example.com", limit=10)
+
+    @pytest.mark.asyncio
+    async def test_rejects_streamed_oversized_body(self):
+        """Should stop reading once the streamed body passes the limit."""
+
+        async def chunks():
+            for _ in range(5):
+                yield b"x" * 8
+
+        response = httpx.Response(200, content=chunks())
+
+        with pytest.raises(ResponseTooLargeError):
+            await read_bounded(response, "https://example.com", limit=10)
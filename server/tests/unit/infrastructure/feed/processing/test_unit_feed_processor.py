@@ -1,10 +1,92 @@
 """Unit tests for feed processing infrastructure."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from backend.infrastructure.feed.parsing.content.media import MediaExtractor
+from backend.infrastructure.feed.parsing.entry_content import EntryExtractor
+from backend.infrastructure.feed.processing import feed_processor
 from backend.infrastructure.feed.processing.feed_processor import FeedProcessor
+from backend.infrastructure.parsers import HTMLCleaner
+
+
+@pytest.fixture(autouse=True)
+def fresh_helpers(monkeypatch):
+    """Give each test its own helpers so mocks set on them do not leak."""
+    monkeypatch.setattr(feed_processor, "_HTML_CLEANER", HTMLCleaner())
+    monkeypatch.setattr(feed_processor, "_MEDIA_EXTRACTOR", MediaExtractor())
+    monkeypatch.setattr(feed_processor, "_ENTRY_EXTRACTOR", EntryExtractor())
+
+
+class TestInit:
+    """Test FeedProcessor construction."""
+
+    def test_shares_parsing_helpers_between_instances(self):
+        """Should reuse the module-level helpers instead of rebuilding them."""
+        first = FeedProcessor(MagicMock())
+        second = FeedProcessor(MagicMock())
+
+        assert first.html_cleaner is second.html_cleaner
+        assert first.media_extractor is second.media_extractor
+        assert first.entry_extractor is second.entry_extractor
+
+
+class TestHttpClient:
+    """Test the shared feed HTTP client."""
+
+    @pytest.fixture(autouse=True)
+    def no_shared_client(self, monkeypatch):
+        monkeypatch.setattr(FeedProcessor, "_http_client", None)
+
+    @pytest.mark.asyncio
+    async def test_creates_client_lazily_and_reuses_it(self):
+        """Should build the client on first use and share it afterwards."""
+        assert FeedProcessor._http_client is None
+
+        client = FeedProcessor._get_http_client()
+
+        assert FeedProcessor._get_http_client() is client
+        await FeedProcessor.close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_client_after_close(self):
+        """Should close the pool on shutdown and rebuild it when reused."""
+        client = FeedProcessor._get_http_client()
+
+        await FeedProcessor.close_http_client()
+
+        assert client.is_closed
+        assert FeedProcessor._http_client is None
+        rebuilt = FeedProcessor._get_http_client()
+        assert rebuilt is not client
+        assert not rebuilt.is_closed
+        await FeedProcessor.close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_client_closed_elsewhere(self):
+        """Should not hand out a client that was closed directly."""
+        client = FeedProcessor._get_http_client()
+        await client.aclose()
+
+        rebuilt = FeedProcessor._get_http_client()
+
+        assert rebuilt is not client
+        await FeedProcessor.close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_accepts_brotli_and_zstd(self):
+        """Should advertise br and zstd when the httpx extras are installed."""
+        pytest.importorskip("brotli")
+        pytest.importorskip("zstandard")
+
+        client = FeedProcessor._get_http_client()
+
+        encodings = client.headers["Accept-Encoding"].split(", ")
+        assert "br" in encodings
+        assert "zstd" in encodings
+        await FeedProcessor.close_http_client()
 
 
 class TestExtractFeedContent:
@@ -36,8 +118,9 @@ class TestExtractFeedContent:
         processor.media_extractor.extract_metadata_from_entry = MagicMock(
             return_value={}
         )
-        processor.html_cleaner.clean_html = MagicMock(return_value="clean")
-        processor.html_cleaner.html_to_text = MagicMock(return_value="text")
+        processor.html_cleaner.clean_and_textify = MagicMock(
+            return_value=("clean", "text")
+        )
 
         result = processor.extract_feed_content(entry)
 
@@ -71,8 +154,9 @@ class TestExtractFeedContent:
         processor.entry_extractor.extract_categories_from_entry = MagicMock(
             return_value=[]
         )
-        processor.html_cleaner.clean_html = MagicMock(return_value="")
-        processor.html_cleaner.html_to_text = MagicMock(return_value="")
+        processor.html_cleaner.clean_and_textify = MagicMock(
+            return_value=("", "")
+        )
 
         result = processor.extract_feed_content(entry)
 
@@ -104,8 +188,9 @@ class TestExtractFeedContent:
         processor.media_extractor.extract_metadata_from_entry = MagicMock(
             return_value={}
         )
-        processor.html_cleaner.clean_html = MagicMock(return_value="")
-        processor.html_cleaner.html_to_text = MagicMock(return_value="")
+        processor.html_cleaner.clean_and_textify = MagicMock(
+            return_value=("", "")
+        )
 
         result = processor.extract_feed_content(entry)
 
@@ -140,8 +225,9 @@ class TestExtractFeedContent:
         processor.entry_extractor.extract_categories_from_entry = MagicMock(
             return_value=[]
         )
-        processor.html_cleaner.clean_html = MagicMock(return_value="")
-        processor.html_cleaner.html_to_text = MagicMock(return_value="")
+        processor.html_cleaner.clean_and_textify = MagicMock(
+            return_value=("", "")
+        )
 
         result = processor.extract_feed_content(entry)
 
@@ -207,7 +293,7 @@ class TestParseFeedEntries:
             return_value="summary text"
         )
 
-        result = processor._parse_feed_entries(feed)
+        result = await processor._parse_feed_entries(feed)
 
         assert len(result) == 1
         assert result[0]["title"] == "Test Entry"
@@ -219,15 +305,15 @@ class TestParseFeedEntries:
 
         feed = MagicMock()
         feed.entries = [MagicMock() for _ in range(100)]
-        for entry in feed.entries:
-            entry.get = MagicMock(return_value="Entry")
+        for i, entry in enumerate(feed.entries):
+            entry.get = MagicMock(return_value=f"Entry {i}")
 
         processor.extract_feed_content = MagicMock(
             return_value=("", "", None, None, [], "html", {})
         )
         processor.html_cleaner.html_to_text = MagicMock(return_value="summary")
 
-        result = processor._parse_feed_entries(feed)
+        result = await processor._parse_feed_entries(feed)
 
         assert len(result) == 50
 
@@ -239,7 +325,7 @@ class TestParseFeedEntries:
         feed = MagicMock()
         feed.entries = []
 
-        result = processor._parse_feed_entries(feed)
+        result = await processor._parse_feed_entries(feed)
 
         assert result == []
 
@@ -265,10 +351,101 @@ class TestParseFeedEntries:
         )
         processor.html_cleaner.html_to_text = MagicMock(return_value="")
 
-        result = processor._parse_feed_entries(feed)
+        result = await processor._parse_feed_entries(feed)
 
         assert result[0]["title"] == "Test & Article"
 
+    @pytest.mark.asyncio
+    async def test_preserves_entry_order(self):
+        """Should return articles in feed order when built concurrently."""
+        processor = FeedProcessor(MagicMock())
+
+        feed = MagicMock()
+        feed.entries = []
+        for i in range(10):
+            entry = MagicMock()
+            entry.get = MagicMock(
+                side_effect=lambda k, d=None, i=i: {
+                    "title": f"Entry {i}",
+                    "link": f"https://example.com/{i}",
+                }.get(k, d)
+            )
+            feed.entries.append(entry)
+
+        processor.extract_feed_content = MagicMock(
+            return_value=("", "", None, None, [], "html", {})
+        )
+        processor.entry_extractor.extract_publish_date = MagicMock(
+            return_value=None
+        )
+
+        result = await processor._parse_feed_entries(feed)
+
+        assert [a["url"] for a in result] == [
+            f"https://example.com/{i}" for i in range(10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_skips_entries_without_link_or_with_repeated_link(self):
+        """Should not extract entries that cannot become new articles."""
+        processor = FeedProcessor(MagicMock())
+
+        feed = MagicMock()
+        feed.entries = []
+        for link in [
+            "https://example.com/a",
+            "",
+            "https://example.com/a",
+            "https://example.com/b",
+        ]:
+            entry = MagicMock()
+            entry.get = MagicMock(
+                side_effect=lambda k, d=None, link=link: {
+                    "title": "Entry",
+                    "link": link,
+                }.get(k, d)
+            )
+            feed.entries.append(entry)
+
+        processor.extract_feed_content = MagicMock(
+            return_value=("", "", None, None, [], "html", {})
+        )
+        processor.entry_extractor.extract_publish_date = MagicMock(
+            return_value=None
+        )
+
+        result = await processor._parse_feed_entries(feed)
+
+        assert [a["url"] for a in result] == [
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert processor.extract_feed_content.call_count == 2
+
+
+class TestLatestPublishedAt:
+    """Test picking the newest article date."""
+
+    def test_returns_latest_date(self):
+        """Should return the newest published_at as a datetime."""
+        articles = [
+            {"published_at": "2024-01-02T10:00:00+00:00"},
+            {"published_at": None},
+            {"published_at": "2024-01-10T08:30:00.500000+00:00"},
+            {"published_at": "2023-12-31T23:59:59+00:00"},
+        ]
+
+        assert feed_processor._latest_published_at(articles) == datetime(
+            2024, 1, 10, 8, 30, 0, 500000, tzinfo=UTC
+        )
+
+    def test_returns_none_without_dates(self):
+        """Should return None when no article has a published date."""
+        assert (
+            feed_processor._latest_published_at([{"published_at": None}])
+            is None
+        )
+
 
 class TestGetFeedById:
     """Test get_feed_by_id method."""
@@ -0,0 +1,180 @@
+"""Unit tests for article partition management."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError, ProgrammingError
+
+from backend.infrastructure.feed.processing.partition import Partition
+
+
+@pytest.fixture(autouse=True)
+def reset_partition_cache(monkeypatch):
+    """Start each test without partitions remembered from earlier tests."""
+    monkeypatch.setattr(Partition, "_is_partitioned", None)
+    monkeypatch.setattr(Partition, "_known_partitions", set())
+
+
+class TestEnsurePartitions:
+    """Test batched partition creation."""
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_partitions_in_one_statement(self):
+        """Should create every missing partition with a single DO block."""
+        mock_db = MagicMock()
+        existing_result = MagicMock()
+        existing_result.all.return_value = [("articles_2024_01",)]
+        mock_db.execute = AsyncMock(side_effect=[existing_result, None])
+
+        partition = Partition(mock_db)
+
+        created = await partition.ensure_partitions(
+            {"2024_01", "2024_02", "2024_12"}
+        )
+
+        assert created == {"2024_02", "2024_12"}
+        assert mock_db.execute.call_count == 2
+        ddl = str(mock_db.execute.call_args.args[0])
+        assert ddl.startswith("DO $$")
+        assert "content.articles_2024_01" not in ddl
+        assert (
+            "content.articles_2024_02 PARTITION OF content.articles "
+            "FOR VALUES FROM ('2024-02-01') TO ('2024-03-01')"
+        ) in ddl
+        assert "FROM ('2024-12-01') TO ('2025-01-01')" in ddl
+
+    @pytest.mark.asyncio
+    async def test_skips_ddl_when_all_partitions_exist(self):
+        """Should only check existence when nothing is missing."""
+        mock_db = MagicMock()
+        existing_result = MagicMock()
+        existing_result.all.return_value = [("articles_2024_01",)]
+        mock_db.execute = AsyncMock(return_value=existing_result)
+
+        partition = Partition(mock_db)
+
+        assert await partition.ensure_partitions({"2024_01"}) == set()
+        assert mock_db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ignores_invalid_partition_months(self):
+        """Should not build DDL from malformed partition names."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+
+        partition = Partition(mock_db)
+
+        created = await partition.ensure_partitions({"2024_1; DROP TABLE x"})
+
+        assert created == set()
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_set_on_database_error(self):
+        """Should log and continue when partition creation fails."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(
+            side_effect=ProgrammingError("permission denied", {}, Exception())
+        )
+
+        partition = Partition(mock_db)
+
+        assert await partition.ensure_partitions({"2024_01"}) == set()
+
+    @pytest.mark.asyncio
+    async def test_treats_concurrent_creation_as_success(self):
+        """Should not report a failure when another worker won the race."""
+        mock_db = MagicMock()
+        existing_result = MagicMock()
+        existing_result.all.return_value = []
+        orig = Exception("duplicate key value violates unique constraint")
+        orig.sqlstate = "23505"
+        mock_db.execute = AsyncMock(
+            side_effect=[existing_result, IntegrityError("DO", {}, orig)]
+        )
+
+        partition = Partition(mock_db)
+
+        with patch(
+            "backend.infrastructure.feed.processing.partition.logger"
+        ) as mock_logger:
+            assert await partition.ensure_partitions({"2024_01"}) == set()
+
+        mock_logger.exception.assert_not_called()
+        mock_logger.info.assert_called_once()
+
+
+class TestPartitionCache:
+    """Test process-wide memoization of partition state."""
+
+    @pytest.mark.asyncio
+    async def test_skips_database_for_known_partitions(self):
+        """Should not query pg_tables again for partitions already seen."""
+        mock_db = MagicMock()
+        existing_result = MagicMock()
+        existing_result.all.return_value = [("articles_2024_01",)]
+        mock_db.execute = AsyncMock(side_effect=[existing_result, None])
+
+        partition = Partition(mock_db)
+
+        assert await partition.ensure_partitions({"2024_01", "2024_02"}) == {
+            "2024_02"
+        }
+        assert await partition.ensure_partitions({"2024_01", "2024_02"}) == (
+            set()
+        )
+        assert mock_db.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_remember_partitions_after_failure(self):
+        """Should check again when partition creation failed."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(
+            side_effect=ProgrammingError("permission denied", {}, Exception())
+        )
+
+        partition = Partition(mock_db)
+
+        await partition.ensure_partitions({"2024_01"})
+        await partition.ensure_partitions({"2024_01"})
+
+        assert mock_db.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_checks_partitioned_table_once(self):
+        """Should cache whether the articles table is partitioned."""
+        mock_db = MagicMock()
+        partitioned_result = MagicMock()
+        partitioned_result.scalar.return_value = False
+        mock_db.execute = AsyncMock(return_value=partitioned_result)
+
+        partition = Partition(mock_db)
+
+        assert await partition.analyze_and_create_partitions([]) == set()
+        assert await partition.analyze_and_create_partitions([]) == set()
+        assert mock_db.execute.call_count == 1
+
+    def test_lock_is_usable_from_successive_event_loops(self):
+        """Should not reuse a creation lock bound to an earlier loop."""
+
+        async def contend(months):
+            async def execute(*args, **kwargs):
+                await asyncio.sleep(0)
+                result = MagicMock()
+                result.all.return_value = [
+                    (f"articles_{month}",) for month in months
+                ]
+                return result
+
+            mock_db = MagicMock()
+            mock_db.execute = execute
+            await asyncio.gather(
+                Partition(mock_db).ensure_partitions(set(months)),
+                Partition(mock_db).ensure_partitions(set(months)),
+            )
+
+        asyncio.run(contend(["2024_01"]))
+        asyncio.run(contend(["2024_02"]))
+
+        assert Partition._known_partitions == {"2024_01", "2024_02"}
@@ -79,6 +79,11 @@ class TestDecodeHtmlEntities:
         assert isinstance(result, str)
         assert "Test" in result
 
+    def test_preserves_non_ascii_text(self):
+        """Should keep valid non-ASCII characters intact."""
+        assert decode_html_entities("Café") == "Café"
+        assert decode_html_entities("Café &amp; crème") == "Café & crème"
+
     def test_handles_already_decoded_text(self):
         """Should not error on already decoded text."""
         assert (
@@ -93,7 +93,9 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
     async def test_single_user_mode_returns_not_found(self):
         """Should return not found response when user doesn't exist."""
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=None)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=None
+        )
         mock_subscription_repo = MagicMock()
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
@@ -112,15 +114,10 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
     async def test_single_user_mode_skips_when_disabled(self):
         """Should skip when auto-mark as read is disabled for user."""
         user_id = uuid4()
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
-        mock_prefs = MagicMock()
-        mock_prefs.auto_mark_as_read = "disabled"
-
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_user_repo.get_user_preferences = AsyncMock(return_value=mock_prefs)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=(user_id, "disabled")
+        )
         mock_subscription_repo = MagicMock()
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
@@ -139,12 +136,10 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
     async def test_single_user_mode_skips_when_no_preferences(self):
         """Should skip when user preferences are not set."""
         user_id = uuid4()
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_user_repo.get_user_preferences = AsyncMock(return_value=None)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=(user_id, None)
+        )
         mock_subscription_repo = MagicMock()
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
@@ -162,18 +157,13 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
     async def test_single_user_mode_skips_when_no_unread_articles(self):
         """Should skip when there are no unread articles to mark."""
         user_id = uuid4()
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
-        mock_prefs = MagicMock()
-        mock_prefs.auto_mark_as_read = "7_days"
-
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_user_repo.get_user_preferences = AsyncMock(return_value=mock_prefs)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=(user_id, "7_days")
+        )
         mock_subscription_repo = MagicMock()
-        mock_subscription_repo.get_unread_articles_for_user = AsyncMock(
-            return_value=[]
+        mock_subscription_repo.mark_old_articles_as_read_for_user = AsyncMock(
+            return_value=0
         )
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
@@ -191,25 +181,14 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
     async def test_single_user_mode_marks_articles_as_read(self):
         """Should mark articles as read in single-user mode."""
         user_id = uuid4()
-        article_id = uuid4()
-
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
-        mock_prefs = MagicMock()
-        mock_prefs.auto_mark_as_read = "14_days"
-
-        mock_unread = MagicMock()
-        mock_unread.article_id = article_id
-
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_user_repo.get_user_preferences = AsyncMock(return_value=mock_prefs)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=(user_id, "14_days")
+        )
         mock_subscription_repo = MagicMock()
-        mock_subscription_repo.get_unread_articles_for_user = AsyncMock(
-            return_value=[mock_unread]
+        mock_subscription_repo.mark_old_articles_as_read_for_user = AsyncMock(
+            return_value=1
         )
-        mock_subscription_repo.mark_articles_as_read = AsyncMock(return_value=1)
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
         request = AutoMarkReadJobRequest(
@@ -221,25 +200,20 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
         assert result.users_processed == 1
         assert result.articles_marked_read == 1
         assert result.users_skipped == 0
-        mock_subscription_repo.mark_articles_as_read.assert_called_once()
+        mock_subscription_repo.mark_old_articles_as_read_for_user.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_single_user_mode_uses_correct_cutoff_date(self):
         """Should use correct cutoff date based on user preference."""
 
         user_id = uuid4()
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
-        mock_prefs = MagicMock()
-        mock_prefs.auto_mark_as_read = "30_days"
-
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_user_repo.get_user_preferences = AsyncMock(return_value=mock_prefs)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=(user_id, "30_days")
+        )
         mock_subscription_repo = MagicMock()
-        mock_subscription_repo.get_unread_articles_for_user = AsyncMock(
-            return_value=[]
+        mock_subscription_repo.mark_old_articles_as_read_for_user = AsyncMock(
+            return_value=0
         )
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
@@ -250,7 +224,7 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
         await handler.execute(request)
 
         call_args = (
-            mock_subscription_repo.get_unread_articles_for_user.call_args
+            mock_subscription_repo.mark_old_articles_as_read_for_user.call_args
         )
         cutoff_date = call_args.args[1]  # Second argument is cutoff_date
         now = datetime.now(UTC)
@@ -263,30 +237,14 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
     async def test_single_user_mode_handles_multiple_articles(self):
         """Should handle multiple unread articles correctly."""
         user_id = uuid4()
-        article_id_1 = uuid4()
-        article_id_2 = uuid4()
-        article_id_3 = uuid4()
-
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
-        mock_prefs = MagicMock()
-        mock_prefs.auto_mark_as_read = "7_days"
-
-        mock_unread_list = [
-            MagicMock(article_id=article_id_1),
-            MagicMock(article_id=article_id_2),
-            MagicMock(article_id=article_id_3),
-        ]
-
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_user_repo.get_user_preferences = AsyncMock(return_value=mock_prefs)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=(user_id, "7_days")
+        )
         mock_subscription_repo = MagicMock()
-        mock_subscription_repo.get_unread_articles_for_user = AsyncMock(
-            return_value=mock_unread_list
+        mock_subscription_repo.mark_old_articles_as_read_for_user = AsyncMock(
+            return_value=3
         )
-        mock_subscription_repo.mark_articles_as_read = AsyncMock(return_value=3)
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
         request = AutoMarkReadJobRequest(
@@ -296,26 +254,22 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
         result = await handler.execute(request)
 
         assert result.articles_marked_read == 3
-        mock_subscription_repo.mark_articles_as_read.assert_called_once_with(
-            user_id, [article_id_1, article_id_2, article_id_3]
+        call_args = (
+            mock_subscription_repo.mark_old_articles_as_read_for_user.call_args
         )
+        assert call_args.args[0] == user_id
 
     @pytest.mark.asyncio
     async def test_single_user_mode_defaults_to_7_days(self):
         """Should default to 7 days for invalid preference value."""
         user_id = uuid4()
-        mock_user = MagicMock()
-        mock_user.id = user_id
-
-        mock_prefs = MagicMock()
-        mock_prefs.auto_mark_as_read = "invalid_value"
-
         mock_user_repo = MagicMock()
-        mock_user_repo.get_user_by_id = AsyncMock(return_value=mock_user)
-        mock_user_repo.get_user_preferences = AsyncMock(return_value=mock_prefs)
+        mock_user_repo.find_auto_mark_as_read_setting = AsyncMock(
+            return_value=(user_id, "invalid_value")
+        )
         mock_subscription_repo = MagicMock()
-        mock_subscription_repo.get_unread_articles_for_user = AsyncMock(
-            return_value=[]
+        mock_subscription_repo.mark_old_articles_as_read_for_user = AsyncMock(
+            return_value=0
         )
 
         handler = AutoMarkReadJobHandler(mock_user_repo, mock_subscription_repo)
@@ -326,7 +280,7 @@ class TestAutoMarkReadJobHandlerSingleUserMode:
         await handler.execute(request)
 
         call_args = (
-            mock_subscription_repo.get_unread_articles_for_user.call_args
+            mock_subscription_repo.mark_old_articles_as_read_for_user.call_args
         )
         cutoff_date = call_args.args[1]
         now = datetime.now(UTC)
@@ -0,0 +1,89 @@
+"""Unit tests for the OPML import job handler."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.infrastructure.jobs.opml import OpmlImportJobHandler
+from backend.schemas.workers import OpmlImportJobRequest
+
+_OPML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<opml version="2.0">
+  <head><title>Subscriptions</title></head>
+  <body>
+    <outline type="rss" text="One" xmlUrl="https://one.example.com/feed"/>
+    <outline type="rss" text="Two" xmlUrl="https://two.example.com/feed"/>
+  </body>
+</opml>
+"""
+
+
+class TestOpmlImportJobHandler:
+    """Test OPML import job handler."""
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_import_cancels_feed_creation(self):
+        """Should not leave feed creation running after cancellation."""
+        handler = OpmlImportJobHandler()
+        handler._load_folder_cache = AsyncMock()
+        handler._resolve_or_create_folder = AsyncMock(return_value=None)
+
+        started: list[str] = []
+        cancelled: list[str] = []
+        all_started = asyncio.Event()
+
+        async def blocking_create_feed(feed_url):
+            started.append(feed_url)
+            if len(started) == 2:
+                all_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(feed_url)
+                raise
+
+        handler._create_feed = blocking_create_feed
+
+        user_feed_repo = MagicMock()
+        user_feed_repo.get_subscribed_feed_urls = AsyncMock(return_value=set())
+        feed_repo = MagicMock()
+        feed_repo.get_feeds_by_urls = AsyncMock(return_value={})
+
+        with (
+            patch(
+                "backend.infrastructure.jobs.opml.LocalOpmlStorage"
+            ) as mock_storage,
+            patch(
+                "backend.infrastructure.jobs.opml.UserFeedRepository",
+                return_value=user_feed_repo,
+            ),
+            patch(
+                "backend.infrastructure.jobs.opml.FeedRepository",
+                return_value=feed_repo,
+            ),
+        ):
+            mock_storage.return_value.download_file = AsyncMock(
+                return_value=_OPML
+            )
+
+            job = asyncio.create_task(
+                handler._import(
+                    AsyncMock(),
+                    OpmlImportJobRequest(
+                        job_id=str(uuid.uuid4()),
+                        import_id=str(uuid.uuid4()),
+                        user_id=str(uuid.uuid4()),
+                        storage_key="uploads/test.opml",
+                        filename="test.opml",
+                    ),
+                )
+            )
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            job.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await job
+
+        assert sorted(cancelled) == sorted(started)
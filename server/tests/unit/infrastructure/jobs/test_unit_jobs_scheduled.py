@@ -15,6 +15,22 @@ from backend.schemas.workers import (
 )
 
 
+def _feed_id_pages(feed_ids, page_size=10):
+    """Mock db.execute serving feed_ids as keyset pages of page_size."""
+    pages = [
+        feed_ids[i : i + page_size] for i in range(0, len(feed_ids), page_size)
+    ]
+    if len(feed_ids) % page_size == 0:
+        pages.append([])
+
+    results = []
+    for page in pages:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = page
+        results.append(result)
+    return AsyncMock(side_effect=results)
+
+
 class TestFeedCleanupHandler:
     """Test feed cleanup job handler."""
 
@@ -88,11 +104,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            # Simulate empty result
-            mock_result = MagicMock()
-            mock_result.all.return_value = []
-
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages([])
 
             request = ScheduledFeedRefreshCycleJobRequest(
                 job_id=str(uuid.uuid4())
@@ -120,10 +132,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            # Simulate query returning 10 feeds
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(fid,) for fid in feed_ids]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids, page_size=3)
 
             with patch("backend.core.app.settings") as mock_settings:
                 mock_settings.feed_refresh_batch_size = 3
@@ -161,9 +170,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(fid,) for fid in feed_ids]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids)
 
             # Mock some successes and some failures
             call_count = 0
@@ -203,9 +210,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(fid,) for fid in feed_ids]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids)
 
             # Mock some exceptions
             call_count = 0
@@ -245,9 +250,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(feed_ids[0],)]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids)
 
             handler._process_feed_with_session = AsyncMock(
                 return_value={"status": "success", "new_articles": 0}
@@ -277,9 +280,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(fid,) for fid in feed_ids]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids)
 
             handler._process_feed_with_session = AsyncMock(
                 side_effect=[
@@ -315,9 +316,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(feed_ids[0],)]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids)
 
             handler._process_feed_with_session = AsyncMock(
                 return_value={"status": "unknown_status"}
@@ -348,9 +347,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(feed_ids[0],)]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids)
 
             handler._process_feed_with_session = AsyncMock(
                 return_value="invalid"
@@ -381,9 +378,7 @@ class TestScheduledFeedRefreshCycleHandler:
             mock_db = MagicMock()
             mock_session_local.return_value.__aenter__.return_value = mock_db
 
-            mock_result = MagicMock()
-            mock_result.all.return_value = [(fid,) for fid in feed_ids]
-            mock_db.execute = AsyncMock(return_value=mock_result)
+            mock_db.execute = _feed_id_pages(feed_ids)
 
             handler._process_feed_with_session = AsyncMock(
                 side_effect=[
@@ -400,3 +395,173 @@ class TestScheduledFeedRefreshCycleHandler:
             result = await handler.execute(request)
 
             assert result.new_articles_total == 18
+
+    @pytest.mark.asyncio
+    async def test_slow_feed_does_not_stall_the_window(self):
+        """Should start the next feed as soon as any in-flight one finishes."""
+        import asyncio
+        from uuid import uuid4
+
+        mock_feed_app = MagicMock()
+        handler = ScheduledFeedRefreshCycleHandler(mock_feed_app)
+
+        feed_ids = [uuid4() for _ in range(3)]
+        third_started = asyncio.Event()
+
+        async def mock_process(feed_id):
+            if feed_id == feed_ids[0]:
+                # Only finishes once a feed outside the first window starts.
+                await asyncio.wait_for(third_started.wait(), timeout=1)
+            elif feed_id == feed_ids[2]:
+                third_started.set()
+            return {"status": "success", "new_articles": 1}
+
+        with patch(
+            "backend.infrastructure.jobs.scheduled.AsyncSessionLocal"
+        ) as mock_session_local:
+            mock_db = MagicMock()
+            mock_session_local.return_value.__aenter__.return_value = mock_db
+
+            mock_db.execute = _feed_id_pages(feed_ids, page_size=2)
+
+            with patch("backend.core.app.settings") as mock_settings:
+                mock_settings.feed_refresh_batch_size = 2
+                handler._process_feed_with_session = mock_process
+
+                result = await handler.execute(
+                    ScheduledFeedRefreshCycleJobRequest(
+                        job_id=str(uuid.uuid4())
+                    )
+                )
+
+        assert result.feeds_successful == 3
+        assert result.feeds_failed == 0
+
+    @pytest.mark.asyncio
+    async def test_groups_notifications_per_user_across_feeds(self):
+        """Should queue one grouped notification write for the cycle."""
+        from uuid import uuid4
+
+        mock_feed_app = MagicMock()
+        handler = ScheduledFeedRefreshCycleHandler(mock_feed_app)
+
+        feed_ids = [uuid4() for _ in range(3)]
+        shared_user, other_user = uuid4(), uuid4()
+        results = {
+            feed_ids[0]: {
+                "status": "success",
+                "articles_created": 2,
+                "subscriber_ids": [shared_user],
+            },
+            feed_ids[1]: {
+                "status": "success",
+                "articles_created": 5,
+                "subscriber_ids": [shared_user, other_user],
+            },
+            feed_ids[2]: {"status": "success", "articles_created": 0},
+        }
+
+        async def mock_process(feed_id):
+            return results[feed_id]
+
+        with (
+            patch(
+                "backend.infrastructure.jobs.scheduled.AsyncSessionLocal"
+            ) as mock_session_local,
+            patch(
+                "backend.infrastructure.jobs.scheduled.queue_new_articles_notifications",
+                new_callable=AsyncMock,
+            ) as mock_queue,
+        ):
+            mock_db = MagicMock()
+            mock_session_local.return_value.__aenter__.return_value = mock_db
+            mock_db.execute = _feed_id_pages(feed_ids)
+            handler._process_feed_with_session = mock_process
+
+            await handler.execute(
+                ScheduledFeedRefreshCycleJobRequest(job_id=str(uuid.uuid4()))
+            )
+
+        mock_queue.assert_awaited_once_with(
+            {
+                shared_user: {feed_ids[0]: 2, feed_ids[1]: 5},
+                other_user: {feed_ids[1]: 5},
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_cycle_cancels_in_flight_refreshes(self):
+        """Should not leave refreshes running after the job is cancelled."""
+        import asyncio
+        from uuid import uuid4
+
+        handler = ScheduledFeedRefreshCycleHandler(MagicMock())
+
+        feed_ids = [uuid4() for _ in range(2)]
+        started = asyncio.Event()
+        cancelled = []
+
+        async def mock_process(feed_id):
+            try:
+                if feed_id == feed_ids[-1]:
+                    started.set()
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(feed_id)
+                raise
+
+        with patch(
+            "backend.infrastructure.jobs.scheduled.AsyncSessionLocal"
+        ) as mock_session_local:
+            mock_db = MagicMock()
+            mock_session_local.return_value.__aenter__.return_value = mock_db
+            mock_db.execute = _feed_id_pages(feed_ids)
+            handler._process_feed_with_session = mock_process
+
+            job = asyncio.create_task(
+                handler.execute(
+                    ScheduledFeedRefreshCycleJobRequest(
+                        job_id=str(uuid.uuid4())
+                    )
+                )
+            )
+            await asyncio.wait_for(started.wait(), timeout=1)
+            job.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await job
+
+        assert sorted(cancelled) == sorted(feed_ids)
+
+    @pytest.mark.asyncio
+    async def test_paging_failure_cancels_in_flight_refreshes(self):
+        """Should cancel started refreshes when listing feeds fails."""
+        import asyncio
+        from uuid import uuid4
+
+        handler = ScheduledFeedRefreshCycleHandler(MagicMock())
+
+        feed_id = uuid4()
+        cancelled = []
+
+        async def mock_process(feed_id):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(feed_id)
+                raise
+
+        async def failing_pages(page_size):
+            yield feed_id
+            await asyncio.sleep(0)
+            raise RuntimeError("database unavailable")
+
+        handler._iter_refreshable_feed_ids = failing_pages
+        handler._process_feed_with_session = mock_process
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            await handler.execute(
+                ScheduledFeedRefreshCycleJobRequest(job_id=str(uuid.uuid4()))
+            )
+
+        assert cancelled == [feed_id]
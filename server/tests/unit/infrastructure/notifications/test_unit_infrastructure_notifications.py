@@ -16,6 +16,7 @@ from backend.infrastructure.notifications.notifications import (
     listen_for_timer_expirations_with_restart,
     publish_notification,
     queue_new_articles_notification,
+    queue_new_articles_notifications,
 )
 
 
@@ -165,6 +166,51 @@ class TestQueueNewArticlesNotification:
         assert call_args[0][1] == 120
 
 
+class TestQueueNewArticlesNotifications:
+    """Test queuing grouped notifications for many subscribers at once."""
+
+    @pytest.mark.asyncio
+    async def test_pipelines_counts_and_one_timer_per_user(self):
+        """Should write every count and reset each user's timer once."""
+        user_a, user_b = uuid4(), uuid4()
+        feed_1, feed_2 = uuid4(), uuid4()
+        mock_pipe = MagicMock()
+        mock_pipe.execute = AsyncMock()
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value = mock_pipe
+
+        with patch(
+            "backend.infrastructure.notifications.notifications.get_redis_client",
+            return_value=mock_redis,
+        ):
+            await queue_new_articles_notifications(
+                {user_a: {feed_1: 4, feed_2: 1}, user_b: {feed_1: 4}}
+            )
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args for c in mock_pipe.hincrby.call_args_list] == [
+            (f"{PENDING_PREFIX}{user_a}", str(feed_1), 4),
+            (f"{PENDING_PREFIX}{user_a}", str(feed_2), 1),
+            (f"{PENDING_PREFIX}{user_b}", str(feed_1), 4),
+        ]
+        assert [c.args for c in mock_pipe.setex.call_args_list] == [
+            (f"{TIMER_PREFIX}{user_a}", 60, "1"),
+            (f"{TIMER_PREFIX}{user_b}", 60, "1"),
+        ]
+        mock_pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_redis_without_subscribers(self):
+        """Should not touch Redis when there is nobody to notify."""
+        with patch(
+            "backend.infrastructure.notifications.notifications.get_redis_client",
+            new_callable=AsyncMock,
+        ) as mock_get_client:
+            await queue_new_articles_notifications({})
+
+        mock_get_client.assert_not_called()
+
+
 class TestFlushPendingNotifications:
     """Test flushing pending notifications."""
 
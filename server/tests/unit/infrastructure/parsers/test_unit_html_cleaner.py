@@ -1,8 +1,13 @@
 """Unit tests for HTML cleaning and sanitization utilities."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from backend.infrastructure.parsers.html_cleaner import (
     HTMLCleaner,
     decode_html_entities,
+    shutdown_html_process_pool,
 )
 
 
@@ -53,6 +58,16 @@ class TestHTMLCleanerInit:
         assert "href" in cleaner.allowed_attributes.get("a", [])
         assert "src" in cleaner.allowed_attributes.get("img", [])
 
+    def test_can_be_shared_across_threads(self):
+        """Should give the same result when one instance is used by threads."""
+        cleaner = HTMLCleaner()
+        html = '<p>Hello <a href="https://example.com">link</a></p>'
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(cleaner.clean_html, [html] * 8))
+
+        assert results == [cleaner.clean_html(html)] * 8
+
 
 class TestCleanHtml:
     """Test HTML cleaning functionality."""
@@ -94,6 +109,20 @@ class TestCleanHtml:
         assert "<iframe>" not in result
         assert "evil.com" not in result
 
+    def test_keeps_trusted_iframes_and_handles_nested_removals(self):
+        """Should drop untrusted iframes, even inside other removed tags."""
+        cleaner = HTMLCleaner()
+        html = (
+            '<iframe src="https://www.youtube.com/embed/abc"></iframe>'
+            '<form><iframe src="https://evil.com/x"></iframe>'
+            "<input><button>Go</button></form><p>After</p>"
+        )
+        result = cleaner.clean_html(html)
+        assert "youtube.com/embed/abc" in result
+        assert "evil.com" not in result
+        assert "Go" not in result
+        assert "After" in result
+
     def test_removes_form_and_input_tags(self):
         """Should remove form and input elements."""
         cleaner = HTMLCleaner()
@@ -154,6 +183,18 @@ class TestCleanHtml:
         assert "data:" not in result.lower()
         assert "alert" not in result
 
+    def test_strips_disallowed_url_schemes(self):
+        """Should drop link targets outside http, https and mailto."""
+        cleaner = HTMLCleaner()
+        html = (
+            '<a href="ftp://example.com/f">ftp</a>'
+            '<a href="mailto:me@example.com">mail</a>'
+        )
+        result = cleaner.clean_html(html)
+        assert "ftp://" not in result
+        assert "mailto:me@example.com" in result
+        assert "noopener" not in result
+
     def test_preserves_pre_block_formatting(self):
         """Should preserve formatting within pre tags."""
         cleaner = HTMLCleaner()
@@ -173,6 +214,19 @@ class TestCleanHtml:
         assert "code1" in result
         assert "code2" in result
 
+    def test_sanitizes_markup_inside_pre_blocks(self):
+        """Should sanitize pre blocks while keeping their whitespace."""
+        cleaner = HTMLCleaner()
+        html = (
+            '<pre>a  <script>alert(1)</script><b onclick="x()">b</b>\n'
+            "  c</pre><p>one   two</p>"
+        )
+        result = cleaner.clean_html(html)
+        assert "alert" not in result
+        assert "onclick" not in result
+        assert "<pre>a  <b>b</b>\n  c</pre>" in result
+        assert "one two" in result
+
     def test_normalizes_whitespace_outside_pre(self):
         """Should normalize whitespace outside pre tags."""
         cleaner = HTMLCleaner()
@@ -204,12 +258,52 @@ class TestCleanHtml:
         result = cleaner.clean_html(html)
         assert "Simple text" in result
 
-    def test_decodes_html_entities(self):
-        """Should decode HTML entities in content."""
+    def test_fallback_drops_scripts_and_escapes_text(self, monkeypatch):
+        """Should return escaped text without script bodies on failure."""
+
+        def broken_parser(*args, **kwargs):
+            raise ValueError("parser failure")
+
+        monkeypatch.setattr(
+            "backend.infrastructure.parsers.html_cleaner.BeautifulSoup",
+            broken_parser,
+        )
         cleaner = HTMLCleaner()
-        html = "<p>Hello &amp; World &lt;3</p>"
+        html = (
+            "<p>Hi &amp; bye &lt;b&gt;</p>"
+            "<script>alert(1)</script><!-- note -->"
+        )
+
+        result = cleaner.clean_html(html)
+
+        assert result == "Hi &amp; bye &lt;b&gt;"
+
+    def test_keeps_markup_significant_entities_escaped(self):
+        """Should keep &, < and > escaped in text instead of decoding them."""
+        cleaner = HTMLCleaner()
+        html = "<p>Hello &amp; World &lt;3 &rsquo;</p>"
+        result = cleaner.clean_html(html)
+        assert "Hello &amp; World &lt;3 \u2019" in result
+
+    def test_does_not_turn_encoded_tags_into_markup(self):
+        """Should leave entity-encoded tags in text as text."""
+        cleaner = HTMLCleaner()
+        html = "<p>&lt;script&gt;alert(1)&lt;/script&gt;</p>"
+        result = cleaner.clean_html(html)
+        assert "<script" not in result
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in result
+
+    def test_quotes_inside_attributes_cannot_add_attributes(self):
+        """Should keep escaped quotes inside attribute values escaped."""
+        cleaner = HTMLCleaner()
+        html = (
+            '<img alt="&quot; onerror=&quot;alert(1)" src="x.png">'
+            '<p title="a&quot;b">text</p>'
+        )
         result = cleaner.clean_html(html)
-        assert "Hello & World <3" in result
+        assert 'onerror="' not in result
+        assert 'alt="&quot; onerror=&quot;alert(1)"' in result
+        assert 'title="a&quot;b"' in result
 
     def test_handles_complex_nested_html(self):
         """Should handle complex nested HTML structures."""
@@ -305,8 +399,7 @@ class TestCleanHtml:
         result = cleaner.clean_html(html)
         assert "<p>Valid</p>" in result
         assert "<custom-tag>" not in result
-        # Invalid tag content should be stripped by bleach
-        # but the text might remain depending on configuration
+        # The tag is stripped but its text may remain
 
 
 class TestHtmlToText:
@@ -382,7 +475,7 @@ class TestHtmlToText:
         assert "Title Paragraph List item" in result
 
     def test_falls_back_on_exception(self):
-        """Should fall back to regex-based stripping on exception."""
+        """Should fall back to plain-text extraction on exception."""
         cleaner = HTMLCleaner()
         html = "<p>Simple text</p>"
         result = cleaner.html_to_text(html)
@@ -405,6 +498,48 @@ class TestHtmlToText:
         assert "https://example.com" not in result  # URL is attribute, not text
 
 
+class TestCleanAndTextify:
+    """Test combined sanitizing and text extraction."""
+
+    def test_returns_empty_strings_for_empty_input(self):
+        """Should return two empty strings for empty input."""
+        cleaner = HTMLCleaner()
+        assert cleaner.clean_and_textify("") == ("", "")
+
+    def test_matches_separate_calls(self):
+        """Should match clean_html and html_to_text on typical content."""
+        cleaner = HTMLCleaner()
+        html = (
+            "<p>Hello &amp; <strong>world</strong></p>"
+            "<script>alert(1)</script><ul><li>One</li><li>Two</li></ul>"
+        )
+
+        assert cleaner.clean_and_textify(html) == (
+            cleaner.clean_html(html),
+            cleaner.html_to_text(html),
+        )
+
+    def test_process_pool_matches_in_process_result(self):
+        """Should return the same result when sanitizing in worker processes."""
+        html = "<p>Hi <b>there</b></p><script>x()</script><pre>a  b</pre>"
+        try:
+            pooled = HTMLCleaner(use_process_pool=True).clean_and_textify(html)
+        finally:
+            shutdown_html_process_pool()
+
+        assert pooled == HTMLCleaner().clean_and_textify(html)
+
+    def test_includes_preformatted_text(self):
+        """Should include the text of pre blocks in the plain text."""
+        cleaner = HTMLCleaner()
+        html = "<p>Intro</p><pre><code>x = 1</code></pre><p>Outro</p>"
+
+        cleaned, text = cleaner.clean_and_textify(html)
+
+        assert "<pre><code>x = 1</code></pre>" in cleaned
+        assert text == "Intro x = 1 Outro"
+
+
 class TestCleanHtmlContent:
     """Test combined HTML cleaning with image extraction."""
 
@@ -489,3 +624,51 @@ class TestCleanHtmlContent:
         result = cleaner.clean_html_content(html)
         assert "src=" in result[0]
         assert "https://example.com/img.jpg" in result[0]
+
+    def test_extracts_image_inside_noscript(self):
+        """Should find the lead image even when it is later stripped."""
+        cleaner = HTMLCleaner()
+        html = '<noscript><img src="lazy.jpg"></noscript><p>Body</p>'
+        result = cleaner.clean_html_content(html)
+        assert "lazy.jpg" not in result[0]
+        assert result[1] == "lazy.jpg"
+
+    def test_matches_clean_html_output(self):
+        """Should return the same cleaned HTML as clean_html."""
+        cleaner = HTMLCleaner()
+        html = '<p>Intro</p><pre>a  b</pre><img src="x.jpg">'
+        assert cleaner.clean_html_content(html) == (
+            cleaner.clean_html(html),
+            "x.jpg",
+        )
+
+
+class TestIsTrustedIframeDomain:
+    """Test the iframe embed allow-list check."""
+
+    @pytest.mark.parametrize(
+        "src",
+        [
+            "https://www.youtube.com/embed/abc",
+            "//player.vimeo.com/video/1",
+            "https://W.SoundCloud.com/player?url=x",
+            "https://m.youtube.com#t=1",
+        ],
+    )
+    def test_accepts_trusted_hosts(self, src):
+        """Should accept trusted domains and their subdomains."""
+        assert HTMLCleaner()._is_trusted_iframe_domain(src)
+
+    @pytest.mark.parametrize(
+        "src",
+        [
+            "",
+            "youtube.com/embed/abc",
+            "https://youtube.com.evil.com/",
+            "https://evil.com/?next=//youtube.com/",
+            "https://evil.com\\.youtube.com/",
+        ],
+    )
+    def test_rejects_untrusted_hosts(self, src):
+        """Should reject lookalike hosts and trusted names outside the host."""
+        assert not HTMLCleaner()._is_trusted_iframe_domain(src)
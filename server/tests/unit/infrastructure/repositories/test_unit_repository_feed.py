@@ -161,6 +161,90 @@ class TestCreateFeed:
         assert "example.com" in result.canonical_url.lower()
 
 
+class TestGetFeedsByUrls:
+    """Test looking up many feeds by URL at once."""
+
+    @pytest.mark.asyncio
+    async def test_returns_feeds_keyed_by_canonical_url(self):
+        """Should normalize the inputs and key results by canonical URL."""
+        feed = Feed(id=uuid4(), canonical_url="https://example.com/feed")
+        mock_db = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [feed]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = FeedRepository(mock_db)
+        result = await repo.get_feeds_by_urls(
+            ["https://EXAMPLE.com/feed/", "https://example.com/other"]
+        )
+
+        assert result == {feed.canonical_url: feed}
+        mock_db.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_query_for_empty_input(self):
+        """Should not query when no URLs are given."""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+
+        repo = FeedRepository(mock_db)
+
+        assert await repo.get_feeds_by_urls([]) == {}
+        mock_db.execute.assert_not_called()
+
+
+class TestUpsertFeed:
+    """Test creating feeds with a single INSERT ... ON CONFLICT."""
+
+    @pytest.mark.asyncio
+    async def test_returns_feed_and_inserted_flag(self):
+        """Should return the row and whether it was newly inserted."""
+        feed = MagicMock()
+        mock_db = MagicMock()
+        mock_result = MagicMock()
+        mock_result.one.return_value = (feed, True)
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = FeedRepository(mock_db)
+        result = await repo.upsert_feed(
+            url="https://EXAMPLE.com/feed/",
+            title="Test Feed",
+            description=None,
+            feed_type="rss",
+            language=None,
+            website=None,
+            has_articles=False,
+        )
+
+        assert result == (feed, True)
+        mock_db.execute.assert_called_once()
+        sql = str(mock_db.execute.call_args.args[0])
+        assert "ON CONFLICT (canonical_url)" in sql
+        assert "xmax = 0" in sql
+
+    @pytest.mark.asyncio
+    async def test_reports_existing_feed(self):
+        """Should report a conflicting row as not inserted."""
+        feed = MagicMock()
+        mock_db = MagicMock()
+        mock_result = MagicMock()
+        mock_result.one.return_value = (feed, False)
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        repo = FeedRepository(mock_db)
+        _, inserted = await repo.upsert_feed(
+            url="https://example.com/feed",
+            title="Test Feed",
+            description=None,
+            feed_type="rss",
+            language=None,
+            website=None,
+            has_articles=True,
+        )
+
+        assert inserted is False
+
+
 class TestDeleteFeed:
     """Test deleting feeds."""
 
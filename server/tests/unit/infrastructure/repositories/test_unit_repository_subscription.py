@@ -289,6 +289,29 @@ class TestMarkArticlesAsRead:
         assert mock_ua.read_at == read_at
 
 
+class TestMarkOldArticlesAsReadForUser:
+    """Test marking one user's old articles as read."""
+
+    @pytest.mark.asyncio
+    async def test_marks_in_single_update_and_commits(self):
+        """Should issue one UPDATE and return its row count."""
+        mock_db = MagicMock()
+        mock_result = MagicMock()
+        mock_result.rowcount = 42
+        mock_db.execute = AsyncMock(return_value=mock_result)
+        mock_db.commit = AsyncMock()
+
+        repo = SubscriptionRepository(mock_db)
+        result = await repo.mark_old_articles_as_read_for_user(
+            uuid4(), datetime.now(UTC)
+        )
+
+        assert result == 42
+        mock_db.execute.assert_called_once()
+        assert str(mock_db.execute.call_args.args[0]).startswith("UPDATE")
+        mock_db.commit.assert_called_once()
+
+
 class TestBulkMarkOldArticlesAsRead:
     """Test bulk marking old articles as read."""
 
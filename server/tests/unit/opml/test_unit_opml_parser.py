@@ -206,6 +206,42 @@ class TestParseFeedsWithFolders:
         with pytest.raises(ValueError, match="Invalid XML structure"):
             OpmlParser.parse_feeds_with_folders(content)
 
+    def test_iter_yields_feeds_lazily(self):
+        """Should yield feeds one at a time in document order."""
+        content = """<opml version="2.0">
+            <body>
+                <outline text="One" xmlUrl="https://one.com/feed.xml"/>
+                <outline text="Folder">
+                    <outline text="Two" xmlUrl="https://two.com/feed.xml"/>
+                </outline>
+            </body>
+        </opml>"""
+        feeds = OpmlParser.iter_feeds_with_folders(content)
+
+        first = next(feeds)
+        assert first.url == "https://one.com/feed.xml"
+        assert [feed.folder_path for feed in feeds] == [["Folder"]]
+
+    def test_parses_across_chunk_boundaries(self, monkeypatch):
+        """Should keep folder paths intact when input is fed in pieces."""
+        monkeypatch.setattr(OpmlParser, "PARSE_CHUNK_SIZE", 7)
+        content = """<opml version="2.0">
+            <body>
+                <outline text="News">
+                    <outline title="World">
+                        <outline text="Wire" xmlUrl="https://wire.com/rss"/>
+                    </outline>
+                    <outline text="Local" xmlUrl="https://local.com/rss"/>
+                </outline>
+            </body>
+        </opml>"""
+        feeds = OpmlParser.parse_feeds_with_folders(content)
+
+        assert [(feed.url, feed.folder_path) for feed in feeds] == [
+            ("https://wire.com/rss", ["News", "World"]),
+            ("https://local.com/rss", ["News"]),
+        ]
+
 
 class TestBuildFolderStructure:
     """Test folder structure building."""
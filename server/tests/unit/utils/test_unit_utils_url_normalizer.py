@@ -155,6 +155,27 @@ class TestNormalizeUrl:
             assert pattern not in result
             assert "id=456" in result
 
+    def test_returns_canonical_urls_unchanged(self):
+        """Should return already-normalized URLs as-is."""
+        for url in (
+            "https://example.com/",
+            "https://example.com/blog/2024/post-title",
+            "https://sub.example.com/a%20b/c.html",
+        ):
+            assert normalize_url(url) == url
+
+    def test_normalizes_near_canonical_urls(self):
+        """Should not take the fast path for URLs that need changes."""
+        assert normalize_url("https://example.com") == "https://example.com/"
+        assert (
+            normalize_url("https://example.com/a/;x")
+            == "https://example.com/a;x"
+        )
+        assert (
+            normalize_url("https://www.example.com/page")
+            == "https://example.com/page"
+        )
+
 
 class TestExtractDomain:
     """Test domain extraction function."""